@@ -1,13 +1,31 @@
 """Main Streamlit application."""
 
+import functools
+import io
 import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
 
 import pandas as pd
 import streamlit as st
 from streamlit.logger import get_logger
 
+from config import Config
+from pages import EPIC_CHARTS, PAGE_CHARTS, PAGE_METRICS
 from src.metrics.metrics_calculator import MetricsCalculator
-from src.utils.data_processor import DataProcessor
+from src.utils.column_resolver import column_resolver
+from src.utils.data_processor import (
+    CsvSource,
+    DataProcessor,
+    ProgressCallback,
+    discover_exports,
+)
+from src.utils.dataset import SharedDataset
+from src.utils.dataset_registry import DatasetLease, DatasetRegistry
+from src.utils.ingestion_cache import fingerprint_bytes, fingerprint_file
+from src.utils.prewarm import Prewarmer
+from src.utils.snapshot_store import SnapshotStore, snapshot_namespace
+from src.visualizations.figure_cache import FigureCache
 from src.visualizations.program_charts import Visualizer
 
 # Initialize logger
@@ -28,6 +46,261 @@ def setup_logger():
     return logger
 
 
+@st.cache_resource
+def get_dataset_registry() -> DatasetRegistry:
+    """Return the process-wide registry of parsed exports."""
+    return DatasetRegistry(
+        max_entries=Config.INGESTION_CACHE_MAX_ENTRIES,
+        max_bytes=Config.INGESTION_CACHE_MAX_BYTES,
+    )
+
+
+@st.cache_resource
+def get_figure_cache() -> FigureCache:
+    """Return the figure cache shared by every session."""
+    return FigureCache(max_bytes=Config.FIGURE_CACHE_MAX_BYTES, compact=True)
+
+
+@st.cache_resource
+def get_snapshot_store(namespace: str) -> SnapshotStore:
+    """Return the store of recorded snapshots of one set of projects."""
+    return SnapshotStore(Config.SNAPSHOT_DIR / namespace)
+
+
+def show_snapshot_history() -> None:
+    """Record the loaded export and compare recorded snapshots."""
+    store = st.session_state.dataset_lease.value["snapshots"]
+    with st.sidebar.expander("Snapshot history"):
+        if st.button("Record snapshot of loaded data"):
+            stats = store.record(st.session_state.data)
+            st.caption(
+                f"Recorded: {stats['added']} added, {stats['changed']} changed, "
+                f"{stats['removed']} removed"
+            )
+
+        snapshots = store.snapshots()
+        if len(snapshots) < 2:
+            st.caption("Record two snapshots to compare them")
+            return
+        taken = list(snapshots["taken"])
+        start = st.selectbox("From", taken, index=len(taken) - 2)
+        end = st.selectbox("To", taken, index=len(taken) - 1)
+        st.dataframe(store.changes(start, end), hide_index=True)
+
+
+def parse_export(
+    source: CsvSource,
+    progress_callback: Optional[ProgressCallback] = None,
+    name: Optional[str] = None,
+    fingerprint: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Parse a CSV export and build the objects derived from it.
+
+    Args:
+        source: Path or file-like object holding the CSV export
+        progress_callback: Optional callable receiving read progress
+        name: Optional name of the export, used to cache date formats
+        fingerprint: Optional content fingerprint of the export
+
+    Returns:
+        Dict holding the standardized data, calculator and visualizer
+    """
+    # Read in bounded chunks, standardizing and converting each to compact dtypes
+    data, memory_report = DataProcessor.read_compact(
+        source, Config.CSV_CHUNK_SIZE, progress_callback, name
+    )
+
+    return build_entry(data, fingerprint, memory_report=memory_report)
+
+
+def build_entry(
+    data: pd.DataFrame, fingerprint: Optional[str], **extra: Any
+) -> Dict[str, Any]:
+    """Build the registry entry for standardized data.
+
+    Args:
+        data: Standardized, schema-converted data
+        fingerprint: Optional content fingerprint of the data
+        extra: Additional values stored with the entry
+
+    Returns:
+        Dict holding the data, shared dataset, calculator and visualizer
+    """
+    # Share one copy of the data between calculator and visualizer
+    dataset = SharedDataset(data, fingerprint)
+    calculator = MetricsCalculator(dataset)
+    snapshots = get_snapshot_store(snapshot_namespace(data))
+    visualizer = Visualizer(
+        dataset, figure_cache=get_figure_cache(), snapshots=snapshots
+    )
+
+    return {
+        "dataset": dataset,
+        "snapshots": snapshots,
+        "calculator": calculator,
+        "visualizer": visualizer,
+        "prewarm": Prewarmer(
+            prewarm_tasks(data, calculator, visualizer),
+            max_workers=Config.PREWARM_WORKERS,
+        ).start(),
+        **extra,
+    }
+
+
+def prewarm_tasks(
+    data: pd.DataFrame, calculator: MetricsCalculator, visualizer: Visualizer
+) -> Dict[str, Callable[[], Any]]:
+    """Return tasks filling the caches with every page's metrics and charts.
+
+    Args:
+        data: Standardized data
+        calculator: Calculator whose memo the metrics fill
+        visualizer: Visualizer whose figure cache the charts fill
+
+    Returns:
+        Mapping of task name to callable
+    """
+    metrics = sorted({name for names in PAGE_METRICS.values() for name in names})
+    tasks: Dict[str, Callable[[], Any]] = {
+        "metrics": lambda: calculator.compute_all(metrics)
+    }
+
+    epic_col = column_resolver.find(data.columns, "Epic", "Epic Link")
+    for chart in sorted({name for names in PAGE_CHARTS.values() for name in names}):
+        if chart not in EPIC_CHARTS:
+            tasks[chart] = getattr(visualizer, chart)
+        elif epic_col:
+            tasks[chart] = functools.partial(getattr(visualizer, chart), epic_col)
+    return tasks
+
+
+def show_prewarm_progress(prewarmer: Prewarmer) -> None:
+    """Show how far the background pre-warm has got, without waiting for it.
+
+    Each rerun shows a fresh snapshot; pages render meanwhile and build
+    whatever has not been pre-warmed yet themselves.
+    """
+    if prewarmer.finished:
+        return
+    st.sidebar.progress(
+        prewarmer.progress(),
+        text=f"Preparing pages: {prewarmer.done}/{prewarmer.total}",
+    )
+
+
+def apply_delta_upload(lease: DatasetLease, delta_file: Any) -> DatasetLease:
+    """Lease the dataset produced by upserting a delta export into lease.
+
+    Sessions applying the same delta to the same base share the result.
+
+    Args:
+        lease: Lease on the base dataset
+        delta_file: Uploaded CSV of changed issues
+
+    Returns:
+        Lease on the merged dataset
+    """
+    payload = delta_file.getvalue()
+    key = fingerprint_bytes((lease.key + fingerprint_bytes(payload)).encode())
+
+    def loader() -> Dict[str, Any]:
+        processor = DataProcessor()
+        processor.data = lease.value["dataset"].view()
+        # Reuse the key index of the base instead of rebuilding it per delta
+        processor.key_index = lease.value.get("key_index")
+        if processor.key_index is None:
+            processor.key_index = lease.value["dataset"].derived(
+                "key_index", processor.build_key_index
+            )
+        stats = processor.apply_delta(io.BytesIO(payload), delta_file.name)
+        return build_entry(
+            processor.data,
+            key,
+            memory_report=lease.value["memory_report"],
+            delta_stats=stats,
+            key_index=processor.key_index,
+        )
+
+    return get_dataset_registry().acquire(
+        key, loader, sizeof=lambda entry: entry["dataset"].memory_usage()
+    )
+
+
+def load_export(
+    key: str, open_source: Callable[[], CsvSource], name: str
+) -> DatasetLease:
+    """Lease the shared dataset for an export, parsing it on first use.
+
+    Args:
+        key: Content fingerprint of the export
+        open_source: Callable returning the path or buffer to parse
+        name: Name of the export
+
+    Returns:
+        Lease on the registered dataset
+    """
+    progress = st.empty()
+
+    def loader() -> Dict[str, Any]:
+        bar = progress.progress(0.0, text="Loading data...")
+        return parse_export(
+            open_source(),
+            lambda done, rows: bar.progress(done, text=f"Loaded {rows:,} rows"),
+            name,
+            key,
+        )
+
+    lease = get_dataset_registry().acquire(
+        key, loader, sizeof=lambda entry: entry["dataset"].memory_usage()
+    )
+    progress.empty()
+    return lease
+
+
+def load_export_directory(directory: Path = Config.RAW_DATA_DIR) -> DatasetLease:
+    """Lease the combined dataset of every export in a directory.
+
+    Args:
+        directory: Directory holding one CSV export per project or quarter,
+            the raw data directory by default
+
+    Returns:
+        Lease on the registered dataset
+    """
+    key = fingerprint_bytes(
+        "".join(fingerprint_file(path) for path in discover_exports(directory)).encode()
+    )
+    progress = st.empty()
+
+    def loader() -> Dict[str, Any]:
+        bar = progress.progress(0.0, text="Loading exports...")
+        processor = DataProcessor()
+        data = processor.process_directory(
+            directory,
+            progress_callback=lambda done, rows: bar.progress(
+                done, text=f"Loaded {rows:,} rows"
+            ),
+        )
+        return build_entry(data, key, memory_report=processor.memory_report)
+
+    lease = get_dataset_registry().acquire(
+        key, loader, sizeof=lambda entry: entry["dataset"].memory_usage()
+    )
+    progress.empty()
+    return lease
+
+
+def store_lease(lease: DatasetLease, source_id: Optional[str] = None) -> None:
+    """Point the session at a leased dataset, releasing any previous one."""
+    st.session_state.dataset_lease = lease
+    st.session_state.dataset_source = source_id
+    st.session_state.delta_source = None
+    st.session_state.data = lease.value["dataset"].view()
+    st.session_state.dataset = lease.value["dataset"]
+    st.session_state.calculator = lease.value["calculator"]
+    st.session_state.visualizer = lease.value["visualizer"]
+
+
 def main() -> None:
     """Run the main Streamlit application."""
     try:
@@ -47,61 +320,97 @@ def main() -> None:
             help="Upload a CSV file containing Jira data",
         )
 
-        # Process uploaded file
-        if uploaded_file is not None:
-            try:
-                # Read CSV file
-                data = pd.read_csv(uploaded_file)
-
-                # Standardize column names - Updated mapping
-                data.columns = data.columns.str.strip()
-                column_mappings = {
-                    "Issue key": "Issue Key",
-                    "Story points": "Story Points",  # Added lowercase variation
-                    "Points": "Story Points",  # Added another common variation
-                    "StoryPoints": "Story Points",  # Added camelCase variation
-                    "story_points": "Story Points",  # Added snake_case variation
-                    "Issue_type": "Issue Type",
-                    "Epic_link": "Epic Link",
-                }
-
-                # Case-insensitive column mapping
-                current_cols = data.columns.str.lower()
-                for old_col, new_col in column_mappings.items():
-                    if old_col.lower() in current_cols:
-                        data = data.rename(
-                            columns={
-                                data.columns[current_cols == old_col.lower()][
-                                    0
-                                ]: new_col
-                            }
-                        )
-
-                # Store in session state
-                st.session_state.data = data
+        # Process uploaded file, or the configured export when nothing is loaded
+        try:
+            if uploaded_file is not None:
+                source_id = getattr(uploaded_file, "file_id", uploaded_file.name)
+                if st.session_state.get("dataset_source") != source_id:
+                    payload = uploaded_file.getvalue()
+                    lease = load_export(
+                        fingerprint_bytes(payload),
+                        lambda: io.BytesIO(payload),
+                        uploaded_file.name,
+                    )
+                    store_lease(lease, source_id)
+            elif st.session_state.get("data") is None:
+                path = Path(Config.JIRA_DATA_PATH)
+                if path.is_dir():
+                    store_lease(load_export_directory(path), str(path))
+                elif path.is_file():
+                    lease = load_export(fingerprint_file(path), lambda: path, str(path))
+                    store_lease(lease, str(path))
+                elif discover_exports(Config.RAW_DATA_DIR):
+                    # No single export configured: combine the raw exports
+                    store_lease(load_export_directory(), str(Config.RAW_DATA_DIR))
 
-                # Initialize calculator and visualizer
-                st.session_state.calculator = MetricsCalculator(data)
-                st.session_state.visualizer = Visualizer(data)
+            if "dataset_lease" in st.session_state:
+                delta_file = st.sidebar.file_uploader(
+                    "Apply changed issues",
+                    type=["csv"],
+                    help="Upsert a CSV of changed issues by Issue Key",
+                )
+                if delta_file is not None:
+                    delta_id = getattr(delta_file, "file_id", delta_file.name)
+                    if st.session_state.get("delta_source") != delta_id:
+                        source_id = st.session_state.dataset_source
+                        store_lease(
+                            apply_delta_upload(
+                                st.session_state.dataset_lease, delta_file
+                            ),
+                            source_id,
+                        )
+                        st.session_state.delta_source = delta_id
+                    stats = st.session_state.dataset_lease.value["delta_stats"]
+                    st.sidebar.caption(
+                        f"Delta: {stats['inserted']} inserted, "
+                        f"{stats['updated']} updated, {stats['unchanged']} unchanged"
+                    )
 
+                registry = get_dataset_registry()
+                stats = registry.stats()
+                st.sidebar.caption(
+                    f"Upload cache: {stats['hits']} hits, {stats['misses']} misses"
+                )
+                memo = st.session_state.calculator.memo_stats()
+                st.sidebar.caption(
+                    f"Metric cache: {memo['hits']} hits, {memo['misses']} misses"
+                )
+                figures = get_figure_cache().stats()
+                st.sidebar.caption(
+                    f"Figure cache: {figures['hits']} hits, {figures['misses']} misses, "
+                    f"{figures['bytes'] / 1024:.0f} KiB"
+                )
+                st.sidebar.caption(
+                    "Chart payload compacted from "
+                    f"{figures['payload_before'] / 1024:.0f} KiB to "
+                    f"{figures['payload_after'] / 1024:.0f} KiB"
+                )
+                st.sidebar.caption(
+                    "Dataset shared by "
+                    f"{registry.refcount(st.session_state.dataset_lease.key)} sessions"
+                )
+                show_snapshot_history()
+                with st.sidebar.expander("Memory saved per column"):
+                    st.dataframe(
+                        st.session_state.dataset_lease.value["memory_report"],
+                        hide_index=True,
+                    )
                 logger.info("Data loaded successfully")
 
-            except Exception as e:
-                error_msg = f"Error reading file: {str(e)}"
-                logger.error(error_msg)
-                st.error(error_msg)
-                return
+        except Exception as e:
+            error_msg = f"Error reading file: {str(e)}"
+            logger.error(error_msg)
+            st.error(error_msg)
+            return
 
         # Display metrics and charts if data is available
         if "data" in st.session_state:
             try:
                 # Validate required columns
                 required_cols = ["Issue Key", "Story Points", "Status"]
-                missing_cols = [
-                    col
-                    for col in required_cols
-                    if col not in st.session_state.data.columns
-                ]
+                missing_cols = column_resolver.missing(
+                    st.session_state.data.columns, required_cols
+                )
 
                 if missing_cols:
                     error_msg = f"Required columns missing: {', '.join(missing_cols)}"
@@ -110,7 +419,9 @@ def main() -> None:
                     return
 
                 # Calculate and display metrics
-                metrics = st.session_state.calculator.get_basic_metrics()
+                metrics = st.session_state.calculator.compute_all(PAGE_METRICS["Home"])[
+                    "basic_metrics"
+                ]
 
                 # Display metrics
                 col1, col2, col3 = st.columns(3)
@@ -136,13 +447,8 @@ def main() -> None:
                 # New visualizations with different chart types
                 st.subheader("Epic Distribution")
                 try:
-                    epic_col = next(
-                        (
-                            col
-                            for col in st.session_state.data.columns
-                            if col.lower() in ["epic", "epic link"]
-                        ),
-                        None,
+                    epic_col = column_resolver.find(
+                        st.session_state.data.columns, "Epic", "Epic Link"
                     )
                     if epic_col:
                         # Using treemap for epic distribution
@@ -173,6 +479,10 @@ def main() -> None:
                 st.error(error_msg)
                 return
 
+            # Charts of the other pages keep filling the caches meanwhile
+            if "dataset_lease" in st.session_state:
+                show_prewarm_progress(st.session_state.dataset_lease.value["prewarm"])
+
         elif "data" not in st.session_state:
             st.info("Please upload a Jira CSV file")
             return
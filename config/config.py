@@ -15,6 +15,7 @@ class Config:
     LOGS_DIR: Path = ROOT_DIR / "logs"
     ASSETS_DIR: Path = ROOT_DIR / "assets"
     DATA_DIR: Path = ROOT_DIR / "data"
+    RAW_DATA_DIR: Path = DATA_DIR / "raw"
     JIRA_DATA_PATH: str = os.getenv(
         "JIRA_DATA_PATH", str(DATA_DIR / "EFDDH-Jira-Data-All.csv")
     )
@@ -26,6 +27,11 @@ class Config:
     # Cache settings
     CACHE_TTL: int = 3600  # 1 hour
     CACHE_DIR: Path = ROOT_DIR / ".cache"
+    SNAPSHOT_DIR: Path = CACHE_DIR / "snapshots"
+    INGESTION_CACHE_MAX_ENTRIES: int = 4
+    INGESTION_CACHE_MAX_BYTES: int = 1024 * 1024 * 1024  # 1 GiB
+    FIGURE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # 64 MiB
+    PREWARM_WORKERS: int = 4
 
     # Chart defaults
     CHART_DEFAULTS: Dict[str, Any] = field(
@@ -38,6 +44,7 @@ class Config:
 
     # Data processing
     MAX_ROWS_PER_PAGE: int = 1000
+    CSV_CHUNK_SIZE: int = 50000
     SAMPLE_SIZE: int = 10000
 
     # API settings
@@ -1,10 +1,8 @@
 """Program overview page."""
 
-import pandas as pd
 import streamlit as st
 
-from src.metrics.metrics_calculator import MetricsCalculator
-from src.visualizations.program_charts import Visualizer
+from pages import PAGE_METRICS
 
 st.set_page_config(page_title="Program Overview", page_icon="📊", layout="wide")
 
@@ -13,15 +11,16 @@ def main():
     """Display program overview."""
     st.title("Program Overview")
 
-    if "data" not in st.session_state:
+    if "data" not in st.session_state or "calculator" not in st.session_state:
         st.error("Please load data from the Home page first")
         return
 
-    calculator = MetricsCalculator(st.session_state.data)
-    visualizer = Visualizer(st.session_state.data)
+    # Reuse the session's instances, which share one copy of the data
+    calculator = st.session_state.calculator
+    visualizer = st.session_state.visualizer
 
     # Display KPIs
-    metrics = calculator.get_basic_metrics()
+    metrics = calculator.compute_all(PAGE_METRICS["Program Overview"])["basic_metrics"]
 
     col1, col2, col3, col4 = st.columns(4)
     with col1:
@@ -1,14 +1,22 @@
 """Sprint metrics page."""
 
+import pandas as pd
 import streamlit as st
 from streamlit.logger import get_logger
 
+from pages import PAGE_METRICS
+
 # Initialize logger
 logger = get_logger(__name__)
 
 st.set_page_config(page_title="Sprint Metrics", page_icon="🏃", layout="wide")
 
 
+def format_days(value: float) -> str:
+    """Format a duration in days, or n/a when unavailable."""
+    return f"{value:.1f} days" if pd.notna(value) else "n/a"
+
+
 def main():
     """Display sprint metrics."""
     try:
@@ -18,8 +26,9 @@ def main():
             st.error("Please load data from the Home page first")
             return
 
-        # Get sprint metrics
-        metrics = st.session_state.calculator.get_sprint_metrics()
+        # Get sprint and flow metrics in one planned pass
+        bundle = st.session_state.calculator.compute_all(PAGE_METRICS["Sprint Metrics"])
+        metrics = bundle["sprint_metrics"]
 
         # Display sprint KPIs
         col1, col2 = st.columns(2)
@@ -37,6 +46,38 @@ def main():
             st.session_state.visualizer.create_sprint_burndown(),
             use_container_width=True,
         )
+
+        # Prefer recorded status transitions over ones derived from dates
+        version = st.session_state.visualizer.snapshot_version()
+        if version is not None:
+            st.caption("Cumulative flow built from recorded snapshots")
+        st.plotly_chart(
+            st.session_state.visualizer.create_cumulative_flow(
+                snapshot_version=version
+            ),
+            use_container_width=True,
+        )
+
+        # Display flow metrics
+        st.subheader("Flow Metrics")
+        flow = bundle["flow_metrics"]
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Lead Time P50", format_days(flow["lead_time_p50"]))
+        with col2:
+            st.metric("Lead Time P85", format_days(flow["lead_time_p85"]))
+        with col3:
+            st.metric("Weekly Throughput", f"{flow['weekly_throughput']:.1f}")
+        with col4:
+            st.metric("Work in Progress", flow["wip_count"])
+
+        throughput = bundle["throughput"]
+        if not throughput.empty:
+            st.bar_chart(throughput)
+        st.dataframe(
+            bundle["flow_by_sprint"].round(1),
+            use_container_width=True,
+        )
     except Exception as e:
         error_msg = f"Error processing sprint metrics: {str(e)}"
         logger.error(error_msg)
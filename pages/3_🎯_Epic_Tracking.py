@@ -3,6 +3,9 @@
 import streamlit as st
 from streamlit.logger import get_logger
 
+from pages import PAGE_METRICS
+from src.utils.column_resolver import column_resolver
+
 # Initialize logger
 logger = get_logger(__name__)
 
@@ -22,19 +25,18 @@ def main():
         calculator = st.session_state.calculator
 
         # Check for Epic column
-        epic_column = next(
-            (col for col in data.columns if col.lower() in ["epic", "epic link"]), None
-        )
+        epic_column = column_resolver.find(data.columns, "Epic", "Epic Link")
         if not epic_column:
             st.error(
                 "Epic data not found. Please ensure your data includes an Epic or Epic Link column."
             )
             return
 
-        # Get epic metrics
+        # Get epic metrics in one planned pass
+        bundle = calculator.compute_all(PAGE_METRICS["Epic Tracking"])
         metrics = {
-            "total_epics": len(data[epic_column].unique()),
-            "avg_completion": calculator.get_basic_metrics()["completion_rate"],
+            "total_epics": bundle["epic_count"],
+            "avg_completion": bundle["basic_metrics"]["completion_rate"],
         }
 
         # Display epic KPIs
@@ -54,6 +56,27 @@ def main():
             use_container_width=True,
         )
 
+        # Display points and completion rolled up each epic's issue tree
+        st.subheader("Epic Rollup")
+        st.dataframe(
+            bundle["epic_rollup"].style.format(
+                {
+                    "Story Points": "{:.0f}",
+                    "Done Points": "{:.0f}",
+                    "Completion": "{:.0%}",
+                }
+            ),
+            use_container_width=True,
+        )
+
+        # Display Monte Carlo delivery forecast
+        st.subheader("Delivery Forecast (sprints to completion)")
+        forecast = bundle["epic_forecast"]
+        if forecast.empty or forecast.isna().all().all():
+            st.info("Forecast needs at least one sprint with completed work")
+        else:
+            st.dataframe(forecast, use_container_width=True)
+
     except Exception as e:
         error_msg = f"Error in epic tracking: {str(e)}"
         logger.error(error_msg)
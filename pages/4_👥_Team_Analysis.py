@@ -3,6 +3,8 @@
 import streamlit as st
 from streamlit.logger import get_logger
 
+from pages import PAGE_METRICS
+
 # Initialize logger
 logger = get_logger(__name__)
 
@@ -19,14 +21,12 @@ def main():
             return
 
         # Calculate team metrics
-        data = st.session_state.data
-        calculator = st.session_state.calculator
-        basic_metrics = calculator.get_basic_metrics()
+        bundle = st.session_state.calculator.compute_all(PAGE_METRICS["Team Analysis"])
 
         metrics = {
-            "active_members": len(data["Assignee"].unique()),
-            "avg_points": basic_metrics["total_stories"]
-            / len(data["Assignee"].unique()),
+            "active_members": bundle["team_size"],
+            "avg_points": bundle["basic_metrics"]["total_stories"]
+            / bundle["team_size"],
         }
 
         # Display team KPIs
@@ -44,6 +44,22 @@ def main():
             st.session_state.visualizer.create_team_velocity(), use_container_width=True
         )
 
+        # Display flow metrics per team member
+        st.subheader("Flow by Team Member")
+        flow = bundle["flow_metrics"]
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Items in Progress", flow["wip_count"])
+        with col2:
+            st.metric(
+                "WIP Age P85",
+                f"{flow['wip_age_p85']:.1f} days" if flow["wip_count"] else "n/a",
+            )
+        st.dataframe(
+            bundle["flow_by_assignee"].round(1),
+            use_container_width=True,
+        )
+
     except Exception as e:
         error_msg = f"Error in team analysis: {str(e)}"
         logger.error(error_msg)
@@ -3,6 +3,9 @@
 import streamlit as st
 from streamlit.logger import get_logger
 
+from pages import PAGE_METRICS
+from src.utils.column_resolver import column_resolver
+
 # Initialize logger
 logger = get_logger(__name__)
 
@@ -19,7 +22,9 @@ def main() -> None:
             return
 
         # Calculate metrics
-        metrics = st.session_state.calculator.get_basic_metrics()
+        metrics = st.session_state.calculator.compute_all(
+            PAGE_METRICS["Quality Metrics"]
+        )["basic_metrics"]
 
         # Display metrics in 3 columns
         col1, col2, col3 = st.columns(3)
@@ -57,9 +62,8 @@ def main() -> None:
         with col2:
             try:
                 # Check if Issue Type column exists
-                if not any(
-                    col.lower() in ["issue type", "issuetype", "type"]
-                    for col in st.session_state.data.columns
+                if not column_resolver.find(
+                    st.session_state.data.columns, "Issue Type"
                 ):
                     st.warning("Issue Type column not found in data")
                 else:
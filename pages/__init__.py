@@ -1,6 +1,6 @@
 """Streamlit pages initialization."""
 
-from typing import Dict
+from typing import Dict, List
 
 # Page registry
 PAGES: Dict[str, str] = {
@@ -11,4 +11,41 @@ PAGES: Dict[str, str] = {
     "Quality Metrics": "5_🔍_Quality_Metrics.py",
 }
 
-__all__ = ["PAGES"]
+# Calculator metrics each page requests, pre-warmed after a data load
+PAGE_METRICS: Dict[str, List[str]] = {
+    "Home": ["basic_metrics"],
+    "Program Overview": ["basic_metrics"],
+    "Sprint Metrics": [
+        "sprint_metrics",
+        "flow_metrics",
+        "throughput",
+        "flow_by_sprint",
+    ],
+    "Epic Tracking": ["epic_count", "basic_metrics", "epic_rollup", "epic_forecast"],
+    "Team Analysis": ["basic_metrics", "team_size", "flow_metrics", "flow_by_assignee"],
+    "Quality Metrics": ["basic_metrics"],
+}
+
+# Visualizer charts each page renders by default, pre-warmed after a data load
+PAGE_CHARTS: Dict[str, List[str]] = {
+    "Home": ["create_epic_treemap", "create_sprint_health_radar"],
+    "Program Overview": ["create_sprint_velocity", "create_status_distribution"],
+    "Sprint Metrics": [
+        "create_sprint_velocity",
+        "create_sprint_burndown",
+        "create_cumulative_flow",
+    ],
+    "Epic Tracking": ["create_epic_progress", "create_epic_status"],
+    "Team Analysis": ["create_team_workload", "create_team_velocity"],
+    "Quality Metrics": [
+        "create_velocity_chart",
+        "create_issue_type_distribution",
+        "create_sprint_burndown",
+        "create_defect_trend",
+    ],
+}
+
+# Charts taking the epic column as their only argument
+EPIC_CHARTS = {"create_epic_treemap", "create_epic_progress", "create_epic_status"}
+
+__all__ = ["EPIC_CHARTS", "PAGES", "PAGE_CHARTS", "PAGE_METRICS"]
@@ -9,7 +9,7 @@ setup(
     install_requires=[
         "streamlit",
         "pandas",
-        "plotly",
+        "plotly>=6.0.0",
         "setuptools",
     ],
     python_requires=">=3.8",
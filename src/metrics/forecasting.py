@@ -0,0 +1,91 @@
+"""Monte Carlo delivery forecasting from sprint velocity history."""
+
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.utils.logger import logger
+
+FORECAST_PERCENTILES = (0.5, 0.85, 0.95)
+FORECAST_TRIALS = 20000
+MAX_FORECAST_SPRINTS = 100
+
+
+def completion_cdf(
+    velocities: Sequence[float],
+    remaining: Sequence[float],
+    trials: int = FORECAST_TRIALS,
+    max_sprints: int = MAX_FORECAST_SPRINTS,
+    seed: Optional[int] = None,
+) -> np.ndarray:
+    """Simulate the chance each backlog is done after every future sprint.
+
+    Every trial resamples a future of sprint velocities from history in
+    one array draw. Sorting the running totals of each sprint across trials
+    turns the share of trials that have burned a backlog by that sprint
+    into a single ``searchsorted`` for all backlogs.
+
+    Args:
+        velocities: Historical points completed per sprint
+        remaining: Remaining points of each backlog
+        trials: Number of simulated futures
+        max_sprints: Sprints simulated per trial
+        seed: Optional random seed
+
+    Returns:
+        Array of shape (max_sprints + 1, backlogs); row k holds the share of
+        trials that finish each backlog within k sprints
+    """
+    history = np.asarray(velocities, dtype=float)
+    remaining = np.asarray(remaining, dtype=float)
+    rng = np.random.default_rng(seed)
+
+    draws = rng.choice(history, size=(trials, max_sprints))
+    burned = np.sort(np.cumsum(draws, axis=1), axis=0)
+
+    # Trials whose running total has not reached the backlog yet
+    short = np.stack(
+        [np.searchsorted(burned[:, k], remaining) for k in range(max_sprints)]
+    )
+    cdf = 1 - short / trials
+    return np.vstack([(remaining <= 0)[None, :].astype(float), cdf])
+
+
+def forecast_completion(
+    velocities: Sequence[float],
+    remaining: pd.Series,
+    trials: int = FORECAST_TRIALS,
+    max_sprints: int = MAX_FORECAST_SPRINTS,
+    seed: Optional[int] = None,
+) -> pd.DataFrame:
+    """Forecast completion sprints for each remaining backlog.
+
+    Args:
+        velocities: Historical points completed per sprint
+        remaining: Remaining points indexed by backlog, e.g. epic
+        trials: Number of simulated futures
+        max_sprints: Sprints simulated per trial
+        seed: Optional random seed
+
+    Returns:
+        DataFrame indexed like remaining with P50, P85 and P95 sprints to
+        completion, inf beyond max_sprints; NaN when the history shows no
+        completed work
+    """
+    columns = [f"P{q * 100:.0f}" for q in FORECAST_PERCENTILES]
+    history = np.asarray(velocities, dtype=float)
+    history = history[~np.isnan(history)]
+    if not (history > 0).any() or remaining.empty:
+        logger.warning("No completed sprint velocity to forecast from")
+        return pd.DataFrame(np.nan, index=remaining.index, columns=columns)
+
+    cdf = completion_cdf(history, remaining.to_numpy(), trials, max_sprints, seed)
+    # First sprint whose completion share reaches each percentile
+    percentiles = {}
+    for column, q in zip(columns, FORECAST_PERCENTILES):
+        reached = cdf >= q
+        percentiles[column] = np.where(
+            reached.any(axis=0), reached.argmax(axis=0), np.inf
+        )
+    return pd.DataFrame(percentiles, index=remaining.index)
@@ -1,46 +1,388 @@
 """Metrics calculation module."""
 
-from typing import Any, Dict
+import functools
+import inspect
+from threading import RLock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
+import numpy as np
 import pandas as pd
 
+from src.metrics.forecasting import FORECAST_TRIALS, forecast_completion
+from src.utils.column_resolver import column_resolver
+from src.utils.constants import StatusCategory
+from src.utils.dataset import SharedDataset
+from src.utils.dates import (
+    completion_dates,
+    date_values,
+    latest_event,
+    normalize_dates,
+)
+from src.utils.logger import logger
+
+T = TypeVar("T")
+
+# Percentiles reported for lead time and work-in-progress age
+FLOW_PERCENTILES: Tuple[float, ...] = (0.5, 0.85, 0.95)
+_DAY = np.timedelta64(1, "D")
+
+# Metric plan: name -> (calculator method, method arguments, prerequisite nodes)
+METRIC_GRAPH: Dict[str, Tuple[str, Tuple[Hashable, ...], Tuple[str, ...]]] = {
+    "done_filter": ("get_done_filter", (), ()),
+    "open_points_by_epic": ("get_open_points_by_epic", (), ()),
+    "basic_metrics": ("get_basic_metrics", (), ()),
+    "sprint_velocity": ("get_sprint_velocity", (), ("done_filter",)),
+    "sprint_metrics": (
+        "get_sprint_metrics",
+        (),
+        ("sprint_velocity", "basic_metrics"),
+    ),
+    "team_size": ("get_distinct_count", ("Assignee",), ()),
+    "epic_count": ("get_distinct_count", ("Epic",), ()),
+    "epic_rollup": ("get_epic_rollup", (), ()),
+    "flow_times": ("get_flow_times", (), ()),
+    "throughput": ("get_throughput", (), ("flow_times",)),
+    "flow_metrics": ("get_flow_metrics", (), ("flow_times", "throughput")),
+    "flow_by_sprint": ("get_flow_percentiles", ("Sprint",), ("flow_times",)),
+    "flow_by_epic": ("get_flow_percentiles", ("Epic",), ("flow_times",)),
+    "flow_by_assignee": ("get_flow_percentiles", ("Assignee",), ("flow_times",)),
+    "epic_forecast": (
+        "get_epic_forecast",
+        (),
+        ("sprint_velocity", "open_points_by_epic"),
+    ),
+}
+
+
+def plan_metrics(requested: Iterable[str]) -> List[str]:
+    """Order the metric nodes needed for requested, prerequisites first.
+
+    Args:
+        requested: Names of metrics in ``METRIC_GRAPH``
+
+    Returns:
+        Every required node exactly once, in dependency order
+    """
+    order: List[str] = []
+    visiting: Set[str] = set()
+
+    def visit(node: str) -> None:
+        if node in order:
+            return
+        if node not in METRIC_GRAPH:
+            raise ValueError(f"Unknown metric: {node}")
+        if node in visiting:
+            raise ValueError(f"Metric plan has a cycle at: {node}")
+        visiting.add(node)
+        for prerequisite in METRIC_GRAPH[node][2]:
+            visit(prerequisite)
+        visiting.discard(node)
+        order.append(node)
+
+    for node in requested:
+        visit(node)
+    return order
+
+
+def memoized(method: Callable[..., T]) -> Callable[..., T]:
+    """Memoize a calculator method against the dataset version stamp.
+
+    Results are cached per method and arguments, and dropped as soon as the
+    calculator's dataset fingerprint changes. Arguments are bound by name
+    with defaults applied, so equivalent calls share one entry.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self: "MetricsCalculator", *args: Hashable, **kwargs: Hashable) -> T:
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (method.__name__, tuple(bound.arguments.items())[1:])
+        with self._memo_lock:
+            version = self.dataset.fingerprint
+            if self._memo_version != version:
+                self._memo.clear()
+                self._memo_version = version
+            if key in self._memo:
+                self.memo_hits += 1
+                return self._memo[key]
+            self.memo_misses += 1
+            value = method(self, *args, **kwargs)
+            self._memo[key] = value
+            return value
+
+    return wrapper
+
 
 class MetricsCalculator:
     """Calculate metrics from Jira data."""
 
-    def __init__(self, data: pd.DataFrame):
+    def __init__(self, data: Union[pd.DataFrame, SharedDataset]):
         """Initialize calculator with data."""
-        self.data = data.copy()
-        # Standardize column names
-        self.data = self.data.rename(
-            columns={"Story_Points": "Story Points", "Issue_Key": "Issue Key"}
+        self._memo: Dict[Tuple[str, Tuple[Tuple[str, Hashable], ...]], Any] = {}
+        self._memo_version: Optional[str] = None
+        self._memo_lock = RLock()
+        self.memo_hits = 0
+        self.memo_misses = 0
+        self.set_data(data)
+
+    def set_data(self, data: Union[pd.DataFrame, SharedDataset]) -> None:
+        """Point the calculator at new data, invalidating memoized metrics.
+
+        Args:
+            data: Replacement or delta-updated Jira data
+        """
+        with self._memo_lock:
+            # Wrap the shared, standardized dataset without copying it
+            self.dataset = SharedDataset.wrap(data)
+            self.data = self.dataset.frame
+            self.story_points_col = column_resolver.find(
+                self.data.columns, "Story Points"
+            )
+
+    def memo_stats(self) -> Dict[str, int]:
+        """Return memoization hit and miss counters."""
+        return {
+            "hits": self.memo_hits,
+            "misses": self.memo_misses,
+            "entries": len(self._memo),
+        }
+
+    def compute_all(self, requested_metrics: Iterable[str]) -> Dict[str, Any]:
+        """Compute a batch of metrics in one planned pass.
+
+        Shared intermediates are computed once, before the metrics that use
+        them, and stay memoized for later batches on the same data.
+
+        Args:
+            requested_metrics: Names of metrics in ``METRIC_GRAPH``
+
+        Returns:
+            Dict mapping each requested name to its result
+        """
+        requested = list(requested_metrics)
+        try:
+            plan = plan_metrics(requested)
+        except ValueError as e:
+            logger.error(f"Error planning metrics: {str(e)}")
+            raise
+
+        results = {}
+        for node in plan:
+            method, args, _ = METRIC_GRAPH[node]
+            results[node] = getattr(self, method)(*args)
+        return {name: results[name] for name in requested}
+
+    @memoized
+    def get_done_filter(self) -> Dict[str, List[str]]:
+        """Return the cube filter selecting done statuses."""
+        return self.dataset.status.where(StatusCategory.DONE)
+
+    @memoized
+    def get_open_points_by_epic(self) -> pd.Series:
+        """Sum the story points not yet done per epic."""
+        cube = self.dataset.cube
+        if not cube.has("Epic"):
+            return pd.Series(dtype=float, name="points")
+        return cube.rollup(
+            ["Epic"],
+            "points",
+            where=self.dataset.status.where(
+                StatusCategory.TODO, StatusCategory.IN_PROGRESS, StatusCategory.BLOCKED
+            ),
         )
 
+    @memoized
+    def get_distinct_count(self, column: str) -> int:
+        """Count distinct values, missing included, of a canonical column."""
+        col = column_resolver.find(self.data.columns, column, f"{column} Link")
+        return int(self.data[col].nunique(dropna=False)) if col else 0
+
+    @memoized
+    def get_epic_rollup(self) -> pd.DataFrame:
+        """Roll points and completion up the epic, story and sub-task tree.
+
+        Returns:
+            DataFrame indexed by epic with Story Points, Done Points and
+            Completion of each top-level issue's subtree
+        """
+        hierarchy = self.dataset.hierarchy
+        points = self.dataset.points
+        done = self.dataset.status.mask(StatusCategory.DONE)
+        roots = hierarchy.roots
+
+        epic_col = column_resolver.find(self.data.columns, "Epic", "Epic Link")
+        key_col = column_resolver.find(self.data.columns, "Issue Key")
+        label_col = epic_col or key_col
+        if label_col is None:
+            return pd.DataFrame()
+        rollup = pd.DataFrame(
+            {
+                "Story Points": hierarchy.rollup(points)[roots],
+                "Done Points": hierarchy.rollup(np.where(done, points, 0))[roots],
+            },
+            index=pd.Index(
+                self.data[label_col].iloc[roots].astype(object).fillna("No Epic"),
+                name="Epic",
+            ),
+        )
+        rollup = rollup.groupby(level=0).sum()
+        rollup["Completion"] = (
+            rollup["Done Points"]
+            / rollup["Story Points"].where(rollup["Story Points"] > 0)
+        ).fillna(0)
+        return rollup
+
+    @memoized
     def get_basic_metrics(self) -> Dict[str, Any]:
         """Calculate basic metrics."""
-        story_points_col = (
-            "Story Points" if "Story Points" in self.data.columns else "Story_Points"
-        )
-        completed = len(self.data[self.data["Status"] == "Done"])
+        completed = self.dataset.status.count(StatusCategory.DONE)
         total = len(self.data)
         return {
             "total_stories": total,
             "completed_stories": completed,
-            "total_points": self.data[story_points_col].fillna(0).sum(),
+            "total_points": self.dataset.cube.total("points"),
             "completion_rate": completed / total if total > 0 else 0,
         }
 
+    @memoized
     def get_sprint_velocity(self) -> pd.Series:
         """Calculate sprint velocity."""
-        story_points_col = (
-            "Story Points" if "Story Points" in self.data.columns else "Story_Points"
+        velocity = self.dataset.cube.rollup(
+            ["Sprint"], "points", where=self.get_done_filter()
         )
+        return velocity.astype(float).rename(self.story_points_col)
+
+    @memoized
+    def get_flow_times(self) -> pd.DataFrame:
+        """Calculate lead time and work-in-progress age per issue, in days.
+
+        Lead time runs from Created to the completion date of done issues,
+        see ``completion_dates``; done issues whose only date is a future due
+        date have no lead time and count toward no throughput period. Age
+        runs from Created to the latest Created or Resolved date in the data
+        for in-progress issues.
+
+        Returns:
+            DataFrame aligned with the data, with Lead Time, Age, Completed
+            and the Sprint, Epic and Assignee of each issue
+        """
+        data = normalize_dates(self.data)
+        created = date_values(data, "Created")
+        done = self.dataset.status.mask(StatusCategory.DONE)
+        wip = self.dataset.status.mask(StatusCategory.IN_PROGRESS)
+        completed = completion_dates(data, done)
+        as_of = latest_event(data)
+
+        sprints = self.dataset.sprints
+        flow = pd.DataFrame(
+            {
+                "Lead Time": np.where(done, (completed - created) / _DAY, np.nan),
+                "Age": np.where(wip, (as_of - created) / _DAY, np.nan),
+                "Completed": completed,
+                "Sprint": pd.Categorical.from_codes(
+                    sprints.current, categories=sprints.names
+                ),
+            },
+            index=data.index,
+        )
+        flow[["Lead Time", "Age"]] = flow[["Lead Time", "Age"]].clip(lower=0)
+        for name in ("Epic", "Assignee"):
+            col = column_resolver.find(data.columns, *(name, f"{name} Link"))
+            if col is not None:
+                flow[name] = data[col]
+        return flow
+
+    @memoized
+    def get_throughput(self, freq: str = "W") -> pd.Series:
+        """Count issues completed per period.
+
+        Args:
+            freq: Pandas offset alias of the period, weekly by default
+
+        Returns:
+            Series of completed issue counts indexed by period end
+        """
+        completed = self.get_flow_times()["Completed"].dropna()
+        if completed.empty:
+            return pd.Series(dtype="int64", name="Throughput")
         return (
-            self.data[self.data["Status"] == "Done"]
-            .groupby("Sprint")[story_points_col]
+            pd.Series(1, index=pd.DatetimeIndex(completed))
+            .resample(freq)
             .sum()
+            .rename("Throughput")
+        )
+
+    @memoized
+    def get_flow_percentiles(self, by: str) -> pd.DataFrame:
+        """Calculate lead time and age percentiles per group in one pass.
+
+        Args:
+            by: Sprint, Epic or Assignee
+
+        Returns:
+            DataFrame indexed by group with one column per metric percentile
+        """
+        flow = self.get_flow_times()
+        if by not in flow.columns:
+            return pd.DataFrame()
+        stats = (
+            flow.groupby(by, observed=True)[["Lead Time", "Age"]]
+            .quantile(list(FLOW_PERCENTILES))
+            .unstack()
+        )
+        stats.columns = [f"{metric} P{q * 100:.0f}" for metric, q in stats.columns]
+        return stats.dropna(how="all")
+
+    @memoized
+    def get_flow_metrics(self) -> Dict[str, Any]:
+        """Calculate lead time, throughput and work-in-progress aging."""
+        flow = self.get_flow_times()
+        lead_time = flow["Lead Time"].quantile(list(FLOW_PERCENTILES))
+        age = flow["Age"].dropna()
+        throughput = self.get_throughput()
+        return {
+            "lead_time_p50": lead_time.iloc[0],
+            "lead_time_p85": lead_time.iloc[1],
+            "lead_time_p95": lead_time.iloc[2],
+            "weekly_throughput": throughput.mean() if not throughput.empty else 0,
+            "wip_count": len(age),
+            "wip_age_p85": age.quantile(0.85) if not age.empty else 0,
+        }
+
+    @memoized
+    def get_epic_forecast(self, trials: int = FORECAST_TRIALS) -> pd.DataFrame:
+        """Forecast sprints to finish each epic's open points.
+
+        Epics are forecast independently against the program's historical
+        sprint velocity, with a fixed seed so reruns agree.
+
+        Args:
+            trials: Number of Monte Carlo trials
+
+        Returns:
+            DataFrame indexed by epic with P50, P85 and P95 sprints
+        """
+        remaining = self.get_open_points_by_epic()
+        if remaining.empty:
+            return pd.DataFrame()
+        return forecast_completion(
+            self.get_sprint_velocity().to_numpy(), remaining, trials, seed=0
         )
 
+    @memoized
     def get_sprint_metrics(self) -> Dict[str, Any]:
         """Get sprint metrics."""
         velocity = self.get_sprint_velocity()
@@ -0,0 +1,116 @@
+"""Shared resolver mapping raw export headers to canonical column names."""
+
+import re
+from typing import Dict, Final, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+# Canonical column name -> accepted header spellings
+COLUMN_ALIASES: Final[Dict[str, List[str]]] = {
+    "Issue Key": ["issue_key", "issuekey", "key"],
+    "Issue id": ["issue_id"],
+    "Parent Story": ["parent", "parent_id"],
+    "Epic Issue Key": ["epic_issue_key"],
+    "Story Points": ["story_points", "storypoints", "points"],
+    "Status": ["status"],
+    "Sprint": ["sprint"],
+    "Created": ["created_date"],
+    "Due Date": ["due_date", "duedate"],
+    "Resolved": ["resolved_date", "resolution_date", "resolutiondate"],
+    "Issue Type": ["issue_type", "issuetype", "type"],
+    "Epic": ["epic"],
+    "Epic Link": ["epic_link"],
+    "Assignee": ["assignee"],
+    "Priority": ["priority"],
+    "Project Key": ["project_key"],
+}
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]")
+
+
+def header_key(name: str) -> str:
+    """Return the spelling-insensitive key of a header.
+
+    ``Story Points``, ``story_points`` and ``StoryPoints`` share a key.
+    """
+    return _NON_ALNUM.sub("", str(name).lower())
+
+
+class ColumnResolver:
+    """Resolve raw headers to canonical names once per header signature."""
+
+    def __init__(self, aliases: Dict[str, List[str]] = COLUMN_ALIASES):
+        """Compile alias table into a single key lookup.
+
+        Args:
+            aliases: Mapping of canonical name to accepted spellings
+        """
+        self._canonical = set(aliases)
+        self._lookup: Dict[str, str] = {}
+        for canonical, spellings in aliases.items():
+            for spelling in [canonical, *spellings]:
+                self._lookup.setdefault(header_key(spelling), canonical)
+        self._renames: Dict[Tuple[str, ...], Dict[str, str]] = {}
+        self._located: Dict[Tuple[str, ...], Dict[str, str]] = {}
+
+    def _resolve(self, columns: Iterable[str]) -> Tuple[str, ...]:
+        """Compile and cache the mappings for a header signature."""
+        signature = tuple(columns)
+        if signature in self._renames:
+            return signature
+
+        located: Dict[str, str] = {}
+        # Exact canonical headers win over aliases of the same column
+        for raw in signature:
+            if str(raw).strip() in self._canonical:
+                located.setdefault(str(raw).strip(), raw)
+        for raw in signature:
+            canonical = self._lookup.get(header_key(raw))
+            if canonical is not None:
+                located.setdefault(canonical, raw)
+
+        claimed = {raw: canonical for canonical, raw in located.items()}
+        renames = {}
+        for raw in signature:
+            target = claimed.get(raw, str(raw).strip())
+            if target != raw:
+                renames[raw] = target
+            located.setdefault(target, raw)
+
+        self._renames[signature] = renames
+        self._located[signature] = located
+        return signature
+
+    def renames(self, columns: Iterable[str]) -> Dict[str, str]:
+        """Return the raw -> canonical renames needed for columns."""
+        return self._renames[self._resolve(columns)]
+
+    def standardize(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Return data with canonical column names.
+
+        The input frame is returned unchanged when no rename is needed.
+        """
+        renames = self.renames(data.columns)
+        return data.rename(columns=renames) if renames else data
+
+    def find(self, columns: Iterable[str], *names: str) -> Optional[str]:
+        """Return the label in columns that resolves to one of names.
+
+        Args:
+            columns: Column labels of a frame, raw or standardized
+            names: Canonical names to look for, in order of preference
+
+        Returns:
+            Matching column label or None
+        """
+        located = self._located[self._resolve(columns)]
+        return next((located[name] for name in names if name in located), None)
+
+    def missing(self, columns: Iterable[str], required: Iterable[str]) -> List[str]:
+        """Return required canonical names that cannot be resolved."""
+        located = self._located[self._resolve(columns)]
+        return [name for name in required if name not in located]
+
+
+# Shared resolver used by every ingestion and analysis component
+column_resolver = ColumnResolver()
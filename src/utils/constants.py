@@ -25,6 +25,37 @@ class StatusType(str, Enum):
     BLOCKED = "Blocked"
 
 
+class StatusCategory(str, Enum):
+    """Workflow categories that Jira statuses roll up to."""
+
+    TODO = "to-do"
+    IN_PROGRESS = "in-progress"
+    DONE = "done"
+    BLOCKED = "blocked"
+
+
+# Workflow mapping of status name to category; StatusType values map to
+# their own category
+STATUS_WORKFLOW: Final[Dict[str, StatusCategory]] = {
+    StatusType.TODO.value: StatusCategory.TODO,
+    StatusType.IN_PROGRESS.value: StatusCategory.IN_PROGRESS,
+    StatusType.DONE.value: StatusCategory.DONE,
+    StatusType.BLOCKED.value: StatusCategory.BLOCKED,
+    "Backlog": StatusCategory.TODO,
+    "Open": StatusCategory.TODO,
+    "Story in Progress": StatusCategory.IN_PROGRESS,
+    "Epic in Progress": StatusCategory.IN_PROGRESS,
+    "In Dev": StatusCategory.IN_PROGRESS,
+    "In Review": StatusCategory.IN_PROGRESS,
+    "Story in Review": StatusCategory.IN_PROGRESS,
+    "In Test": StatusCategory.IN_PROGRESS,
+    "In Release": StatusCategory.IN_PROGRESS,
+    "Closed": StatusCategory.DONE,
+    "Resolved": StatusCategory.DONE,
+    "On Hold": StatusCategory.BLOCKED,
+}
+
+
 class PriorityType(str, Enum):
     """Valid priority levels for Jira issues."""
 
@@ -55,6 +86,19 @@ REQUIRED_COLUMNS: Final[list[str]] = [
     "Epic",
 ]
 
+# Column dtype schema
+CATEGORICAL_COLUMNS: Final[list[str]] = [
+    "Status",
+    "Sprint",
+    "Assignee",
+    "Epic",
+    "Issue_Type",
+    "Priority",
+    "Project_Key",
+]
+DATETIME_COLUMNS: Final[list[str]] = ["Created", "Due_Date", "Resolved"]
+NUMERIC_COLUMNS: Final[Dict[str, str]] = {"Story_Points": "Float32"}
+
 # Chart configuration
 CHART_CONFIG: Final[Dict[str, Any]] = {
     "displayModeBar": True,
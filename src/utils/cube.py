@@ -0,0 +1,143 @@
+"""Pre-aggregated cube answering metric and chart queries."""
+
+from typing import Dict, Final, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .column_resolver import column_resolver
+from .logger import logger
+from .sprint_index import SprintIndex
+
+# Cube dimension -> canonical columns it may be read from, in preference order
+CUBE_DIMENSIONS: Final[Dict[str, Tuple[str, ...]]] = {
+    "Sprint": ("Sprint",),
+    "Status": ("Status",),
+    "Assignee": ("Assignee",),
+    "Epic": ("Epic", "Epic Link"),
+    "Issue Type": ("Issue Type",),
+}
+
+MEASURES: Final[List[str]] = ["count", "points"]
+
+
+class AggregateCube:
+    """Issue counts and point sums keyed by every combination of dimensions.
+
+    The cube is built with a single grouped pass over the raw rows; queries
+    then roll up its cells, which are far fewer than the rows.
+    """
+
+    def __init__(self, cells: pd.DataFrame, columns: Dict[str, str]):
+        """Initialize cube.
+
+        Args:
+            cells: One row per dimension combination with count and points
+            columns: Mapping of cube dimension to the source column it holds
+        """
+        self.cells = cells
+        self.columns = columns
+        self.dimensions = list(columns)
+
+    @classmethod
+    def build(
+        cls,
+        data: pd.DataFrame,
+        points: np.ndarray,
+        sprints: Optional[SprintIndex] = None,
+    ) -> "AggregateCube":
+        """Aggregate data into cube cells in one pass.
+
+        Args:
+            data: Standardized Jira data
+            points: Story points per row, missing values as zero
+            sprints: Optional sprint index; issues count in their latest sprint
+
+        Returns:
+            Aggregate cube
+        """
+        keys: Dict[str, pd.Categorical] = {}
+        columns: Dict[str, str] = {}
+        for dimension, names in CUBE_DIMENSIONS.items():
+            col = column_resolver.find(data.columns, *names)
+            if col is None:
+                continue
+            if dimension == "Sprint" and sprints is not None:
+                keys[dimension] = pd.Categorical.from_codes(
+                    sprints.current, categories=sprints.names
+                )
+            else:
+                values = data[col]
+                keys[dimension] = (
+                    values.array
+                    if isinstance(values.dtype, pd.CategoricalDtype)
+                    else pd.Categorical(values)
+                )
+            columns[dimension] = col
+
+        frame = pd.DataFrame(keys, index=pd.RangeIndex(len(data)))
+        frame["count"] = 1
+        frame["points"] = np.asarray(points, dtype=float)
+        if columns:
+            cells = (
+                frame.groupby(list(columns), observed=True, dropna=False)[MEASURES]
+                .sum()
+                .reset_index()
+            )
+        else:
+            cells = frame[MEASURES].sum().to_frame().T
+
+        logger.info(f"Built aggregate cube: {len(data)} rows -> {len(cells)} cells")
+        return cls(cells, columns)
+
+    def has(self, dimension: str, column: Optional[str] = None) -> bool:
+        """Return whether the cube holds a dimension, optionally from column."""
+        if dimension not in self.columns:
+            return False
+        return column is None or self.columns[dimension] == column
+
+    def _select(self, where: Optional[Dict[str, Iterable]]) -> pd.DataFrame:
+        """Return cells matching every dimension filter in where."""
+        cells = self.cells
+        for dimension, values in (where or {}).items():
+            cells = cells[cells[dimension].isin(list(values))]
+        return cells
+
+    def total(
+        self, measure: str = "count", where: Optional[Dict[str, Iterable]] = None
+    ) -> float:
+        """Return the total of a measure over matching cells."""
+        return float(self._select(where)[measure].sum())
+
+    def rollup(
+        self,
+        by: List[str],
+        measure: str = "count",
+        where: Optional[Dict[str, Iterable]] = None,
+    ) -> pd.Series:
+        """Roll a measure up to the given dimensions.
+
+        Args:
+            by: Dimensions to keep
+            measure: ``count`` or ``points``
+            where: Optional mapping of dimension to allowed values
+
+        Returns:
+            Series indexed by the kept dimensions, in category order
+        """
+        return (
+            self._select(where)
+            .groupby(by, observed=True)[measure]
+            .sum()
+            .rename(measure)
+        )
+
+    def pivot(
+        self,
+        rows: str,
+        columns: str,
+        measure: str = "count",
+        where: Optional[Dict[str, Iterable]] = None,
+    ) -> pd.DataFrame:
+        """Return a rows x columns table of a measure, zero filled."""
+        return self.rollup([rows, columns], measure, where).unstack(fill_value=0)
@@ -1,16 +1,83 @@
 """Data processing utilities."""
 
-from typing import Dict, Optional
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
+from .column_resolver import column_resolver
+from .constants import StatusCategory
+from .dates import date_formats, normalize_dates, remember_date_formats
 from .logger import logger
+from .schema import apply_schema, concat_chunks
+from .status_index import CATEGORIES, categorize
 
+PROCESSOR_REQUIRED_COLUMNS = [
+    "Issue Key",
+    "Story Points",
+    "Status",
+    "Sprint",
+    "Created",
+]
 
-def load_data() -> pd.DataFrame:
-    """Load data from CSV."""
-    df = pd.read_csv("data/test_EFDDH-Jira-Data-All.csv")
-    return df.rename(columns={"Issue_Key": "Issue Key", "Story_Points": "Story Points"})
+CsvSource = Union[str, "os.PathLike[str]", IO]
+ProgressCallback = Callable[[float, int], None]
+
+
+def load_data(chunksize: Optional[int] = None) -> pd.DataFrame:
+    """Load data from CSV.
+
+    Args:
+        chunksize: Optional number of rows to read per chunk
+
+    Returns:
+        Loaded DataFrame
+    """
+    path = "data/test_EFDDH-Jira-Data-All.csv"
+    if chunksize:
+        df = pd.concat(DataProcessor.read_chunks(path, chunksize), ignore_index=True)
+    else:
+        df = pd.read_csv(path)
+    return column_resolver.standardize(df)
+
+
+def discover_exports(directory: Union[str, "os.PathLike[str]"]) -> List[Path]:
+    """Return the CSV exports in a directory, sorted by name."""
+    return sorted(Path(directory).glob("*.csv"))
+
+
+def read_export(
+    path: Union[str, "os.PathLike[str]"],
+    formats: Optional[Dict[str, Optional[str]]] = None,
+) -> Tuple[pd.DataFrame, Dict[str, Optional[str]]]:
+    """Read one export with standardized columns and parsed dates.
+
+    Runs in worker processes, whose date format cache starts empty, so the
+    caller passes in the formats it knows and caches the ones returned.
+
+    Args:
+        path: Path to the CSV export
+        formats: Date formats already known for the export, by column
+
+    Returns:
+        Tuple of the DataFrame tagged with its Project Key and the date
+        formats of the export
+    """
+    remember_date_formats(str(path), formats or {})
+    df = normalize_dates(column_resolver.standardize(pd.read_csv(path)), str(path))
+    # Partition by project: fall back to the issue key prefix, then the file name
+    if "Project Key" not in df.columns:
+        df["Project Key"] = pd.NA
+    if "Issue Key" in df.columns:
+        prefix = df["Issue Key"].astype(str).str.split("-", n=1).str[0]
+        df["Project Key"] = df["Project Key"].fillna(prefix)
+    df["Project Key"] = df["Project Key"].fillna(Path(path).stem)
+    return df, date_formats(str(path))
 
 
 def process_sprint_data(data: pd.DataFrame) -> Dict:
@@ -18,14 +85,160 @@ def process_sprint_data(data: pd.DataFrame) -> Dict:
     return {"data": data}
 
 
+@dataclass
+class StreamingAggregates:
+    """Core aggregates accumulated while streaming a CSV in chunks."""
+
+    row_count: int = 0
+    total_points: float = 0.0
+    status_counts: pd.Series = field(default_factory=lambda: pd.Series(dtype=int))
+    points_by_sprint: pd.Series = field(default_factory=lambda: pd.Series(dtype=float))
+    done_points_by_sprint: pd.Series = field(
+        default_factory=lambda: pd.Series(dtype=float)
+    )
+    points_by_assignee: pd.Series = field(
+        default_factory=lambda: pd.Series(dtype=float)
+    )
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Fold a standardized chunk into the running aggregates.
+
+        Args:
+            chunk: Standardized chunk of Jira rows
+        """
+        points = chunk["Story Points"].fillna(0)
+        self.row_count += len(chunk)
+        self.total_points += float(points.sum())
+        self.status_counts = self.status_counts.add(
+            chunk["Status"].value_counts(), fill_value=0
+        ).astype(int)
+        self.points_by_sprint = self.points_by_sprint.add(
+            points.groupby(chunk["Sprint"]).sum(), fill_value=0
+        )
+        done = categorize(chunk["Status"]) == CATEGORIES.index(StatusCategory.DONE)
+        self.done_points_by_sprint = self.done_points_by_sprint.add(
+            points[done].groupby(chunk.loc[done, "Sprint"]).sum(), fill_value=0
+        )
+        if "Assignee" in chunk.columns:
+            self.points_by_assignee = self.points_by_assignee.add(
+                points.groupby(chunk["Assignee"]).sum(), fill_value=0
+            )
+
+
 class DataProcessor:
     """Process Jira data."""
 
     def __init__(self) -> None:
         """Initialize processor."""
         self.data: Optional[pd.DataFrame] = None
+        self.aggregates: Optional[StreamingAggregates] = None
+        self.memory_report: Optional[pd.DataFrame] = None
+        self.delta_stats: Optional[Dict[str, int]] = None
+        self.key_index: Optional[pd.Series] = None
         logger.info("DataProcessor initialized")
 
+    @staticmethod
+    def read_chunks(
+        source: CsvSource,
+        chunksize: int,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Read a CSV in bounded chunks, reporting progress as it goes.
+
+        Args:
+            source: Path or file-like object holding CSV data
+            chunksize: Number of rows per chunk
+            progress_callback: Optional callable receiving the fraction of
+                bytes consumed and the number of rows read so far
+
+        Yields:
+            Raw DataFrame chunks
+        """
+        handle = (
+            open(source, "rb") if isinstance(source, (str, os.PathLike)) else source
+        )
+        try:
+            start = handle.tell()
+            handle.seek(0, os.SEEK_END)
+            total_bytes = max(handle.tell() - start, 1)
+            handle.seek(start)
+
+            rows = 0
+            for chunk in pd.read_csv(handle, chunksize=chunksize):
+                rows += len(chunk)
+                if progress_callback is not None:
+                    consumed = (handle.tell() - start) / total_bytes
+                    progress_callback(min(consumed, 1.0), rows)
+                yield chunk
+        finally:
+            if handle is not source:
+                handle.close()
+
+    @classmethod
+    def read_compact(
+        cls,
+        source: CsvSource,
+        chunksize: int,
+        progress_callback: Optional[ProgressCallback] = None,
+        name: Optional[str] = None,
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Read a CSV in chunks, converting each to compact dtypes as it goes.
+
+        Only one raw chunk is held at a time, so peak memory stays close to
+        the size of the converted frame.
+
+        Args:
+            source: Path or file-like object holding CSV data
+            chunksize: Number of rows per chunk
+            progress_callback: Optional progress callable, see ``read_chunks``
+            name: Optional name of the export, used to cache date formats
+
+        Returns:
+            Tuple of the standardized, converted DataFrame and its memory report
+        """
+        frames, reports = [], []
+        for chunk in cls.read_chunks(source, chunksize, progress_callback):
+            chunk, report = apply_schema(column_resolver.standardize(chunk), name)
+            frames.append(chunk)
+            reports.append(report)
+        if not frames:
+            raise ValueError("CSV export holds no header row")
+        return concat_chunks(frames, reports)
+
+    def stream_csv(
+        self,
+        source: CsvSource,
+        chunksize: int,
+        progress_callback: Optional[ProgressCallback] = None,
+        retain_rows: bool = True,
+    ) -> Tuple[Optional[pd.DataFrame], StreamingAggregates]:
+        """Stream a CSV, standardizing and aggregating each chunk.
+
+        With ``retain_rows=False`` only the aggregates are kept, so memory
+        stays bounded by ``chunksize`` regardless of the file size.
+
+        Args:
+            source: Path or file-like object holding CSV data
+            chunksize: Number of rows per chunk
+            progress_callback: Optional progress callable, see ``read_chunks``
+            retain_rows: Whether to keep and concatenate the standardized rows
+
+        Returns:
+            Tuple of the concatenated DataFrame (or None) and the aggregates
+        """
+        aggregates = StreamingAggregates()
+        chunks = []
+        for chunk in self.read_chunks(source, chunksize, progress_callback):
+            chunk = self.standardize_columns(chunk)
+            aggregates.update(chunk)
+            if retain_rows:
+                chunks.append(chunk)
+
+        data = pd.concat(chunks, ignore_index=True) if chunks else None
+        self.aggregates = aggregates
+        logger.info(f"Streamed {aggregates.row_count} rows in chunks of {chunksize}")
+        return data, aggregates
+
     def standardize_columns(self, data: pd.DataFrame) -> pd.DataFrame:
         """Standardize column names.
 
@@ -36,18 +249,8 @@ class DataProcessor:
             DataFrame with standardized column names
         """
         try:
-            # Create a copy to avoid modifying the original
-            df = data.copy()
-
-            # Standardize common column variations
-            column_mapping = {
-                "Issue_Key": "Issue Key",
-                "Story_Points": "Story Points",
-                "Created_Date": "Created",
-            }
-
-            # Apply mapping for known variations
-            df = df.rename(columns=column_mapping)
+            # Rename known variations through the shared resolver
+            df = column_resolver.standardize(data)
 
             # Validate after standardization
             if not self.validate_columns(df):
@@ -68,30 +271,269 @@ class DataProcessor:
         Returns:
             bool: True if all required columns exist
         """
-        required_columns = {
-            "Issue Key": ["issue key", "issue_key", "key"],
-            "Story Points": ["story points", "story_points", "points"],
-            "Status": ["status"],
-            "Sprint": ["sprint"],
-            "Created": ["created", "created_date"],
-        }
-
-        for required, alternatives in required_columns.items():
-            if not any(col.lower() in alternatives for col in data.columns):
-                logger.error(f"Required column missing: {required}")
-                return False
-
-        return True
-
-    def process_csv(self, file_path: str) -> pd.DataFrame:
-        """Process CSV file."""
+        missing = column_resolver.missing(data.columns, PROCESSOR_REQUIRED_COLUMNS)
+        for required in missing:
+            logger.error(f"Required column missing: {required}")
+        return not missing
+
+    def optimize_dtypes(
+        self, data: pd.DataFrame, source: Optional[str] = None
+    ) -> pd.DataFrame:
+        """Convert standardized data to the compact dtype schema.
+
+        Args:
+            data: DataFrame with standardized column names
+            source: Optional identifier of the export, used to cache formats
+
+        Returns:
+            DataFrame with categorical, nullable numeric and datetime columns
+        """
+        df, self.memory_report = apply_schema(data, source)
+        for row in self.memory_report.itertuples():
+            logger.info(
+                f"{row.column}: {row.bytes_before:,} -> {row.bytes_after:,} bytes "
+                f"({row.dtype})"
+            )
+        return df
+
+    def process_csv(
+        self,
+        file_path: str,
+        chunksize: Optional[int] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> pd.DataFrame:
+        """Process CSV file.
+
+        Args:
+            file_path: Path to the CSV file
+            chunksize: Optional number of rows per chunk for streaming mode
+            progress_callback: Optional progress callable for streaming mode
+
+        Returns:
+            Processed DataFrame
+        """
         try:
+            if chunksize:
+                df, _ = self.stream_csv(file_path, chunksize, progress_callback)
+                if df is None:
+                    raise ValueError("No rows found in CSV")
+                self.data = self.optimize_dtypes(df, str(file_path))
+                self.key_index = None
+                return self.data
+
             df = pd.read_csv(file_path)
             df = self.standardize_columns(df)
             if not self.validate_columns(df):
                 raise ValueError("Missing required columns")
-            self.data = df
+            self.data = self.optimize_dtypes(df, str(file_path))
+            self.key_index = None
             return self.data
         except Exception as e:
             logger.error(f"Error processing CSV: {str(e)}")
             raise
+
+    def _issue_key_column(self, data: pd.DataFrame) -> str:
+        """Return the column identifying issues in data."""
+        key = column_resolver.find(data.columns, "Issue Key")
+        if key is None and "Issue id" in data.columns:
+            key = "Issue id"
+        if key is None:
+            raise ValueError("Delta ingestion needs an Issue Key or Issue id column")
+        return key
+
+    def build_key_index(self, data: pd.DataFrame) -> pd.Series:
+        """Return the row position of each issue key, used to match delta rows.
+
+        Overlapping exports may repeat a key; the last row holding it wins.
+        Callers keep the index with the dataset and hand it back through
+        ``key_index`` so repeated deltas do not rebuild it.
+
+        Args:
+            data: Loaded data
+
+        Returns:
+            Row positions indexed by the unique Issue Key (or Issue id)
+        """
+        keys = data[self._issue_key_column(data)]
+        last = ~keys.duplicated(keep="last").to_numpy()
+        index = pd.Series(np.flatnonzero(last), index=keys.to_numpy()[last])
+        index.attrs["rows"] = len(data)
+        return index
+
+    def _harmonize_dtypes(self, delta: pd.DataFrame) -> pd.DataFrame:
+        """Align delta columns and dtypes with the loaded data.
+
+        Categories missing from the loaded data are added to it so updated
+        and inserted rows keep the categorical dtype.
+        """
+        delta = delta.reindex(columns=self.data.columns)
+        for col in self.data.columns:
+            dtype = self.data[col].dtype
+            if isinstance(dtype, pd.CategoricalDtype):
+                new = pd.Index(delta[col].dropna().unique()).difference(
+                    dtype.categories
+                )
+                if len(new):
+                    self.data[col] = self.data[col].cat.add_categories(new)
+                delta[col] = pd.Categorical(
+                    delta[col], categories=self.data[col].cat.categories
+                )
+            elif delta[col].dtype != dtype:
+                try:
+                    delta[col] = delta[col].astype(dtype)
+                except (TypeError, ValueError):
+                    logger.warning(f"Could not align delta column {col} to {dtype}")
+        return delta
+
+    def apply_delta(
+        self, delta: Union[CsvSource, pd.DataFrame], source: Optional[str] = None
+    ) -> Dict[str, int]:
+        """Upsert an export of changed issues into the loaded data.
+
+        Rows are matched on Issue Key (or Issue id) through a hash index over
+        the loaded keys. Matched rows whose content hash differs are updated
+        in place, unmatched rows are appended. Parsing, hashing and matching
+        only touch the delta rows, and updates only the columns the delta
+        holds; inserted rows leave the other columns empty.
+
+        Args:
+            delta: Path, buffer or DataFrame holding the changed issues
+            source: Optional identifier of the delta, used to cache formats
+
+        Returns:
+            Counts of inserted, updated and unchanged rows
+        """
+        if self.data is None:
+            raise ValueError("No data loaded to apply the delta to")
+        try:
+            if not isinstance(delta, pd.DataFrame):
+                delta = pd.read_csv(delta)
+            delta, _ = apply_schema(self.standardize_columns(delta), source)
+
+            # Only whole columns are replaced below, so the caller's frame is
+            # never written to, with or without copy-on-write
+            self.data = self.data.copy(deep=False)
+            key = self._issue_key_column(self.data)
+            delta = delta.drop_duplicates(subset=key, keep="last")
+            columns = self.data.columns.intersection(delta.columns, sort=False)
+            delta = self._harmonize_dtypes(delta).reset_index(drop=True)
+
+            if self.key_index is None or self.key_index.attrs.get("rows") != len(
+                self.data
+            ):
+                self.key_index = self.build_key_index(self.data)
+            found = self.key_index.index.get_indexer(delta[key])
+            matched = found >= 0
+            positions = np.where(matched, self.key_index.to_numpy()[found], -1)
+
+            existing = self.data.iloc[positions[matched]][columns]
+            incoming = delta.loc[matched, columns]
+            changed = (
+                pd.util.hash_pandas_object(existing, index=False).to_numpy()
+                != pd.util.hash_pandas_object(incoming, index=False).to_numpy()
+            )
+            updated_positions = positions[matched][changed]
+            updates = incoming[changed]
+            if len(updates):
+                for col in columns:
+                    values = self.data[col].copy()
+                    values.iloc[updated_positions] = updates[col].array
+                    self.data[col] = values
+
+            inserts = delta[~matched]
+            if len(inserts):
+                start = len(self.data)
+                self.data = pd.concat([self.data, inserts], ignore_index=True)
+                self.key_index = pd.concat(
+                    [
+                        self.key_index,
+                        pd.Series(
+                            np.arange(start, len(self.data)),
+                            index=inserts[key].to_numpy(),
+                        ),
+                    ]
+                )
+                self.key_index.attrs["rows"] = len(self.data)
+
+            self.delta_stats = {
+                "inserted": int((~matched).sum()),
+                "updated": int(changed.sum()),
+                "unchanged": int((~changed).sum()),
+            }
+            logger.info(f"Applied delta on {key}: {self.delta_stats}")
+            return self.delta_stats
+
+        except Exception as e:
+            logger.error(f"Error applying delta: {str(e)}")
+            raise
+
+    def process_directory(
+        self,
+        directory: Union[str, "os.PathLike[str]"],
+        max_workers: Optional[int] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> pd.DataFrame:
+        """Load every CSV export in a directory in parallel.
+
+        Files are parsed in a pool of spawned processes, since forking a
+        server with live threads can deadlock, harmonized through the shared
+        column resolver and concatenated grouped by Project Key. Date
+        formats inferred by the workers are cached per export here.
+
+        Args:
+            directory: Directory holding the exports
+            max_workers: Optional worker count, defaults to the CPU count
+            progress_callback: Optional callable receiving the fraction of
+                files parsed and the number of rows read so far
+
+        Returns:
+            Combined, schema-converted DataFrame
+        """
+        try:
+            paths = discover_exports(directory)
+            if not paths:
+                raise ValueError(f"No CSV exports found in {directory}")
+
+            workers = min(len(paths), max_workers or os.cpu_count() or 1)
+            frames: Dict[Path, pd.DataFrame] = {}
+            rows = 0
+
+            def collect(
+                path: Path, result: Tuple[pd.DataFrame, Dict[str, Optional[str]]]
+            ) -> None:
+                nonlocal rows
+                frame, formats = result
+                remember_date_formats(str(path), formats)
+                frames[path] = frame
+                rows += len(frame)
+                if progress_callback is not None:
+                    progress_callback(len(frames) / len(paths), rows)
+
+            if workers == 1:
+                for path in paths:
+                    collect(path, read_export(path))
+            else:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                ) as pool:
+                    futures = {
+                        pool.submit(read_export, path, date_formats(str(path))): path
+                        for path in paths
+                    }
+                    for future in as_completed(futures):
+                        collect(futures[future], future.result())
+
+            df = pd.concat([frames[path] for path in paths], ignore_index=True)
+            df = df.sort_values("Project Key", kind="stable", ignore_index=True)
+            if not self.validate_columns(df):
+                raise ValueError("Missing required columns")
+
+            logger.info(f"Loaded {len(df)} rows from {len(paths)} exports")
+            self.data = self.optimize_dtypes(df, str(directory))
+            self.key_index = None
+            return self.data
+
+        except Exception as e:
+            logger.error(f"Error processing directory: {str(e)}")
+            raise
@@ -0,0 +1,156 @@
+"""Read-only dataset shared by calculators and visualizers."""
+
+import hashlib
+from threading import RLock
+from typing import Any, Callable, Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .column_resolver import column_resolver
+from .cube import AggregateCube
+from .filter_index import FilterIndex
+from .flow_events import FlowEvents
+from .hierarchy import IssueHierarchy
+from .logger import logger
+from .sprint_index import SprintIndex
+from .status_index import StatusIndex
+
+# Copy-on-write is always on from pandas 3.0, so shallow views never write
+# through to the shared frame; older versions get defensive copies instead.
+COPY_ON_WRITE = int(pd.__version__.split(".")[0]) >= 3
+
+
+def _story_points(frame: pd.DataFrame) -> np.ndarray:
+    """Return story points of frame as a read-only float array."""
+    col = column_resolver.find(frame.columns, "Story Points")
+    if col is None:
+        points = np.zeros(len(frame))
+    else:
+        points = pd.to_numeric(frame[col], errors="coerce").to_numpy(
+            dtype=float, na_value=np.nan
+        )
+        points = np.nan_to_num(points)
+    points.flags.writeable = False
+    return points
+
+
+class SharedDataset:
+    """One standardized copy of the Jira data plus aggregates derived from it."""
+
+    def __init__(self, data: pd.DataFrame, fingerprint: Optional[str] = None):
+        """Wrap data without copying it.
+
+        Args:
+            data: Raw or standardized Jira data
+            fingerprint: Optional content fingerprint of the source export
+        """
+        self._frame = column_resolver.standardize(data)
+        self._fingerprint = fingerprint
+        self._derived: Dict[str, Any] = {}
+        self._lock = RLock()
+
+    @classmethod
+    def wrap(cls, data: Union[pd.DataFrame, "SharedDataset"]) -> "SharedDataset":
+        """Return data if it is already shared, otherwise wrap it."""
+        return data if isinstance(data, cls) else cls(data)
+
+    def __len__(self) -> int:
+        """Return number of rows."""
+        return len(self._frame)
+
+    @property
+    def columns(self) -> pd.Index:
+        """Return column labels."""
+        return self._frame.columns
+
+    @property
+    def fingerprint(self) -> str:
+        """Return the content fingerprint, hashing the rows if none was given."""
+        if self._fingerprint is None:
+            row_hashes = pd.util.hash_pandas_object(self._frame, index=False)
+            self._fingerprint = hashlib.sha256(
+                row_hashes.to_numpy().tobytes()
+                + "|".join(map(str, self._frame.columns)).encode()
+            ).hexdigest()
+        return self._fingerprint
+
+    @property
+    def sprints(self) -> SprintIndex:
+        """Return the sprint membership index, built on first use."""
+        return self.derived("sprint_index", SprintIndex.build)
+
+    @property
+    def status(self) -> StatusIndex:
+        """Return the status category masks, built on first use."""
+        return self.derived("status_index", StatusIndex.build)
+
+    @property
+    def filters(self) -> FilterIndex:
+        """Return the inverted filter indexes, built on first use."""
+        return self.derived(
+            "filter_index", lambda frame: FilterIndex.build(frame, self.sprints)
+        )
+
+    @property
+    def hierarchy(self) -> IssueHierarchy:
+        """Return the epic, story and sub-task hierarchy, built on first use."""
+        return self.derived("hierarchy", IssueHierarchy.build)
+
+    @property
+    def cube(self) -> AggregateCube:
+        """Return the aggregate cube, built on first use."""
+        return self.derived(
+            "cube", lambda frame: AggregateCube.build(frame, self.points, self.sprints)
+        )
+
+    @property
+    def events(self) -> FlowEvents:
+        """Return status transition events derived from issue dates."""
+        return self.derived(
+            "flow_events",
+            lambda frame: FlowEvents.build(frame, self.status.codes, self.points),
+        )
+
+    @property
+    def points(self) -> np.ndarray:
+        """Return story points as a float array with missing values as zero."""
+        return self.derived("points", _story_points)
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """Return the shared frame itself, for readers that never write to it.
+
+        Calculators and visualizers only read, so they use the frame without
+        a copy on any pandas version; callers that may write take ``view``.
+        """
+        return self._frame
+
+    def view(self) -> pd.DataFrame:
+        """Return a private view of the shared frame.
+
+        Under copy-on-write the view shares memory with the dataset and
+        writes to it copy only the touched columns; older pandas versions
+        get a deep copy. Either way writes never reach other holders.
+        """
+        return self._frame.copy(deep=not COPY_ON_WRITE)
+
+    def derived(self, name: str, factory: Callable[[pd.DataFrame], Any]) -> Any:
+        """Return a derived aggregate, computing it once per dataset.
+
+        Args:
+            name: Key identifying the aggregate
+            factory: Callable building the aggregate from the shared frame
+
+        Returns:
+            Cached aggregate
+        """
+        with self._lock:
+            if name not in self._derived:
+                logger.info(f"Computing derived aggregate '{name}'")
+                self._derived[name] = factory(self._frame)
+            return self._derived[name]
+
+    def memory_usage(self) -> int:
+        """Return resident bytes of the shared frame."""
+        return int(self._frame.memory_usage(deep=True).sum())
@@ -0,0 +1,81 @@
+"""Process-wide registry of shared datasets keyed by content fingerprint."""
+
+import weakref
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from .ingestion_cache import IngestionCache
+from .logger import logger
+
+
+@dataclass(eq=False)
+class DatasetLease:
+    """A session's reference to a registered dataset.
+
+    The registry tracks leases weakly, so a dataset stops being referenced
+    as soon as the session holding its lease is discarded.
+    """
+
+    key: str
+    value: Any
+
+
+class DatasetRegistry(IngestionCache):
+    """Share one parsed dataset between every session viewing the same export.
+
+    Entries are reference counted by live leases. Only unreferenced entries
+    are evicted, least recently used first, once the memory budget is
+    exceeded.
+    """
+
+    def __init__(self, max_entries: int = 4, max_bytes: Optional[int] = None):
+        """Initialize registry.
+
+        Args:
+            max_entries: Number of entries kept before unreferenced ones are
+                evicted
+            max_bytes: Memory budget across all registered datasets
+        """
+        super().__init__(max_entries=max_entries, max_bytes=max_bytes)
+        self._leases: Dict[str, "weakref.WeakSet[DatasetLease]"] = {}
+
+    def acquire(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ) -> DatasetLease:
+        """Return a lease on the dataset for key, loading it if needed.
+
+        Args:
+            key: Content fingerprint of the export
+            loader: Callable parsing the export on a miss
+            sizeof: Optional callable returning the size of a loaded value
+
+        Returns:
+            Lease the caller keeps for as long as it uses the dataset
+        """
+        value = self.load(key, loader, sizeof)
+        lease = DatasetLease(key, value)
+        with self._lock:
+            self._leases.setdefault(key, weakref.WeakSet()).add(lease)
+            self._evict()
+        logger.info(f"Dataset {key[:12]} now referenced {self.refcount(key)} times")
+        return lease
+
+    def refcount(self, key: str) -> int:
+        """Return number of live leases on key."""
+        return len(self._leases.get(key, ()))
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache counters and the number of referenced datasets."""
+        stats = super().stats()
+        stats["referenced"] = sum(1 for key in self._entries if self.refcount(key))
+        return stats
+
+    def _evictable(self, key: str) -> bool:
+        """Return whether no session references the entry."""
+        if self.refcount(key):
+            return False
+        self._leases.pop(key, None)
+        return True
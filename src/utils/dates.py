@@ -0,0 +1,210 @@
+"""Memoized, vectorized parsing of Jira date columns."""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Final, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .column_resolver import column_resolver, header_key
+from .constants import DATETIME_COLUMNS
+from .logger import logger
+
+# Formats tried in order; Jira exports are day-first
+DATE_FORMATS: Final[List[str]] = [
+    "%d/%m/%Y",
+    "%d/%m/%Y %H:%M",
+    "%d/%b/%y %I:%M %p",
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%m/%d/%Y",
+]
+
+# Number of distinct values inspected when inferring a format
+FORMAT_SAMPLE_SIZE: Final[int] = 100
+
+# Number of source columns whose formats are remembered
+FORMAT_CACHE_MAX_ENTRIES: Final[int] = 256
+
+_format_cache: "OrderedDict[Tuple[str, str], Optional[str]]" = OrderedDict()
+_format_lock = Lock()
+
+
+def _sample(values: pd.Series) -> pd.Series:
+    """Return up to ``FORMAT_SAMPLE_SIZE`` distinct values as strings."""
+    return pd.Series(values.dropna().unique()[:FORMAT_SAMPLE_SIZE]).astype(str)
+
+
+def _fits(sample: pd.Series, fmt: str) -> bool:
+    """Return whether fmt parses every value of sample."""
+    return bool(pd.to_datetime(sample, format=fmt, errors="coerce").notna().all())
+
+
+def infer_date_format(values: pd.Series) -> Optional[str]:
+    """Return the first known format that parses a sample of values.
+
+    Args:
+        values: Column of date strings
+
+    Returns:
+        strftime format, or None when no known format fits
+    """
+    sample = _sample(values)
+    if sample.empty:
+        return None
+    for fmt in DATE_FORMATS:
+        if _fits(sample, fmt):
+            return fmt
+    return None
+
+
+def parse_date_column(values: pd.Series, fmt: Optional[str] = None) -> pd.Series:
+    """Parse a date column by converting each distinct value once.
+
+    Args:
+        values: Column of date strings
+        fmt: Known format, inferred when omitted
+
+    Returns:
+        datetime64 Series aligned with values
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+
+    codes, uniques = pd.factorize(values)
+    uniques = pd.Series(uniques).astype(str)
+    if fmt is None:
+        fmt = infer_date_format(uniques)
+    if fmt is not None:
+        parsed = pd.to_datetime(uniques, format=fmt, errors="coerce")
+    else:
+        parsed = pd.to_datetime(uniques, dayfirst=True, errors="coerce")
+
+    # Map parsed uniques back; code -1 marks missing values
+    return pd.Series(
+        pd.DatetimeIndex(parsed).take(codes, allow_fill=True, fill_value=pd.NaT),
+        index=values.index,
+        name=values.name,
+    )
+
+
+def cached_date_format(source: str, column: str, values: pd.Series) -> Optional[str]:
+    """Return the date format of a source column, inferring it once.
+
+    A cached format is checked against a sample of values first, so a new
+    upload reusing a name but not a format is inferred again instead of
+    parsing to NaT. The least recently used formats are dropped beyond
+    ``FORMAT_CACHE_MAX_ENTRIES``.
+    """
+    key = (source, column)
+    with _format_lock:
+        cached = key in _format_cache
+        fmt = _format_cache.get(key)
+        if cached:
+            _format_cache.move_to_end(key)
+    if cached and (fmt is None or _fits(_sample(values), fmt)):
+        return fmt
+    fmt = infer_date_format(values)
+    remember_date_formats(source, {column: fmt})
+    logger.info(f"Inferred date format {fmt!r} for {column} in {source}")
+    return fmt
+
+
+def date_formats(source: str) -> Dict[str, Optional[str]]:
+    """Return the cached date formats of a source by column."""
+    with _format_lock:
+        return {
+            column: fmt
+            for (name, column), fmt in _format_cache.items()
+            if name == source
+        }
+
+
+def remember_date_formats(source: str, formats: Mapping[str, Optional[str]]) -> None:
+    """Cache date formats of a source, such as ones inferred in a worker.
+
+    Args:
+        source: Identifier of the export
+        formats: Format of each normalized column name
+    """
+    with _format_lock:
+        for column, fmt in formats.items():
+            _format_cache[(source, column)] = fmt
+            _format_cache.move_to_end((source, column))
+        while len(_format_cache) > FORMAT_CACHE_MAX_ENTRIES:
+            _format_cache.popitem(last=False)
+
+
+def normalize_dates(data: pd.DataFrame, source: Optional[str] = None) -> pd.DataFrame:
+    """Convert the schema's date columns to datetime64.
+
+    Args:
+        data: Jira data, raw or standardized
+        source: Optional identifier of the export, used to cache formats
+
+    Returns:
+        DataFrame with parsed date columns
+    """
+    wanted = {header_key(name) for name in DATETIME_COLUMNS}
+    df = data
+    for col in data.columns:
+        if header_key(col) not in wanted:
+            continue
+        if pd.api.types.is_datetime64_any_dtype(df[col]):
+            continue
+        fmt = cached_date_format(source, header_key(col), df[col]) if source else None
+        if df is data:
+            df = data.copy(deep=False)
+        df[col] = parse_date_column(df[col], fmt)
+    return df
+
+
+def date_values(data: pd.DataFrame, *names: str) -> np.ndarray:
+    """Return the first of names present in data as datetime64, else NaT.
+
+    Args:
+        data: Jira data with parsed date columns
+        *names: Canonical column names, in order of preference
+
+    Returns:
+        Array of datetime64 values, one per row
+    """
+    col = column_resolver.find(data.columns, *names)
+    if col is None:
+        return np.full(len(data), np.datetime64("NaT"), "datetime64[ns]")
+    return data[col].to_numpy(dtype="datetime64[ns]")
+
+
+def latest_event(data: pd.DataFrame) -> np.datetime64:
+    """Return the latest Created or Resolved date in data, NaT if none.
+
+    Due dates are left out: they may lie in the future and are no event.
+    """
+    stamps = np.concatenate(
+        [date_values(data, "Created"), date_values(data, "Resolved")]
+    )
+    stamps = stamps[~np.isnat(stamps)]
+    return stamps.max() if len(stamps) else np.datetime64("NaT")
+
+
+def completion_dates(data: pd.DataFrame, done: np.ndarray) -> np.ndarray:
+    """Return when each done issue was completed, NaT for the others.
+
+    Resolved is used where present. Otherwise the Due Date stands in, but
+    only when it is not later than ``latest_event``; done issues with a
+    future due date have no known completion.
+
+    Args:
+        data: Jira data with parsed date columns
+        done: Boolean mask of done issues
+
+    Returns:
+        Array of datetime64 values, one per row
+    """
+    resolved = date_values(data, "Resolved")
+    due = date_values(data, "Due Date")
+    due = np.where(due <= latest_event(data), due, np.datetime64("NaT"))
+    completed = np.where(np.isnat(resolved), due, resolved)
+    return np.where(done, completed, np.datetime64("NaT"))
@@ -2,6 +2,8 @@ from typing import Any, Optional
 
 import pandas as pd
 
+from src.utils.column_resolver import column_resolver
+from src.utils.dates import normalize_dates
 from src.utils.logger import logger
 
 
@@ -39,10 +41,11 @@ class ErrorHandler:
                 logger.error("Empty dataset")
                 return False
 
+            # Compare dates as datetimes, not raw export strings
+            df = normalize_dates(df)
+
             # Check for invalid story points
-            points_col = (
-                "Story Points" if "Story Points" in df.columns else "Story_Points"
-            )
+            points_col = column_resolver.find(df.columns, "Story Points")
             invalid_points = df[(df[points_col].notna()) & (df[points_col] < 0)].shape[
                 0
             ]
@@ -55,8 +58,8 @@ class ErrorHandler:
                 logger.warning(f"Found {future_dates} rows with future created dates")
 
             # Check for invalid date ranges
-            due_col = "Due Date" if "Due Date" in df.columns else "Due_Date"
-            if due_col in df.columns:
+            due_col = column_resolver.find(df.columns, "Due Date")
+            if due_col is not None:
                 invalid_dates = df[
                     (df[due_col].notna())
                     & (df["Created"].notna())
@@ -0,0 +1,149 @@
+"""Inverted indexes answering filter selections without copying rows."""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from .column_resolver import column_resolver
+from .cube import CUBE_DIMENSIONS
+from .sprint_index import SprintIndex
+
+
+@dataclass(frozen=True)
+class Postings:
+    """Row positions per value of one dimension, stored CSR-style.
+
+    The rows holding value ``i`` are ``rows[offsets[i]:offsets[i + 1]]``.
+    """
+
+    values: pd.Index
+    codes: np.ndarray
+    rows: np.ndarray
+    offsets: np.ndarray
+
+    @classmethod
+    def build(cls, column: pd.Series) -> "Postings":
+        """Invert a column into sorted row positions per value."""
+        categorical = (
+            column.array
+            if isinstance(column.dtype, pd.CategoricalDtype)
+            else pd.Categorical(column)
+        )
+        codes = np.asarray(categorical.codes, dtype=np.int64)
+        present = np.flatnonzero(codes >= 0)
+        # A stable sort keeps rows ascending within each value
+        rows = present[np.argsort(codes[present], kind="stable")]
+        counts = np.bincount(codes[present], minlength=len(categorical.categories))
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+        return cls(pd.Index(categorical.categories), codes, rows, offsets)
+
+    def lookup(self, values: Iterable) -> np.ndarray:
+        """Return sorted row positions holding any of values."""
+        positions = self.values.get_indexer(pd.Index(list(values)))
+        parts = [
+            self.rows[self.offsets[i] : self.offsets[i + 1]]
+            for i in np.unique(positions[positions >= 0])
+        ]
+        return np.sort(np.concatenate(parts)) if parts else np.empty(0, np.int64)
+
+
+class FilterIndex:
+    """Inverted indexes over the filterable dimensions of a dataset.
+
+    Selections resolve to sorted row positions by intersecting posting
+    lists, so filtering never scans or copies the frame.
+    """
+
+    def __init__(self, postings: Dict[str, Postings], sprints: SprintIndex, size: int):
+        """Initialize filter index.
+
+        Args:
+            postings: Posting lists per dimension
+            sprints: Sprint membership index answering sprint selections
+            size: Number of rows indexed
+        """
+        self.postings = postings
+        self.sprints = sprints
+        self.size = size
+
+    @classmethod
+    def build(cls, data: pd.DataFrame, sprints: SprintIndex) -> "FilterIndex":
+        """Build posting lists for every dimension present in data.
+
+        Args:
+            data: Standardized Jira data
+            sprints: Sprint membership index of data
+
+        Returns:
+            Filter index over the positional rows of data
+        """
+        postings = {}
+        for dimension, names in CUBE_DIMENSIONS.items():
+            col = column_resolver.find(data.columns, *names)
+            if dimension != "Sprint" and col is not None:
+                postings[dimension] = Postings.build(data[col])
+        return cls(postings, sprints, len(data))
+
+    def rows(self, dimension: str, values: Iterable) -> np.ndarray:
+        """Return sorted row positions whose dimension is any of values."""
+        if dimension == "Sprint":
+            return self.sprints.rows_for(values)
+        return self.postings[dimension].lookup(values)
+
+    def select(self, selections: Mapping[str, Optional[Iterable]]) -> np.ndarray:
+        """Return sorted row positions matching every non-empty selection.
+
+        Args:
+            selections: Mapping of dimension to the values selected for it;
+                empty or None selections do not filter
+
+        Returns:
+            Row positions, all rows when nothing is selected
+        """
+        matches = sorted(
+            (
+                self.rows(dimension, values)
+                for dimension, values in selections.items()
+                if values
+            ),
+            key=len,
+        )
+        if not matches:
+            return np.arange(self.size)
+        result = matches[0]
+        for other in matches[1:]:
+            result = np.intersect1d(result, other, assume_unique=True)
+        return result
+
+    def crosstab(
+        self, rows: str, columns: str, positions: Optional[np.ndarray] = None
+    ) -> pd.DataFrame:
+        """Count selected rows per pair of dimension values.
+
+        Args:
+            rows: Dimension labelling the table rows
+            columns: Dimension labelling the table columns
+            positions: Optional row positions to count, all rows if None
+
+        Returns:
+            Count table without empty rows or columns
+        """
+        left, right = self.postings[rows], self.postings[columns]
+        left_codes, right_codes = left.codes, right.codes
+        if positions is not None:
+            left_codes, right_codes = left_codes[positions], right_codes[positions]
+        keep = (left_codes >= 0) & (right_codes >= 0)
+        width = len(right.values)
+        counts = np.bincount(
+            left_codes[keep] * width + right_codes[keep],
+            minlength=len(left.values) * width,
+        ).reshape(len(left.values), width)
+
+        table = pd.DataFrame(
+            counts,
+            index=pd.Index(left.values, name=rows),
+            columns=pd.Index(right.values, name=columns),
+        )
+        return table.loc[counts.any(axis=1), counts.any(axis=0)]
@@ -0,0 +1,205 @@
+"""Status transition events and the daily series built from them."""
+
+from dataclasses import dataclass
+from typing import Mapping, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .constants import StatusCategory
+from .dates import completion_dates, date_values, normalize_dates
+from .status_index import CATEGORIES, categorize
+
+
+@dataclass(frozen=True)
+class FlowEvents:
+    """Time-sorted events moving issues into or out of a workflow category.
+
+    Each event adds ``delta`` (+1 or -1) times ``weight`` to ``category``
+    at ``times``, so the number of issues (or points) in every category on
+    any day is a cumulative sum over the events up to that day.
+    """
+
+    times: np.ndarray
+    categories: np.ndarray
+    deltas: np.ndarray
+    weights: np.ndarray
+    rows: np.ndarray
+
+    @classmethod
+    def _sorted(
+        cls,
+        times: np.ndarray,
+        categories: np.ndarray,
+        deltas: np.ndarray,
+        weights: np.ndarray,
+        rows: np.ndarray,
+    ) -> "FlowEvents":
+        order = np.argsort(times, kind="stable")
+        return cls(
+            times=times[order],
+            categories=categories[order].astype(np.int8),
+            deltas=deltas[order].astype(np.int8),
+            weights=weights[order].astype(float),
+            rows=rows[order],
+        )
+
+    @classmethod
+    def from_dates(
+        cls,
+        created: np.ndarray,
+        completed: np.ndarray,
+        codes: np.ndarray,
+        points: Optional[np.ndarray] = None,
+    ) -> "FlowEvents":
+        """Derive events from the created and completion dates of each issue.
+
+        An issue enters its current category when created. Done issues with
+        a completion date enter to-do instead and move to done on that date.
+
+        Args:
+            created: Created date of each issue
+            completed: Completion date of each issue, NaT if unknown
+            codes: Current category position of each issue
+            points: Optional story points of each issue
+
+        Returns:
+            Events over the positional rows of the issues
+        """
+        todo = CATEGORIES.index(StatusCategory.TODO)
+        done = CATEGORIES.index(StatusCategory.DONE)
+        created = np.asarray(created, dtype="datetime64[ns]")
+        completed = np.asarray(completed, dtype="datetime64[ns]")
+        codes = np.asarray(codes)
+        if points is None:
+            points = np.ones(len(codes))
+
+        rows = np.flatnonzero(~np.isnat(created))
+        moved = rows[(codes[rows] == done) & ~np.isnat(completed[rows])]
+        moved = moved[completed[moved] >= created[moved]]
+        entered = codes[rows].copy()
+        entered[np.isin(rows, moved)] = todo
+
+        n = len(moved)
+        return cls._sorted(
+            times=np.concatenate([created[rows], completed[moved], completed[moved]]),
+            categories=np.concatenate([entered, np.full(n, todo), np.full(n, done)]),
+            deltas=np.concatenate([np.ones(len(rows)), -np.ones(n), np.ones(n)]),
+            weights=np.concatenate([points[rows], points[moved], points[moved]]),
+            rows=np.concatenate([rows, moved, moved]),
+        )
+
+    @classmethod
+    def build(
+        cls, data: pd.DataFrame, codes: np.ndarray, points: np.ndarray
+    ) -> "FlowEvents":
+        """Derive events from the dates of a Jira export.
+
+        Completion falls back to the Due Date for done issues without a
+        resolution date, unless it lies in the future; see
+        ``completion_dates``.
+
+        Args:
+            data: Jira data with standardized column names
+            codes: Current category position of each row
+            points: Story points of each row
+
+        Returns:
+            Events over the positional rows of data
+        """
+        data = normalize_dates(data)
+        done = codes == CATEGORIES.index(StatusCategory.DONE)
+        return cls.from_dates(
+            date_values(data, "Created"),
+            completion_dates(data, done),
+            codes,
+            points,
+        )
+
+    @classmethod
+    def from_history(
+        cls,
+        history: pd.DataFrame,
+        key: str,
+        workflow: Optional[Mapping[str, StatusCategory]] = None,
+    ) -> "FlowEvents":
+        """Derive events from the status of issues across snapshots.
+
+        Args:
+            history: Rows of key, ``taken`` and ``Status`` per recorded
+                change, with ``removed`` flagging issues dropped from the export
+            key: Column identifying issues
+            workflow: Optional mapping of status name to category
+
+        Returns:
+            Events whose rows are positions into the sorted unique keys
+        """
+        history = history.sort_values([key, "taken"], kind="stable")
+        codes = categorize(history["Status"], workflow).astype(np.int16)
+        codes[history["removed"].to_numpy(dtype=bool)] = -1
+        issues = pd.factorize(history[key], sort=True)[0]
+        times = history["taken"].to_numpy(dtype="datetime64[ns]")
+
+        # Compare each entry with the previous entry of the same issue
+        first = np.ones(len(codes), bool)
+        first[1:] = issues[1:] != issues[:-1]
+        previous = np.empty_like(codes)
+        previous[1:] = codes[:-1]
+        previous[first] = -1
+        moved = codes != previous
+        entering = moved & (codes >= 0)
+        leaving = moved & (previous >= 0)
+
+        return cls._sorted(
+            times=np.concatenate([times[leaving], times[entering]]),
+            categories=np.concatenate([previous[leaving], codes[entering]]),
+            deltas=np.concatenate([-np.ones(leaving.sum()), np.ones(entering.sum())]),
+            weights=np.ones(leaving.sum() + entering.sum()),
+            rows=np.concatenate([issues[leaving], issues[entering]]),
+        )
+
+    def subset(self, rows: np.ndarray) -> "FlowEvents":
+        """Return the events of the given issue rows only."""
+        keep = np.isin(self.rows, rows)
+        return FlowEvents(
+            times=self.times[keep],
+            categories=self.categories[keep],
+            deltas=self.deltas[keep],
+            weights=self.weights[keep],
+            rows=self.rows[keep],
+        )
+
+    def daily(
+        self,
+        start: Optional[Union[str, pd.Timestamp]] = None,
+        end: Optional[Union[str, pd.Timestamp]] = None,
+        weighted: bool = False,
+    ) -> pd.DataFrame:
+        """Return the issues in each category at the end of every day.
+
+        Args:
+            start: First day, defaults to the first event
+            end: Last day, defaults to the last event
+            weighted: Sum event weights (story points) instead of counting
+
+        Returns:
+            DataFrame indexed by day with one column per category
+        """
+        columns = [category.value for category in CATEGORIES]
+        if not len(self.times):
+            return pd.DataFrame(columns=columns, dtype=float)
+
+        first = pd.Timestamp(start or self.times[0]).normalize()
+        last = pd.Timestamp(end or self.times[-1]).normalize()
+        days = pd.date_range(first, last, freq="D")
+        ends = (days + pd.Timedelta(days=1)).to_numpy(dtype="datetime64[ns]")
+        # Events strictly before the end of each day are in effect that day
+        cutoffs = np.searchsorted(self.times, ends, side="left")
+
+        amounts = self.deltas * (self.weights if weighted else 1.0)
+        series = {}
+        for position, name in enumerate(columns):
+            mask = self.categories == position
+            running = np.concatenate([[0.0], np.cumsum(np.where(mask, amounts, 0.0))])
+            series[name] = running[cutoffs]
+        return pd.DataFrame(series, index=days)
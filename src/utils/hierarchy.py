@@ -0,0 +1,127 @@
+"""Epic, story and sub-task hierarchy built once per dataset."""
+
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from .column_resolver import column_resolver
+from .logger import logger
+
+
+def _lookup(values: pd.Series, keys: pd.Series, ids: pd.Series) -> np.ndarray:
+    """Return the row position each parent reference points at, or -1.
+
+    References are matched against issue ids first, then issue keys.
+    """
+    positions = np.full(len(values), -1, np.int64)
+    if len(ids):
+        numeric = pd.to_numeric(values, errors="coerce")
+        id_index = pd.Index(pd.to_numeric(ids, errors="coerce"))
+        if id_index.is_unique:
+            positions = id_index.get_indexer(numeric)
+    if len(keys):
+        key_index = pd.Index(keys.astype(str))
+        if key_index.is_unique:
+            by_key = key_index.get_indexer(values.astype(str).where(values.notna()))
+            positions = np.where(positions >= 0, positions, by_key)
+    return positions
+
+
+def _levels(parent: np.ndarray) -> List[np.ndarray]:
+    """Return row positions per depth, walking down from the roots."""
+    levels = []
+    linked = np.flatnonzero(parent >= 0)
+    frontier = np.flatnonzero(parent < 0)
+    in_frontier = np.zeros(len(parent), bool)
+    while len(frontier):
+        levels.append(frontier)
+        in_frontier[:] = False
+        in_frontier[frontier] = True
+        frontier = linked[in_frontier[parent[linked]]]
+    return levels
+
+
+@dataclass(frozen=True)
+class IssueHierarchy:
+    """Issue to parent links with CSR-style child arrays.
+
+    The children of row ``i`` are ``child_rows[offsets[i]:offsets[i + 1]]``.
+    ``levels`` holds the rows at each depth, roots first, so totals roll up
+    the tree with one vectorized pass per level.
+    """
+
+    parent: np.ndarray
+    child_rows: np.ndarray
+    offsets: np.ndarray
+    levels: List[np.ndarray]
+
+    @classmethod
+    def build(cls, data: pd.DataFrame) -> "IssueHierarchy":
+        """Link each issue to its parent story or epic.
+
+        A ``Parent Story`` reference wins over the ``Epic Issue Key``; an
+        epic referencing itself is a root.
+
+        Args:
+            data: Jira data with standardized column names
+
+        Returns:
+            Hierarchy over the positional rows of data
+        """
+        size = len(data)
+        key_col = column_resolver.find(data.columns, "Issue Key")
+        id_col = column_resolver.find(data.columns, "Issue id")
+        keys = data[key_col] if key_col else pd.Series(dtype=object)
+        ids = data[id_col] if id_col else pd.Series(dtype=float)
+
+        parent = np.full(size, -1, np.int64)
+        for name in ("Epic Issue Key", "Epic Link", "Parent Story"):
+            col = column_resolver.find(data.columns, name)
+            if col is not None:
+                found = _lookup(data[col], keys, ids)
+                parent = np.where(found >= 0, found, parent)
+        parent[parent == np.arange(size)] = -1
+
+        levels = _levels(parent)
+        reached = np.zeros(size, bool)
+        for rows in levels:
+            reached[rows] = True
+        if not reached.all():
+            # Rows never reached from a root sit on a parent cycle
+            logger.warning(f"Ignoring parent links of {int((~reached).sum())} issues")
+            parent[~reached] = -1
+            levels = _levels(parent)
+
+        linked = np.argsort(parent, kind="stable")
+        linked = linked[parent[linked] >= 0]
+        counts = np.bincount(parent[linked], minlength=size)
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+
+        return cls(parent=parent, child_rows=linked, offsets=offsets, levels=levels)
+
+    def children(self, row: int) -> np.ndarray:
+        """Return row positions of the direct children of row."""
+        return self.child_rows[self.offsets[row] : self.offsets[row + 1]]
+
+    @property
+    def roots(self) -> np.ndarray:
+        """Return row positions of issues without a parent."""
+        return self.levels[0] if self.levels else np.empty(0, np.int64)
+
+    def rollup(self, values: np.ndarray) -> np.ndarray:
+        """Sum values over each issue's subtree, bottom-up.
+
+        Args:
+            values: Per-row values, NaN treated as zero
+
+        Returns:
+            Array holding each row's own value plus all its descendants'
+        """
+        totals = np.nan_to_num(np.asarray(values, dtype=float)).copy()
+        for rows in reversed(self.levels[1:]):
+            totals += np.bincount(
+                self.parent[rows], weights=totals[rows], minlength=len(totals)
+            )
+        return totals
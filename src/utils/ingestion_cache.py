@@ -0,0 +1,192 @@
+"""Content-addressed cache for parsed uploads."""
+
+import hashlib
+import os
+from collections import OrderedDict
+from concurrent.futures import Future
+from threading import RLock
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from .logger import logger
+
+
+def fingerprint_bytes(payload: bytes) -> str:
+    """Return a stable content fingerprint for raw file bytes.
+
+    Args:
+        payload: Raw bytes of the uploaded file
+
+    Returns:
+        Hex digest identifying the content
+    """
+    return hashlib.sha256(payload).hexdigest()
+
+
+def fingerprint_file(path: Union[str, "os.PathLike[str]"]) -> str:
+    """Return the content fingerprint of a file, read in blocks.
+
+    Matches ``fingerprint_bytes`` of the same content.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class IngestionCache:
+    """LRU cache of parsed uploads keyed by a hash of their bytes."""
+
+    label = "ingestion cache"
+
+    def __init__(self, max_entries: int = 4, max_bytes: Optional[int] = None):
+        """Initialize cache.
+
+        Args:
+            max_entries: Maximum number of cached uploads
+            max_bytes: Optional ceiling on the summed size of cached entries
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._loading: Dict[str, "Future[Any]"] = {}
+        self._lock = RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """Return number of cached entries."""
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """Return summed size of cached entries."""
+        return sum(size for _, size in self._entries.values())
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return cached value for key, counting a hit or miss."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: Any, nbytes: int = 0) -> None:
+        """Store value under key and evict least recently used entries."""
+        with self._lock:
+            self._entries[key] = (value, nbytes)
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def get_or_load(
+        self,
+        payload: bytes,
+        loader: Callable[[bytes], Any],
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ) -> Any:
+        """Return the parsed value for payload, loading it on a miss.
+
+        Args:
+            payload: Raw bytes of the uploaded file
+            loader: Callable that parses the bytes into the cached value
+            sizeof: Optional callable returning the size of a loaded value
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        return self.load(
+            fingerprint_bytes(payload),
+            lambda: loader(payload),
+            sizeof or (lambda _: len(payload)),
+        )
+
+    def load(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ) -> Any:
+        """Return the value cached under key, loading it on a miss.
+
+        Concurrent misses on the same key run the loader once; later callers
+        wait for that load and share its value or its error.
+
+        Args:
+            key: Content fingerprint of the source
+            loader: Callable producing the value
+            sizeof: Optional callable returning the size of a loaded value
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        with self._lock:
+            value = self.get(key)
+            if value is not None:
+                logger.info(f"{self.label.capitalize()} hit for {key[:12]}")
+                return value
+            pending = self._loading.get(key)
+            if pending is None:
+                pending = self._loading[key] = Future()
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            logger.info(f"Waiting for {self.label} load of {key[:12]}")
+            return pending.result()
+
+        logger.info(f"{self.label.capitalize()} miss for {key[:12]}")
+        try:
+            value = loader()
+            self.put(key, value, sizeof(value) if sizeof else 0)
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        else:
+            pending.set_result(value)
+        finally:
+            with self._lock:
+                del self._loading[key]
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit, miss and eviction counters."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.total_bytes,
+        }
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def _over_budget(self) -> bool:
+        """Return whether the cache exceeds its entry or byte bounds."""
+        return len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self.total_bytes > self.max_bytes
+        )
+
+    def _evictable(self, key: str) -> bool:
+        """Return whether an entry may be evicted."""
+        return True
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until within bounds.
+
+        The most recently used entry is always kept.
+        """
+        for key in list(self._entries)[:-1]:
+            if not self._over_budget():
+                break
+            if not self._evictable(key):
+                continue
+            del self._entries[key]
+            self.evictions += 1
+            logger.info(f"Evicted {key[:12]} from {self.label}")
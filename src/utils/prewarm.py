@@ -0,0 +1,91 @@
+"""Background pre-computation of cached metrics and figures."""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Event, Lock
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from .logger import logger
+
+
+class Prewarmer:
+    """Run cache-filling tasks on a background thread pool.
+
+    Tasks only fill caches that are already thread safe; their results are
+    discarded. A failing task is logged and counted as done, so the page
+    that needs it rebuilds it and reports the error itself.
+    """
+
+    def __init__(self, tasks: Mapping[str, Callable[[], Any]], max_workers: int = 4):
+        """Initialize pre-warmer.
+
+        Args:
+            tasks: Mapping of task name to callable filling a cache
+            max_workers: Number of worker threads
+        """
+        self.tasks = dict(tasks)
+        self.max_workers = max_workers
+        self.errors: Dict[str, str] = {}
+        self._done = 0
+        self._lock = Lock()
+        self._finished = Event()
+        if not self.tasks:
+            self._finished.set()
+
+    @property
+    def total(self) -> int:
+        """Return number of tasks."""
+        return len(self.tasks)
+
+    @property
+    def done(self) -> int:
+        """Return number of tasks that have finished."""
+        return self._done
+
+    @property
+    def finished(self) -> bool:
+        """Return whether every task has finished."""
+        return self._finished.is_set()
+
+    def progress(self) -> float:
+        """Return the finished fraction of tasks."""
+        return self._done / self.total if self.total else 1.0
+
+    def start(self) -> "Prewarmer":
+        """Submit every task without waiting for them.
+
+        Returns:
+            The pre-warmer, for chaining
+        """
+        if not self.tasks:
+            return self
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="prewarm"
+        )
+        for name, task in self.tasks.items():
+            executor.submit(task).add_done_callback(
+                lambda future, name=name: self._record(name, future)
+            )
+        # Workers finish the queued tasks, then exit on their own
+        executor.shutdown(wait=False)
+        logger.info(f"Pre-warming {self.total} cached metrics and charts")
+        return self
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until every task has finished or timeout elapses.
+
+        Returns:
+            Whether every task has finished
+        """
+        return self._finished.wait(timeout)
+
+    def _record(self, name: str, future: "Future[Any]") -> None:
+        """Count a finished task, logging its failure."""
+        error = future.exception()
+        with self._lock:
+            if error is not None:
+                self.errors[name] = str(error)
+                logger.warning(f"Pre-warming {name} failed: {error}")
+            self._done += 1
+            if self._done == self.total:
+                logger.info(f"Pre-warmed {self.total - len(self.errors)} tasks")
+                self._finished.set()
@@ -0,0 +1,149 @@
+"""Compact dtype schema for Jira exports."""
+
+from enum import Enum
+from typing import Dict, List, Optional, Tuple, Type
+
+import pandas as pd
+
+from .column_resolver import header_key
+from .constants import (
+    CATEGORICAL_COLUMNS,
+    DATETIME_COLUMNS,
+    NUMERIC_COLUMNS,
+    PriorityType,
+    StatusType,
+)
+from .dates import cached_date_format, parse_date_column
+from .logger import logger
+from .sprint_index import natural_sort_key
+
+# Enums whose values seed the category order of a column
+KNOWN_CATEGORIES: Dict[str, Type[Enum]] = {
+    "status": StatusType,
+    "priority": PriorityType,
+}
+
+
+def _match_columns(data: pd.DataFrame, names: List[str]) -> List[str]:
+    """Return columns of data whose normalized name is in names."""
+    wanted = {header_key(name) for name in names}
+    return [col for col in data.columns if header_key(col) in wanted]
+
+
+def _categories(column: str, values: pd.Series) -> List[str]:
+    """Return categories for a column, known enum values first."""
+    observed = set(values.dropna().astype(str).unique())
+    enum = KNOWN_CATEGORIES.get(header_key(column))
+    known = [member.value for member in enum] if enum else []
+    return [value for value in known if value in observed] + sorted(
+        observed.difference(known), key=natural_sort_key
+    )
+
+
+def to_categorical(values: pd.Series, column: Optional[str] = None) -> pd.Series:
+    """Convert a string column to a categorical with schema ordering."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values
+    column = column if column is not None else str(values.name)
+    text = values.astype(str).where(values.notna())
+    return pd.Series(
+        pd.Categorical(text, categories=_categories(column, values)),
+        index=values.index,
+        name=values.name,
+    )
+
+
+def apply_schema(
+    data: pd.DataFrame, source: Optional[str] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Convert Jira columns to compact dtypes.
+
+    Low-cardinality string columns become categoricals, story points a
+    nullable ``Float32`` and date columns ``datetime64``.
+
+    Args:
+        data: DataFrame with standardized column names
+        source: Optional identifier of the export, used to cache date formats
+
+    Returns:
+        Tuple of the converted DataFrame and a per-column memory report
+    """
+    df = data.copy(deep=False)
+    conversions = {}
+    for col in _match_columns(df, CATEGORICAL_COLUMNS):
+        conversions[col] = to_categorical(df[col], col)
+    for col in _match_columns(df, DATETIME_COLUMNS):
+        fmt = cached_date_format(source, header_key(col), df[col]) if source else None
+        conversions[col] = parse_date_column(df[col], fmt)
+    numeric = {header_key(name): dtype for name, dtype in NUMERIC_COLUMNS.items()}
+    for col in _match_columns(df, list(NUMERIC_COLUMNS)):
+        conversions[col] = pd.to_numeric(df[col], errors="coerce").astype(
+            numeric[header_key(col)]
+        )
+
+    rows = []
+    for col, converted in conversions.items():
+        before = int(df[col].memory_usage(deep=True, index=False))
+        df[col] = converted
+        after = int(df[col].memory_usage(deep=True, index=False))
+        rows.append(
+            {
+                "column": col,
+                "dtype": str(df[col].dtype),
+                "bytes_before": before,
+                "bytes_after": after,
+                "bytes_saved": before - after,
+            }
+        )
+
+    report = pd.DataFrame(
+        rows,
+        columns=["column", "dtype", "bytes_before", "bytes_after", "bytes_saved"],
+    )
+    logger.info(
+        f"Applied dtype schema to {len(rows)} columns, "
+        f"saved {int(report['bytes_saved'].sum()):,} bytes"
+    )
+    return df, report
+
+
+def concat_chunks(
+    frames: List[pd.DataFrame], reports: List[pd.DataFrame]
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Concatenate chunks converted by ``apply_schema`` separately.
+
+    Categorical columns are recoded to the union of their chunk categories,
+    in schema order, so they stay categorical once concatenated.
+
+    Args:
+        frames: Converted chunks, all with the same columns
+        reports: Memory report of each chunk
+
+    Returns:
+        Tuple of the concatenated DataFrame and the summed memory report
+    """
+    frames = list(frames)
+    for col in frames[0].columns:
+        dtypes = [frame[col].dtype for frame in frames]
+        if not all(isinstance(dtype, pd.CategoricalDtype) for dtype in dtypes):
+            continue
+        union = pd.Series(
+            pd.api.types.union_categoricals(
+                [pd.Categorical([], categories=dtype.categories) for dtype in dtypes]
+            ).categories
+        )
+        categories = _categories(col, union)
+        for frame in frames:
+            frame[col] = frame[col].cat.set_categories(categories)
+    data = pd.concat(frames, ignore_index=True)
+
+    report = pd.concat(reports, ignore_index=True)
+    report = (
+        report.groupby("column", sort=False)[
+            ["bytes_before", "bytes_after", "bytes_saved"]
+        ]
+        .sum()
+        .reset_index()
+    )
+    report.insert(1, "dtype", [str(data[col].dtype) for col in report["column"]])
+    return data, report
@@ -0,0 +1,357 @@
+"""History of exports stored as columnar deltas between snapshots."""
+
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+from threading import RLock
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .column_resolver import column_resolver
+from .logger import logger
+from .schema import apply_schema
+
+HASH_COLUMN = "_hash"
+REMOVED_COLUMN = "_removed"
+SEQ_COLUMN = "_seq"
+
+# Longest readable namespace before it is replaced by a hash
+MAX_NAMESPACE_LENGTH = 64
+
+
+def _key_column(data: pd.DataFrame) -> str:
+    """Return the column identifying issues across snapshots."""
+    key = column_resolver.find(data.columns, "Issue Key", "Issue id")
+    if key is None:
+        raise ValueError("Snapshots need an Issue Key or Issue id column")
+    return key
+
+
+def snapshot_namespace(data: pd.DataFrame) -> str:
+    """Return the directory name grouping snapshots of the same projects.
+
+    Successive exports of the same projects share a namespace, so their
+    history accumulates, while exports of other programs never mix in.
+
+    Args:
+        data: Standardized export
+
+    Returns:
+        Project keys joined by dashes, or their hash when long
+    """
+    col = column_resolver.find(data.columns, "Project Key")
+    if col is not None:
+        projects = pd.Series(data[col].dropna().unique()).astype(str)
+    else:
+        col = column_resolver.find(data.columns, "Issue Key")
+        if col is None:
+            return "default"
+        keys = pd.Series(data[col].dropna().unique()).astype(str)
+        projects = keys.str.split("-", n=1).str[0]
+    name = "-".join(sorted(projects.unique()))
+    if not name:
+        return "default"
+    if len(name) > MAX_NAMESPACE_LENGTH or not re.fullmatch(r"[\w-]+", name):
+        return hashlib.sha256(name.encode()).hexdigest()[:16]
+    return name
+
+
+def _latest(frame: pd.DataFrame, key: str) -> pd.DataFrame:
+    """Keep the most recent entry per key, by snapshot sequence."""
+    return frame.sort_values(SEQ_COLUMN, kind="stable").drop_duplicates(
+        subset=key, keep="last"
+    )
+
+
+class SnapshotStore:
+    """Append-only store of exports, each saved as a delta on the previous one.
+
+    Rows are matched on Issue Key by content hash, so a snapshot only
+    writes the rows that were added or changed plus the keys that were
+    removed. The latest key -> hash state is kept beside the deltas to diff
+    the next export without replaying history.
+    """
+
+    def __init__(self, root: Union[str, "os.PathLike[str]"]):
+        """Initialize store.
+
+        Args:
+            root: Directory holding the manifest, state and delta files
+        """
+        self.root = Path(root)
+        self._lock = RLock()
+
+    @property
+    def _manifest_path(self) -> Path:
+        return self.root / "manifest.json"
+
+    @property
+    def _state_path(self) -> Path:
+        return self.root / "state.parquet"
+
+    def _manifest(self) -> List[Dict[str, Any]]:
+        """Return recorded snapshot entries, oldest first."""
+        if not self._manifest_path.exists():
+            return []
+        return json.loads(self._manifest_path.read_text())
+
+    def _write_manifest(self, entries: List[Dict[str, Any]]) -> None:
+        """Replace the manifest atomically."""
+        tmp = self._manifest_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(entries, indent=2))
+        os.replace(tmp, self._manifest_path)
+
+    def snapshots(self) -> pd.DataFrame:
+        """Return one row per snapshot with its change counts."""
+        entries = self._manifest()
+        frame = pd.DataFrame(
+            entries,
+            columns=["seq", "taken", "key", "rows", "added", "changed", "removed"],
+        )
+        frame["taken"] = pd.to_datetime(frame["taken"])
+        return frame
+
+    @property
+    def version(self) -> int:
+        """Return the sequence of the latest snapshot, 0 when none exist."""
+        entries = self._manifest()
+        return entries[-1]["seq"] if entries else 0
+
+    def record(
+        self, data: pd.DataFrame, taken: Optional[Union[str, datetime]] = None
+    ) -> Dict[str, int]:
+        """Record an export as a delta against the latest snapshot.
+
+        Args:
+            data: Standardized export
+            taken: When the export was taken, defaults to now
+
+        Returns:
+            Counts of added, changed and removed issues
+        """
+        try:
+            key = _key_column(data)
+            data = data.drop_duplicates(subset=key, keep="last").reset_index(drop=True)
+            hashes = pd.util.hash_pandas_object(data, index=False).to_numpy()
+
+            with self._lock:
+                self.root.mkdir(parents=True, exist_ok=True)
+                entries = self._manifest()
+                seq = entries[-1]["seq"] + 1 if entries else 1
+                if self._state_path.exists():
+                    state = pd.read_parquet(self._state_path)
+                else:
+                    state = pd.DataFrame({key: [], HASH_COLUMN: []})
+
+                # Hash join the export against the previous state on the key
+                previous = pd.Index(state[key])
+                positions = previous.get_indexer(data[key])
+                old_hashes = state[HASH_COLUMN].to_numpy(dtype=np.uint64)
+                known = positions >= 0
+                changed = ~known
+                changed[known] = old_hashes[positions[known]] != hashes[known]
+                removed = state[key][~previous.isin(data[key])]
+
+                if changed.any():
+                    data[changed].assign(**{HASH_COLUMN: hashes[changed]}).to_parquet(
+                        self.root / f"changes-{seq:06d}.parquet", index=False
+                    )
+                if len(removed):
+                    pd.DataFrame(
+                        {key: removed, HASH_COLUMN: np.zeros(len(removed), np.uint64)}
+                    ).to_parquet(self.root / f"removed-{seq:06d}.parquet", index=False)
+                pd.DataFrame({key: data[key], HASH_COLUMN: hashes}).to_parquet(
+                    self._state_path, index=False
+                )
+
+                stats = {
+                    "added": int((~known).sum()),
+                    "changed": int((changed & known).sum()),
+                    "removed": int(len(removed)),
+                }
+                entries.append(
+                    {
+                        "seq": seq,
+                        "taken": pd.Timestamp(taken or datetime.now()).isoformat(),
+                        "key": key,
+                        "rows": len(data),
+                        **stats,
+                    }
+                )
+                self._write_manifest(entries)
+
+            logger.info(f"Recorded snapshot {seq}: {stats}")
+            return stats
+
+        except Exception as e:
+            logger.error(f"Error recording snapshot: {str(e)}")
+            raise
+
+    def _key(self) -> str:
+        """Return the key column of the latest snapshot."""
+        entries = self._manifest()
+        return entries[-1]["key"] if entries else "Issue Key"
+
+    def _seq_at(self, when: Union[str, datetime]) -> int:
+        """Return the sequence of the last snapshot taken at or before when."""
+        entries = self._manifest()
+        cutoff = pd.Timestamp(when)
+        seqs = [e["seq"] for e in entries if pd.Timestamp(e["taken"]) <= cutoff]
+        return seqs[-1] if seqs else 0
+
+    def _read(
+        self, start: int, end: int, columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """Return every delta entry among snapshots start < seq <= end.
+
+        Removed keys come back as rows flagged in the removed column.
+        """
+        entries = [e for e in self._manifest() if start < e["seq"] <= end]
+        key = self._key()
+        read = None if columns is None else [key, HASH_COLUMN, *columns]
+
+        parts = []
+        for entry in entries:
+            seq = entry["seq"]
+            changes = self.root / f"changes-{seq:06d}.parquet"
+            removed = self.root / f"removed-{seq:06d}.parquet"
+            if changes.exists():
+                parts.append(
+                    pd.read_parquet(changes, columns=read).assign(
+                        **{REMOVED_COLUMN: False, SEQ_COLUMN: seq}
+                    )
+                )
+            if removed.exists():
+                parts.append(
+                    pd.read_parquet(removed).assign(
+                        **{REMOVED_COLUMN: True, SEQ_COLUMN: seq}
+                    )
+                )
+        if not parts:
+            return pd.DataFrame(
+                {
+                    key: pd.Series(dtype=object),
+                    HASH_COLUMN: pd.Series(dtype=np.uint64),
+                    **{c: pd.Series(dtype=object) for c in columns or []},
+                    REMOVED_COLUMN: pd.Series(dtype=bool),
+                    SEQ_COLUMN: pd.Series(dtype=np.int64),
+                }
+            )
+        return pd.concat(parts, ignore_index=True)
+
+    def _replay(
+        self,
+        start: int,
+        end: int,
+        columns: Optional[List[str]] = None,
+        keys: Optional[pd.Index] = None,
+    ) -> pd.DataFrame:
+        """Return the last entry per key among snapshots start < seq <= end."""
+        key = self._key()
+        frame = self._read(start, end, columns)
+        if keys is not None:
+            frame = frame[frame[key].isin(keys)]
+        return _latest(frame, key)
+
+    def history(self, column: str, until: Optional[int] = None) -> pd.DataFrame:
+        """Return every recorded value of one column, oldest snapshot first.
+
+        Args:
+            column: Column to read from the deltas
+            until: Last snapshot sequence to read, defaults to the latest
+
+        Returns:
+            DataFrame of issue key, ``taken``, the column and a ``removed``
+            flag for issues dropped from the export
+        """
+        key = self._key()
+        taken = {e["seq"]: pd.Timestamp(e["taken"]) for e in self._manifest()}
+        end = max(taken, default=0) if until is None else until
+        frame = self._read(0, end, columns=[column])
+        return pd.DataFrame(
+            {
+                key: frame[key].to_numpy(),
+                "taken": frame[SEQ_COLUMN].map(taken).to_numpy(),
+                column: frame[column].to_numpy(),
+                "removed": frame[REMOVED_COLUMN].to_numpy(dtype=bool),
+            }
+        )
+
+    def reconstruct(self, when: Union[str, datetime]) -> pd.DataFrame:
+        """Rebuild the export as it was at a point in time.
+
+        Args:
+            when: Timestamp; the last snapshot taken at or before it is used
+
+        Returns:
+            Schema-converted export sorted by issue key, empty if no snapshot
+            was taken yet
+        """
+        frame = self._replay(0, self._seq_at(when))
+        frame = frame[~frame[REMOVED_COLUMN]].sort_values(self._key(), kind="stable")
+        frame = frame.drop(columns=[HASH_COLUMN, REMOVED_COLUMN, SEQ_COLUMN])
+        return apply_schema(frame.reset_index(drop=True))[0]
+
+    def changes(
+        self, start: Union[str, datetime], end: Union[str, datetime]
+    ) -> pd.DataFrame:
+        """List issues that differ between two points in time.
+
+        Only the key and hash columns of the deltas are read to find the
+        changed issues; full rows are read only for modified ones.
+
+        Args:
+            start: Earlier point in time
+            end: Later point in time
+
+        Returns:
+            DataFrame of issue key, change (added, removed or modified) and
+            the fields that differ
+        """
+        first, last = self._seq_at(start), self._seq_at(end)
+        after = self._replay(first, last, columns=[])
+        key = self._key()
+        before = self._replay(0, first, columns=[], keys=pd.Index(after[key]))
+
+        # Hash join the touched keys against their state at start
+        positions = pd.Index(before[key]).get_indexer(after[key])
+        found = positions >= 0
+        existed = np.zeros(len(after), bool)
+        existed[found] = ~before[REMOVED_COLUMN].to_numpy()[positions[found]]
+        exists = ~after[REMOVED_COLUMN].to_numpy()
+        differs = np.ones(len(after), bool)
+        differs[found] = (
+            before[HASH_COLUMN].to_numpy(dtype=np.uint64)[positions[found]]
+            != after[HASH_COLUMN].to_numpy(dtype=np.uint64)[found]
+        )
+        change = np.select(
+            [~existed & exists, existed & ~exists, existed & exists & differs],
+            ["added", "removed", "modified"],
+            default="",
+        )
+        result = pd.DataFrame(
+            {key: after[key].to_numpy(), "Change": change, "Fields": ""}
+        )
+        result = result[result["Change"] != ""].reset_index(drop=True)
+
+        modified = result["Change"] == "modified"
+        if modified.any():
+            keys = pd.Index(result.loc[modified, key])
+            old = self._replay(0, first, keys=keys).set_index(key).loc[keys]
+            new = self._replay(0, last, keys=keys).set_index(key).loc[keys]
+            fields = [
+                c
+                for c in new.columns
+                if c not in (HASH_COLUMN, REMOVED_COLUMN, SEQ_COLUMN)
+            ]
+            old, new = old[fields].astype(object), new[fields].astype(object)
+            differs = ~((old == new) | (old.isna() & new.isna()))
+            result.loc[modified, "Fields"] = [
+                ", ".join(differs.columns[row]) for row in differs.to_numpy()
+            ]
+        return result
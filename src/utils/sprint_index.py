@@ -0,0 +1,152 @@
+"""Sprint dimension built once per dataset."""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# Extra sprint columns pandas creates for repeated ``Sprint`` headers
+SPRINT_COLUMN = re.compile(r"^Sprint(\.\d+)?$")
+_DIGITS = re.compile(r"(\d+)")
+_LAST_NUMBER = re.compile(r"(\d+)\D*$")
+
+
+def natural_sort_key(name: str) -> Tuple[Union[str, int], ...]:
+    """Return a key sorting embedded numbers numerically.
+
+    ``BP: EFDDH Sprint 2`` sorts before ``BP: EFDDH Sprint 12``.
+    """
+    return tuple(
+        int(part) if part.isdigit() else part.lower()
+        for part in _DIGITS.split(str(name))
+    )
+
+
+def sprint_ordinal(name: str) -> int:
+    """Return the sprint number in a name, or -1 when it has none."""
+    match = _LAST_NUMBER.search(str(name))
+    return int(match.group(1)) if match else -1
+
+
+@dataclass(frozen=True)
+class SprintIndex:
+    """Issue to sprint membership with per-sprint row positions.
+
+    Membership is stored CSR-style: the row positions of sprint ``i`` are
+    ``member_rows[offsets[i]:offsets[i + 1]]``. Issues carried over between
+    sprints are members of each of them; ``current`` holds the latest one.
+    """
+
+    names: List[str]
+    ordinals: np.ndarray
+    member_rows: np.ndarray
+    offsets: np.ndarray
+    current: np.ndarray
+    positions: Dict[str, int]
+
+    @classmethod
+    def build(cls, data: pd.DataFrame) -> "SprintIndex":
+        """Explode the sprint columns of data into a membership index.
+
+        Cells listing several comma-separated sprints, and repeated
+        ``Sprint`` headers, both produce one membership per sprint.
+
+        Args:
+            data: Jira data with standardized column names
+
+        Returns:
+            Sprint index over the positional rows of data
+        """
+        rows_parts, name_parts = [], []
+        for col in (c for c in data.columns if SPRINT_COLUMN.match(str(c))):
+            values = data[col]
+            present = values.notna().to_numpy()
+            names = values[present].astype(str).str.split(",")
+            rows_parts.append(np.repeat(np.flatnonzero(present), names.str.len()))
+            name_parts.append(names.explode().str.strip().to_numpy(dtype=object))
+
+        if rows_parts:
+            rows = np.concatenate(rows_parts).astype(np.int64)
+            names = np.concatenate(name_parts)
+            keep = names != ""
+            rows, names = rows[keep], names[keep]
+        else:
+            rows, names = np.empty(0, np.int64), np.empty(0, object)
+
+        codes, uniques = pd.factorize(names)
+        ordered = sorted(
+            range(len(uniques)), key=lambda i: natural_sort_key(uniques[i])
+        )
+        remap = np.empty(len(uniques), np.int64)
+        remap[ordered] = np.arange(len(uniques))
+        codes = remap[codes] if len(codes) else codes.astype(np.int64)
+
+        pairs = np.unique(np.stack([codes, rows]), axis=1)
+        codes, rows = pairs[0], pairs[1]
+        offsets = np.searchsorted(codes, np.arange(len(uniques) + 1))
+
+        current = np.full(len(data), -1, np.int64)
+        np.maximum.at(current, rows, codes)
+
+        sprint_names = [str(uniques[i]) for i in ordered]
+        return cls(
+            names=sprint_names,
+            ordinals=np.array([sprint_ordinal(n) for n in sprint_names], np.int64),
+            member_rows=rows,
+            offsets=offsets,
+            current=current,
+            positions={name: i for i, name in enumerate(sprint_names)},
+        )
+
+    def code(self, sprint: str) -> int:
+        """Return the position of a sprint in natural order, or -1."""
+        return self.positions.get(str(sprint), -1)
+
+    def rows(self, sprint: str) -> np.ndarray:
+        """Return sorted row positions of the issues in a sprint."""
+        code = self.code(sprint)
+        if code < 0:
+            return np.empty(0, np.int64)
+        return self.member_rows[self.offsets[code] : self.offsets[code + 1]]
+
+    def rows_for(self, sprints: Iterable[str]) -> np.ndarray:
+        """Return sorted row positions of the issues in any of sprints."""
+        parts = [self.rows(sprint) for sprint in sprints]
+        return np.unique(np.concatenate(parts)) if parts else np.empty(0, np.int64)
+
+    @property
+    def unassigned(self) -> np.ndarray:
+        """Return row positions of issues with no sprint."""
+        return np.flatnonzero(self.current < 0)
+
+    def sum_by_sprint(
+        self, values: np.ndarray, mask: Optional[np.ndarray] = None
+    ) -> pd.Series:
+        """Sum values per issue's current sprint.
+
+        Args:
+            values: Per-row values, NaN treated as zero
+            mask: Optional boolean mask of rows to include
+
+        Returns:
+            Series indexed by sprint name in natural order
+        """
+        include = self.current >= 0
+        if mask is not None:
+            include &= mask
+        totals = np.bincount(
+            self.current[include],
+            weights=np.nan_to_num(np.asarray(values, dtype=float)[include]),
+            minlength=len(self.names),
+        )
+        return pd.Series(totals, index=pd.Index(self.names, name="Sprint"))
+
+    def count_by_sprint(self, mask: Optional[np.ndarray] = None) -> pd.Series:
+        """Count rows per issue's current sprint."""
+        include = self.current >= 0
+        if mask is not None:
+            include &= mask
+        counts = np.bincount(self.current[include], minlength=len(self.names))
+        return pd.Series(counts, index=pd.Index(self.names, name="Sprint"))
@@ -0,0 +1,104 @@
+"""Status categories compiled once per dataset."""
+
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from .column_resolver import header_key
+from .constants import STATUS_WORKFLOW, StatusCategory
+from .logger import logger
+
+CATEGORIES: List[StatusCategory] = list(StatusCategory)
+
+
+def categorize(
+    values: pd.Series, workflow: Optional[Mapping[str, StatusCategory]] = None
+) -> np.ndarray:
+    """Return the category position of each status in values.
+
+    Statuses are matched case and punctuation insensitively; statuses the
+    workflow does not list count as to-do.
+
+    Args:
+        values: Status of each issue
+        workflow: Optional mapping of status name to category
+
+    Returns:
+        Array of positions into ``CATEGORIES``, one per row
+    """
+    lookup = {
+        header_key(status): CATEGORIES.index(StatusCategory(category))
+        for status, category in (workflow or STATUS_WORKFLOW).items()
+    }
+    todo = CATEGORIES.index(StatusCategory.TODO)
+
+    codes, uniques = pd.factorize(values)
+    unknown = [str(s) for s in uniques if header_key(str(s)) not in lookup]
+    if unknown:
+        logger.warning(f"Statuses missing from workflow, treated as to-do: {unknown}")
+    table = np.array(
+        [lookup.get(header_key(str(s)), todo) for s in uniques] + [todo], np.int8
+    )
+    # Missing statuses factorize to -1, which picks the trailing to-do entry
+    return table[codes]
+
+
+@dataclass(frozen=True)
+class StatusIndex:
+    """Per-row workflow category with one boolean mask per category."""
+
+    codes: np.ndarray
+    masks: Dict[StatusCategory, np.ndarray]
+    statuses: Dict[StatusCategory, List[str]]
+
+    @classmethod
+    def build(
+        cls,
+        data: pd.DataFrame,
+        workflow: Optional[Mapping[str, StatusCategory]] = None,
+    ) -> "StatusIndex":
+        """Compile the status column of data into category masks.
+
+        Args:
+            data: Jira data with standardized column names
+            workflow: Optional mapping of status name to category
+
+        Returns:
+            Status index over the positional rows of data
+        """
+        if "Status" in data.columns:
+            values = data["Status"]
+        else:
+            values = pd.Series([None] * len(data), dtype=object)
+        codes = categorize(values, workflow)
+        codes.flags.writeable = False
+
+        masks, statuses = {}, {}
+        for position, category in enumerate(CATEGORIES):
+            mask = codes == position
+            mask.flags.writeable = False
+            masks[category] = mask
+            statuses[category] = sorted(
+                str(s) for s in pd.unique(values[mask].dropna())
+            )
+        return cls(codes=codes, masks=masks, statuses=statuses)
+
+    def mask(self, category: StatusCategory) -> np.ndarray:
+        """Return a read-only boolean mask of rows in category."""
+        return self.masks[StatusCategory(category)]
+
+    def where(self, *categories: StatusCategory) -> Dict[str, List[str]]:
+        """Return a cube filter selecting statuses in any of categories."""
+        return {
+            "Status": [
+                status
+                for category in categories
+                for status in self.statuses[StatusCategory(category)]
+            ]
+        }
+
+    def count(self, category: StatusCategory) -> int:
+        """Return number of rows in category."""
+        return int(self.mask(category).sum())
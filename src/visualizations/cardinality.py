@@ -0,0 +1,134 @@
+"""Bounds on figure size for programs with many assignees, epics or issues."""
+
+from typing import Optional, Tuple, Type, TypeVar, Union
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+# Bars per category axis before the long tail is summed into one bucket
+MAX_CATEGORIES = 30
+
+# Line traces per figure before the remaining series are summed
+MAX_TRACES = 10
+
+# Points per scatter trace beyond which WebGL rendering is used
+WEBGL_THRESHOLD = 1000
+
+# Rows of a heatmap before the long tail is summed into one row
+MAX_HEATMAP_ROWS = 50
+
+# Treemap nodes kept before deeper hierarchy levels are dropped
+MAX_TREEMAP_NODES = 5000
+
+Frame = TypeVar("Frame", pd.Series, pd.DataFrame)
+
+
+def other_label(count: int) -> str:
+    """Return the label of the bucket holding count bucketed categories."""
+    return f"Other ({count})"
+
+
+def top_categories(weights: pd.Series, limit: int) -> pd.Index:
+    """Return the labels of the limit - 1 heaviest categories.
+
+    Args:
+        weights: Weight of each category, indexed by label
+        limit: Number of categories shown, including the Other bucket
+
+    Returns:
+        Index of every label when there are at most limit categories
+    """
+    if len(weights) <= limit:
+        return weights.index
+    keep = np.argsort(-weights.to_numpy(dtype=float), kind="stable")[: limit - 1]
+    return weights.index[np.sort(keep)]
+
+
+def top_n(
+    values: Frame, limit: int = MAX_CATEGORIES, by: Optional[str] = None
+) -> Frame:
+    """Sum all but the heaviest categories of values into an Other bucket.
+
+    Kept categories stay in their original order, followed by the bucket.
+
+    Args:
+        values: Series or DataFrame indexed by category
+        limit: Number of categories returned, including the Other bucket
+        by: Column ranking the categories of a DataFrame, defaults to the
+            row totals
+
+    Returns:
+        values unchanged when there are at most limit categories
+    """
+    if len(values) <= limit:
+        return values
+    if isinstance(values, pd.Series):
+        weights = values
+    else:
+        weights = values[by] if by else values.sum(axis=1, numeric_only=True)
+
+    keep = top_categories(weights, limit)
+    rest = values.drop(index=keep)
+    label = other_label(len(rest))
+    if isinstance(values, pd.Series):
+        bucket = pd.Series([rest.sum()], index=[label], name=values.name)
+    else:
+        bucket = rest.sum(numeric_only=True).to_frame(label).T
+    result = pd.concat([values.loc[keep], bucket])
+    result.index = pd.Index([*keep.astype(str), label], name=values.index.name)
+    return result
+
+
+def scatter_type(points: int) -> Union[Type[go.Scatter], Type[go.Scattergl]]:
+    """Return the scatter trace type for a trace with the given point count."""
+    return go.Scattergl if points > WEBGL_THRESHOLD else go.Scatter
+
+
+def pivot_matrix(values: pd.Series) -> Tuple[np.ndarray, pd.Index, pd.Index]:
+    """Scatter a two-level Series into a dense matrix in one NumPy pass.
+
+    Args:
+        values: Series indexed by (column, row) pairs, in column order
+
+    Returns:
+        Zero-filled rows x columns matrix with its row and column labels
+    """
+    index = values.index.remove_unused_levels()
+    columns, rows = index.levels
+    column_codes, row_codes = index.codes
+    matrix = np.zeros((len(rows), len(columns)))
+    matrix[row_codes, column_codes] = values.to_numpy(dtype=float)
+    return matrix, rows, columns
+
+
+def series_trace(
+    matrix: np.ndarray, rows: pd.Index, columns: pd.Index, **kwargs
+) -> Union[go.Scatter, go.Scattergl]:
+    """Draw every row of matrix as a line segment of one scatter trace.
+
+    Rows are separated by a gap point so each reads as its own line; the
+    row label is shown on hover and sets the marker color.
+
+    Args:
+        matrix: Rows x columns values
+        rows: Label of each row
+        columns: Label of each column, used as x values
+        **kwargs: Extra trace properties
+
+    Returns:
+        One scatter trace, WebGL past ``WEBGL_THRESHOLD`` points
+    """
+    width = len(columns) + 1
+    gap = np.full((len(rows), 1), np.nan)
+    x = np.tile(np.append(np.asarray(columns, dtype=object), None), len(rows))
+    labels = np.repeat(np.asarray(rows, dtype=object), width)
+    return scatter_type(len(x))(
+        x=x,
+        y=np.hstack([matrix, gap]).ravel(),
+        text=labels,
+        mode="lines+markers",
+        marker=dict(color=np.repeat(np.arange(len(rows)), width)),
+        hovertemplate="%{text}<br>%{x}: %{y}<extra></extra>",
+        **kwargs,
+    )
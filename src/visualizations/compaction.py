@@ -0,0 +1,159 @@
+"""Compact figure payloads before they are sent to the browser."""
+
+import base64
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+
+# Largest relative error accepted when storing floats as float32
+FLOAT32_RTOL = 1e-6
+
+# Arrays shorter than this stay plain JSON lists
+MIN_ARRAY_LENGTH = 8
+
+# Trace attributes holding numeric data arrays that may be downcast
+NUMERIC_ATTRIBUTES = {
+    "x",
+    "y",
+    "z",
+    "r",
+    "values",
+    "base",
+    "width",
+    "color",
+    "colors",
+    "size",
+}
+
+# Trace types whose x may be replaced by date steps
+CARTESIAN_TRACES = {"bar", "scatter", "scattergl"}
+
+_MS_PER_NS = 1_000_000
+_FLOAT32_MAX = float(np.finfo(np.float32).max)
+
+
+def payload_size(figure: Union[go.Figure, Dict[str, Any]]) -> int:
+    """Return the size in bytes of the JSON sent for figure."""
+    return len(pio.to_json(figure, validate=False))
+
+
+def decode_typed_array(spec: Dict[str, Any]) -> Any:
+    """Turn a plotly.js typed array spec back into a NumPy array.
+
+    Args:
+        spec: Any dict; only ones holding ``dtype`` and ``bdata`` are decoded
+
+    Returns:
+        The decoded array, or spec unchanged
+    """
+    if "bdata" not in spec or "dtype" not in spec:
+        return spec
+    values = np.frombuffer(base64.b64decode(spec["bdata"]), dtype=spec["dtype"])
+    if "shape" in spec:
+        values = values.reshape([int(n) for n in spec["shape"].split(",")])
+    return values
+
+
+def _kind(values: Any) -> Optional[str]:
+    """Return the pandas inferred type of an array-like, None otherwise."""
+    if not isinstance(values, (list, tuple, np.ndarray)) or not len(values):
+        return None
+    if isinstance(values, np.ndarray) and values.dtype != object:
+        return pd.api.types.infer_dtype(values.ravel())
+    return pd.api.types.infer_dtype(np.asarray(values, dtype=object).ravel())
+
+
+def _downcast(values: Any) -> Any:
+    """Return a numeric array in the smallest type that keeps its values.
+
+    Integral floats become integers, which Plotly narrows further; other
+    floats become float32 when that is within ``FLOAT32_RTOL``.
+    """
+    if _kind(values) not in ("integer", "floating", "mixed-integer-float"):
+        return values
+    array = np.asarray(values, dtype=float)
+    if array.size < MIN_ARRAY_LENGTH:
+        return values
+    finite = array[np.isfinite(array)]
+    if not len(finite):
+        return array
+    if len(finite) == array.size and np.all(finite == np.round(finite)):
+        if np.abs(finite).max() < 2**31:
+            # Plotly narrows int64 to the smallest integer type that fits
+            return array.astype(np.int64)
+    if np.abs(finite).max() < _FLOAT32_MAX:
+        narrow = array.astype(np.float32)
+        if np.allclose(narrow, array, rtol=FLOAT32_RTOL, atol=0, equal_nan=True):
+            return narrow
+    return array
+
+
+def _compact_arrays(node: Dict[str, Any]) -> None:
+    """Downcast the numeric data arrays of a trace, in place."""
+    for key, value in node.items():
+        if isinstance(value, dict):
+            value = decode_typed_array(value)
+        if isinstance(value, dict):
+            _compact_arrays(value)
+        elif key in NUMERIC_ATTRIBUTES:
+            node[key] = _downcast(value)
+
+
+def _compact_dates(trace: Dict[str, Any], layout: Dict[str, Any]) -> None:
+    """Replace a regular date x array by its start and step, in place.
+
+    Irregular dates are shortened to day precision when they hold no time.
+    """
+    if trace.get("type", "scatter") not in CARTESIAN_TRACES:
+        return
+    if _kind(trace.get("x")) not in ("datetime64", "datetime", "date"):
+        return
+    dates = pd.DatetimeIndex(np.asarray(trace["x"], dtype="datetime64[ns]"))
+    if dates.hasnans:
+        return
+    steps = np.diff(dates.asi8)
+    if len(dates) >= MIN_ARRAY_LENGTH and np.all(steps == steps[0]) and steps[0]:
+        del trace["x"]
+        trace["x0"] = dates[0].isoformat()
+        trace["dx"] = int(steps[0] // _MS_PER_NS)
+        # The axis type cannot be inferred without the x array
+        axis = _axis_name(trace.get("xaxis", "x"))
+        layout.setdefault(axis, {})["type"] = "date"
+    elif (dates == dates.normalize()).all():
+        trace["x"] = np.datetime_as_string(dates.to_numpy(), unit="D").tolist()
+
+
+def _axis_name(axis_id: str) -> str:
+    """Return the layout key of an axis id such as x2."""
+    return f"{axis_id[0]}axis{axis_id[1:]}"
+
+
+def compact_figure(figure: go.Figure) -> go.Figure:
+    """Return a copy of figure that serializes to a smaller payload.
+
+    Regular date series become a start and step, numeric arrays are
+    downcast so Plotly sends them as small base64 typed arrays, and
+    template defaults for trace types the figure does not use are dropped.
+
+    Args:
+        figure: Figure to compact
+
+    Returns:
+        Compacted figure; the input figure is left unchanged
+    """
+    spec = figure.to_dict()
+    traces, layout = spec["data"], spec["layout"]
+    for trace in traces:
+        _compact_dates(trace, layout)
+        _compact_arrays(trace)
+
+    used = {trace.get("type", "scatter") for trace in traces}
+    template = layout.get("template", {})
+    if "data" in template:
+        template["data"] = {
+            kind: value for kind, value in template["data"].items() if kind in used
+        }
+    return go.Figure(spec, _validate=False)
@@ -0,0 +1,135 @@
+"""Shared cache of serialized figures keyed by dataset fingerprint."""
+
+import functools
+import inspect
+import json
+from typing import Any, Callable, Dict, Optional
+
+import plotly.graph_objects as go
+
+from src.utils.ingestion_cache import IngestionCache
+from src.utils.logger import logger
+
+from .compaction import compact_figure, decode_typed_array, payload_size
+
+FIGURE_CACHE_MAX_ENTRIES = 512
+FIGURE_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 64 MiB
+
+
+def figure_key(fingerprint: str, name: str, arguments: Dict[str, Any]) -> Optional[str]:
+    """Return the cache key of a chart, or None if its arguments are not plain.
+
+    Args:
+        fingerprint: Fingerprint of the dataset the chart is built from
+        name: Name of the chart method
+        arguments: Arguments of the call by parameter name, defaults included
+
+    Returns:
+        JSON key, or None when an argument such as a DataFrame cannot be
+        serialized and the chart must be built uncached
+    """
+    try:
+        return json.dumps([fingerprint, name, arguments], sort_keys=True)
+    except TypeError:
+        return None
+
+
+class FigureCache(IngestionCache):
+    """LRU cache of figure JSON bounded by a byte budget.
+
+    Figures are stored serialized, so every hit returns a fresh figure that
+    callers may update without touching the cached copy. With ``compact``
+    set, figures are compacted once when built and the payload sizes before
+    and after are counted.
+    """
+
+    label = "figure cache"
+
+    def __init__(
+        self,
+        max_entries: int = FIGURE_CACHE_MAX_ENTRIES,
+        max_bytes: Optional[int] = FIGURE_CACHE_MAX_BYTES,
+        compact: bool = False,
+    ):
+        """Initialize cache.
+
+        Args:
+            max_entries: Maximum number of cached figures
+            max_bytes: Ceiling on the summed size of cached figure JSON
+            compact: Whether to compact figures before they are served
+        """
+        super().__init__(max_entries=max_entries, max_bytes=max_bytes)
+        self.compact = compact
+        self.payload_before = 0
+        self.payload_after = 0
+
+    def build(self, build: Callable[[], go.Figure]) -> go.Figure:
+        """Build a figure, compacting it if enabled.
+
+        Args:
+            build: Callable creating the figure
+
+        Returns:
+            Freshly built figure
+        """
+        figure = build()
+        if not self.compact:
+            return figure
+        compacted = compact_figure(figure)
+        before, after = payload_size(figure), payload_size(compacted)
+        with self._lock:
+            self.payload_before += before
+            self.payload_after += after
+        logger.info(f"Compacted figure payload from {before:,} to {after:,} bytes")
+        return compacted
+
+    def figure(self, key: Optional[str], build: Callable[[], go.Figure]) -> go.Figure:
+        """Return the figure cached under key, building it on a miss.
+
+        Args:
+            key: Cache key from ``figure_key``, None to build uncached
+            build: Callable creating the figure
+
+        Returns:
+            Cached or freshly built figure
+        """
+        if key is None:
+            return self.build(build)
+        payload = self.get(key)
+        if payload is None:
+            figure = self.build(build)
+            payload = figure.to_json()
+            self.put(key, payload, len(payload))
+            return figure
+        # The payload was produced by a validated figure; skip validating it
+        return go.Figure(
+            json.loads(payload, object_hook=decode_typed_array), _validate=False
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache counters and payload bytes before and after compaction."""
+        stats = super().stats()
+        stats["payload_before"] = self.payload_before
+        stats["payload_after"] = self.payload_after
+        return stats
+
+
+def cached_figure(method: Callable[..., go.Figure]) -> Callable[..., go.Figure]:
+    """Serve a visualizer chart from its figure cache.
+
+    Charts are cached per method, arguments and dataset fingerprint, so
+    repeat views skip both the aggregation and the figure construction.
+    Arguments are bound by name with defaults applied, so equivalent calls
+    share one entry.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> go.Figure:
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(list(bound.arguments.items())[1:])
+        key = figure_key(self.dataset.fingerprint, method.__name__, arguments)
+        return self.figure_cache.figure(key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
@@ -1,39 +1,99 @@
 """Program visualization module."""
 
+from typing import Optional, Union
+
 import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+from src.utils.column_resolver import column_resolver
+from src.utils.constants import StatusCategory
+from src.utils.dataset import SharedDataset
+from src.utils.flow_events import FlowEvents
 from src.utils.logger import logger  # Import the centralized logger
+from src.utils.snapshot_store import SnapshotStore
+
+from .cardinality import (
+    MAX_HEATMAP_ROWS,
+    MAX_TRACES,
+    MAX_TREEMAP_NODES,
+    pivot_matrix,
+    scatter_type,
+    series_trace,
+    top_n,
+)
+from .figure_cache import FigureCache, cached_figure
 
 
 class Visualizer:
     """Create program visualizations."""
 
-    def __init__(self, data: pd.DataFrame):
-        """Initialize visualizer with data."""
+    def __init__(
+        self,
+        data: Union[pd.DataFrame, SharedDataset],
+        figure_cache: Optional[FigureCache] = None,
+        snapshots: Optional[SnapshotStore] = None,
+    ):
+        """Initialize visualizer with data.
+
+        Args:
+            data: Jira data or the shared dataset wrapping it
+            figure_cache: Optional cache shared with other visualizers
+            snapshots: Optional store of recorded exports of the same projects
+        """
         try:
-            self.data = data.copy()
-            # Standardize column names
-            self.data = self.data.rename(
-                columns={"Story_Points": "Story Points", "Issue_Key": "Issue Key"}
+            # Wrap the shared, standardized dataset without copying it
+            self.dataset = SharedDataset.wrap(data)
+            self.figure_cache = (
+                figure_cache if figure_cache is not None else FigureCache()
+            )
+            self.snapshots = snapshots
+            self.data = self.dataset.frame
+            self.story_points_col = column_resolver.find(
+                self.data.columns, "Story Points"
             )
             logger.info("Visualizer initialized successfully")
         except Exception as e:
             logger.error(f"Error initializing Visualizer: {str(e)}")
             raise
 
+    def _by_epic(self, epic_column: str) -> pd.DataFrame:
+        """Return issue count and story points per epic.
+
+        Epics beyond ``MAX_CATEGORIES`` are summed into one Other bucket.
+
+        Args:
+            epic_column: Column holding the epic of each issue
+
+        Returns:
+            DataFrame indexed by epic with count and points columns
+        """
+        return top_n(self._epic_totals(epic_column), by="points")
+
+    def _epic_totals(self, epic_column: str) -> pd.DataFrame:
+        """Return issue count and story points of every epic."""
+        cube = self.dataset.cube
+        if cube.has("Epic", epic_column):
+            return pd.DataFrame(
+                {
+                    "count": cube.rollup(["Epic"], "count"),
+                    "points": cube.rollup(["Epic"], "points"),
+                }
+            ).rename_axis(epic_column)
+        return (
+            pd.DataFrame(
+                {"count": 1, "points": self.dataset.points}, index=self.data.index
+            )
+            .groupby(self.data[epic_column], observed=True)[["count", "points"]]
+            .sum()
+        )
+
+    @cached_figure
     def create_velocity_chart(self) -> go.Figure:
         """Create sprint velocity chart."""
-        story_points_col = (
-            "Story Points" if "Story Points" in self.data.columns else "Story_Points"
-        )
-        velocity = (
-            self.data[self.data["Status"] == "Done"]
-            .groupby("Sprint")[story_points_col]
-            .sum()
+        velocity = self.dataset.cube.rollup(
+            ["Sprint"], "points", where=self.dataset.status.where(StatusCategory.DONE)
         )
         fig = go.Figure(
             data=[go.Bar(x=velocity.index, y=velocity.values.astype(float))]
@@ -41,22 +101,30 @@ class Visualizer:
         fig.update_layout(title="Sprint Velocity")
         return fig
 
+    @cached_figure
     def create_status_chart(self, data: pd.DataFrame = None) -> go.Figure:
         """Create status distribution chart."""
-        df = data if data is not None else self.data
-        status_counts = df["Status"].value_counts()
+        if data is not None:
+            status_counts = data["Status"].value_counts()
+        else:
+            status_counts = self.dataset.cube.rollup(["Status"]).sort_values(
+                ascending=False
+            )
         fig = go.Figure(
             data=[go.Pie(labels=status_counts.index, values=status_counts.values)]
         )
         fig.update_layout(title="Status Distribution")
         return fig
 
+    @cached_figure
     def create_sprint_velocity(self) -> go.Figure:
         """Create sprint velocity chart."""
         try:
-            # Group by Sprint and calculate velocity
+            # Roll story points up to sprints from the aggregate cube
             sprint_data = (
-                self.data.groupby("Sprint")["Story Points"].sum().reset_index()
+                self.dataset.cube.rollup(["Sprint"], "points")
+                .rename("Story Points")
+                .reset_index()
             )
 
             fig = go.Figure()
@@ -80,10 +148,13 @@ class Visualizer:
             logger.error(f"Error creating sprint velocity chart: {str(e)}")
             raise
 
+    @cached_figure
     def create_status_distribution(self) -> go.Figure:
         """Create status distribution chart."""
         try:
-            status_counts = self.data["Status"].value_counts()
+            status_counts = self.dataset.cube.rollup(["Status"]).sort_values(
+                ascending=False
+            )
 
             fig = go.Figure(
                 data=[
@@ -102,14 +173,20 @@ class Visualizer:
             logger.error(f"Error creating status distribution chart: {str(e)}")
             raise
 
+    @cached_figure
     def create_epic_progress(self, epic_column: str) -> go.Figure:
         """Create epic progress chart."""
         try:
-            epic_progress = (
-                self.data.groupby(epic_column)["Status"]
-                .value_counts()
-                .unstack(fill_value=0)
-            )
+            cube = self.dataset.cube
+            if cube.has("Epic", epic_column):
+                epic_progress = cube.pivot("Epic", "Status")
+            else:
+                epic_progress = (
+                    self.data.groupby(epic_column, observed=True)["Status"]
+                    .value_counts()
+                    .unstack(fill_value=0)
+                )
+            epic_progress = top_n(epic_progress)
 
             fig = go.Figure()
             for status in epic_progress.columns:
@@ -132,12 +209,11 @@ class Visualizer:
             logger.error(f"Error creating epic progress chart: {str(e)}")
             raise
 
+    @cached_figure
     def create_epic_status(self, epic_column: str) -> go.Figure:
         """Create epic status distribution chart."""
         try:
-            epic_status = self.data.groupby(epic_column)["Status"].agg(
-                ["count", "value_counts"]
-            )
+            epic_status = self._by_epic(epic_column)
 
             fig = go.Figure()
             fig.add_trace(
@@ -154,14 +230,13 @@ class Visualizer:
             logger.error(f"Error creating epic status chart: {str(e)}")
             raise
 
+    @cached_figure
     def create_team_workload(self) -> go.Figure:
         """Create team workload chart."""
         try:
-            workload = (
-                self.data.groupby("Assignee")["Story Points"]
-                .sum()
-                .sort_values(ascending=True)
-            )
+            workload = top_n(
+                self.dataset.cube.rollup(["Assignee"], "points")
+            ).sort_values(ascending=True)
 
             fig = go.Figure()
             fig.add_trace(go.Bar(x=workload.values, y=workload.index, orientation="h"))
@@ -170,35 +245,56 @@ class Visualizer:
                 title="Team Workload Distribution",
                 xaxis_title="Story Points",
                 yaxis_title="Team Member",
-                height=max(
-                    400, len(workload) * 30
-                ),  # Dynamic height based on team size
+                # Dynamic height based on team size, bounded by the bucketing
+                height=max(400, len(workload) * 30),
             )
             return fig
         except Exception as e:
             logger.error(f"Error creating team workload chart: {str(e)}")
             raise
 
-    def create_sprint_burndown(self) -> go.Figure:
-        """Create sprint burndown chart."""
+    @cached_figure
+    def create_sprint_burndown(self, selected_sprint=None) -> go.Figure:
+        """Create daily burndown of remaining story points.
+
+        Args:
+            selected_sprint: Sprint to burn down, defaults to the whole program
+
+        Returns:
+            go.Figure: Plotly figure of remaining points per day
+        """
         try:
-            sprint_data = (
-                self.data.groupby(["Sprint", "Status"])["Story Points"].sum().unstack()
-            )
+            events = self.dataset.events
+            if selected_sprint:
+                rows = self.dataset.filters.select({"Sprint": [selected_sprint]})
+                events = events.subset(rows)
+
+            daily = events.daily(weighted=True)
+            remaining = daily.drop(columns=StatusCategory.DONE.value).sum(axis=1)
 
             fig = go.Figure()
             fig.add_trace(
-                go.Scatter(
-                    x=sprint_data.index,
-                    y=sprint_data.sum(axis=1),
-                    mode="lines+markers",
-                    name="Total Points",
+                scatter_type(len(remaining))(
+                    x=remaining.index,
+                    y=remaining.values,
+                    mode="lines",
+                    name="Remaining Points",
                 )
             )
+            if len(remaining):
+                fig.add_trace(
+                    go.Scatter(
+                        x=[remaining.index[0], remaining.index[-1]],
+                        y=[remaining.iloc[0], 0],
+                        mode="lines",
+                        line=dict(dash="dash"),
+                        name="Ideal",
+                    )
+                )
 
             fig.update_layout(
                 title="Sprint Burndown Chart",
-                xaxis_title="Sprint",
+                xaxis_title="Date",
                 yaxis_title="Story Points",
             )
             return fig
@@ -206,47 +302,151 @@ class Visualizer:
             logger.error(f"Error creating sprint burndown chart: {str(e)}")
             raise
 
-    def create_team_velocity(self) -> go.Figure:
-        """Create team velocity chart."""
+    def snapshot_version(self) -> Optional[int]:
+        """Return the latest recorded snapshot, if at least two exist."""
+        if self.snapshots is None or self.snapshots.version < 2:
+            return None
+        return self.snapshots.version
+
+    def snapshot_events(self, version: int) -> FlowEvents:
+        """Return status events from the snapshots recorded up to version.
+
+        Snapshots are append-only, so events are read once per version.
+        """
+        return self.dataset.derived(
+            f"snapshot_events:{version}",
+            lambda frame: FlowEvents.from_history(
+                self.snapshots.history("Status", until=version),
+                self.snapshots.snapshots()["key"].iloc[-1],
+            ),
+        )
+
+    @cached_figure
+    def create_cumulative_flow(
+        self, weighted: bool = False, snapshot_version: Optional[int] = None
+    ) -> go.Figure:
+        """Create cumulative flow diagram of issues per workflow category.
+
+        Args:
+            weighted: Stack story points instead of issue counts
+            snapshot_version: Build from the snapshots recorded up to this
+                version instead of from issue dates
+
+        Returns:
+            go.Figure: Plotly stacked area chart per day
+        """
         try:
-            team_velocity = (
-                self.data[self.data["Status"] == "Done"]
-                .groupby(["Sprint", "Assignee"])["Story Points"]
-                .sum()
-                .reset_index()
+            events = (
+                self.dataset.events
+                if snapshot_version is None
+                else self.snapshot_events(snapshot_version)
             )
+            daily = events.daily(weighted=weighted)
 
-            fig = px.line(
-                team_velocity,
-                x="Sprint",
-                y="Story Points",
-                color="Assignee",
-                markers=True,
-                title="Team Velocity Over Time",
-            )
+            fig = go.Figure()
+            # Done at the bottom so the bands read in workflow order upwards
+            for category in (
+                StatusCategory.DONE,
+                StatusCategory.BLOCKED,
+                StatusCategory.IN_PROGRESS,
+                StatusCategory.TODO,
+            ):
+                fig.add_trace(
+                    go.Scatter(
+                        x=daily.index,
+                        y=daily[category.value].values,
+                        mode="lines",
+                        stackgroup="flow",
+                        name=category.value.replace("-", " ").title(),
+                    )
+                )
 
             fig.update_layout(
-                xaxis_title="Sprint", yaxis_title="Story Points", showlegend=True
+                title="Cumulative Flow Diagram",
+                xaxis_title="Date",
+                yaxis_title="Story Points" if weighted else "Issues",
             )
             return fig
+        except Exception as e:
+            logger.error(f"Error creating cumulative flow diagram: {str(e)}")
+            raise
+
+    @cached_figure
+    def create_team_velocity(self) -> go.Figure:
+        """Create team velocity chart.
+
+        Up to ``MAX_TRACES`` members are drawn as lines of a single trace;
+        larger teams get a member by sprint heatmap instead.
+
+        Returns:
+            go.Figure: Plotly figure of completed points per member and sprint
+        """
+        try:
+            matrix, assignees, sprints = pivot_matrix(
+                self.dataset.cube.rollup(
+                    ["Sprint", "Assignee"],
+                    "points",
+                    where=self.dataset.status.where(StatusCategory.DONE),
+                )
+            )
+
+            fig = go.Figure()
+            if len(assignees) <= MAX_TRACES:
+                fig.add_trace(
+                    series_trace(matrix, assignees, sprints, name="Story Points")
+                )
+                fig.update_layout(xaxis_title="Sprint", yaxis_title="Story Points")
+            else:
+                # Keep the busiest members and sum the rest into one row
+                heat = top_n(
+                    pd.DataFrame(matrix, index=assignees.astype(str)),
+                    MAX_HEATMAP_ROWS,
+                )
+                fig.add_trace(
+                    go.Heatmap(
+                        z=heat.to_numpy(),
+                        x=sprints,
+                        y=heat.index,
+                        colorscale="Blues",
+                        colorbar=dict(title="Story Points"),
+                    )
+                )
+                fig.update_layout(
+                    xaxis_title="Sprint",
+                    yaxis_title="Team Member",
+                    height=max(400, len(heat) * 15),
+                )
+
+            fig.update_layout(title="Team Velocity Over Time")
+            return fig
         except Exception as e:
             logger.error(f"Error creating team velocity chart: {str(e)}")
             raise
 
+    @cached_figure
     def create_defect_trend(self) -> go.Figure:
         """Create defect trend chart."""
         try:
             # Filter for bugs/defects
-            defects = self.data[
-                self.data["Issue Type"].str.lower().isin(["bug", "defect"])
-            ].copy()
+            cube = self.dataset.cube
+            if not cube.has("Issue Type"):
+                raise KeyError("Issue Type")
+            defect_types = [
+                issue_type
+                for issue_type in cube.cells["Issue Type"].dropna().unique()
+                if str(issue_type).lower() in ("bug", "defect")
+            ]
 
             # Group by Sprint
-            defect_counts = defects.groupby("Sprint").size().reset_index(name="Count")
+            defect_counts = (
+                cube.rollup(["Sprint"], where={"Issue Type": defect_types})
+                .rename("Count")
+                .reset_index()
+            )
 
             fig = go.Figure()
             fig.add_trace(
-                go.Scatter(
+                scatter_type(len(defect_counts))(
                     x=defect_counts["Sprint"],
                     y=defect_counts["Count"],
                     mode="lines+markers",
@@ -265,6 +465,7 @@ class Visualizer:
             logger.error(f"Error creating defect trend chart: {str(e)}")
             raise
 
+    @cached_figure
     def create_issue_type_distribution(self) -> go.Figure:
         """Create issue type distribution chart.
 
@@ -273,20 +474,15 @@ class Visualizer:
         """
         try:
             # Get the issue type column name (handle different possible names)
-            issue_type_col = next(
-                (
-                    col
-                    for col in self.data.columns
-                    if col.lower() in ["issue type", "issuetype", "type"]
-                ),
-                None,
-            )
+            issue_type_col = column_resolver.find(self.data.columns, "Issue Type")
 
             if not issue_type_col:
                 raise ValueError("Issue Type column not found in data")
 
             # Calculate issue type distribution
-            issue_type_counts = self.data[issue_type_col].value_counts()
+            issue_type_counts = self.dataset.cube.rollup(["Issue Type"]).sort_values(
+                ascending=False
+            )
 
             # Create donut chart
             fig = go.Figure(
@@ -316,28 +512,33 @@ class Visualizer:
             logger.error(f"Error creating issue type distribution chart: {str(e)}")
             raise
 
+    @cached_figure
     def create_workflow_by_epic(
-        self, selected_sprints=None, selected_epics=None
+        self, selected_sprints=None, selected_epics=None, selected_assignees=None
     ) -> go.Figure:
         """Create workflow breakdown by epic chart.
 
         Args:
             selected_sprints: List of selected sprints to filter by
             selected_epics: List of selected epics to filter by
+            selected_assignees: List of selected assignees to filter by
 
         Returns:
             go.Figure: Plotly figure showing workflow distribution by epic
         """
         try:
-            # Filter data based on selections
-            df = self.data.copy()
-            if selected_sprints:
-                df = df[df["Sprint"].isin(selected_sprints)]
-            if selected_epics:
-                df = df[df["Epic"].isin(selected_epics)]
+            # Resolve selections to row positions through the inverted index
+            filters = self.dataset.filters
+            rows = filters.select(
+                {
+                    "Sprint": selected_sprints,
+                    "Epic": selected_epics,
+                    "Assignee": selected_assignees,
+                }
+            )
 
             # Get epic and status counts
-            epic_status = df.groupby(["Epic", "Status"]).size().unstack(fill_value=0)
+            epic_status = top_n(filters.crosstab("Epic", "Status", rows))
 
             # Create stacked bar chart
             fig = go.Figure()
@@ -368,6 +569,7 @@ class Visualizer:
             logger.error(f"Error creating workflow by epic chart: {str(e)}")
             raise
 
+    @cached_figure
     def create_sprint_health(self, selected_sprint=None) -> go.Figure:
         """Create current sprint health chart.
 
@@ -379,13 +581,15 @@ class Visualizer:
         """
         try:
             # Filter for selected sprint
-            df = self.data.copy()
+            points = self.dataset.points
+            done = self.dataset.status.mask(StatusCategory.DONE)
             if selected_sprint:
-                df = df[df["Sprint"] == selected_sprint]
+                rows = self.dataset.filters.select({"Sprint": [selected_sprint]})
+                points, done = points[rows], done[rows]
 
             # Calculate metrics
-            total_points = df["Story Points"].sum()
-            completed_points = df[df["Status"] == "Done"]["Story Points"].sum()
+            total_points = points.sum()
+            completed_points = points[done].sum()
 
             # Create gauge chart
             fig = go.Figure(
@@ -424,11 +628,12 @@ class Visualizer:
             logger.error(f"Error creating sprint health chart: {str(e)}")
             raise
 
+    @cached_figure
     def create_epic_distribution(self, epic_column: str) -> go.Figure:
         """Create epic distribution chart."""
         epic_data = (
-            self.data.groupby(epic_column)
-            .agg({"Story Points": "sum", "Issue Key": "count"})
+            self._by_epic(epic_column)
+            .rename(columns={"points": "Story Points", "count": "Issue Key"})
             .reset_index()
         )
 
@@ -466,23 +671,22 @@ class Visualizer:
 
         return fig
 
+    @cached_figure
     def create_sprint_health_metrics(self) -> go.Figure:
         """Create sprint health metrics visualization."""
-        sprint_data = (
-            self.data.groupby("Sprint")
-            .agg({"Story Points": "sum", "Issue Key": "count"})
-            .reset_index()
-        )
-
-        # Calculate completion rate per sprint
-        sprint_completion = (
-            self.data[self.data["Status"].isin(["Done", "Closed"])]
-            .groupby("Sprint")
-            .size()
-            / self.data.groupby("Sprint").size()
-            * 100
-        )
-        sprint_data["Completion Rate"] = sprint_completion
+        cube = self.dataset.cube
+        issues = cube.rollup(["Sprint"])
+        completed = cube.rollup(
+            ["Sprint"], where=self.dataset.status.where(StatusCategory.DONE)
+        ).reindex(issues.index, fill_value=0)
+        sprint_data = pd.DataFrame(
+            {
+                "Story Points": cube.rollup(["Sprint"], "points"),
+                "Issue Key": issues,
+                # Calculate completion rate per sprint
+                "Completion Rate": completed / issues * 100,
+            }
+        ).reset_index()
 
         fig = make_subplots(
             rows=2,
@@ -505,7 +709,7 @@ class Visualizer:
 
         # Sprint completion line chart
         fig.add_trace(
-            go.Scatter(
+            scatter_type(len(sprint_data))(
                 name="Completion Rate",
                 x=sprint_data["Sprint"],
                 y=sprint_data["Completion Rate"],
@@ -527,16 +731,108 @@ class Visualizer:
 
         return fig
 
+    @cached_figure
     def create_epic_treemap(self, epic_column: str) -> go.Figure:
-        """Create a treemap visualization for epic distribution."""
-        # Group data by epic without validation
+        """Create a treemap of the epic, story and sub-task hierarchy.
+
+        Areas are story points rolled up each subtree and colors its
+        completion. Top-level issues that are not epics are grouped under
+        their epic_column value.
+        """
+        key_col = column_resolver.find(self.data.columns, "Issue Key")
+        if key_col is None or not self.data[key_col].is_unique:
+            return self._create_flat_epic_treemap(epic_column)
+
+        hierarchy = self.dataset.hierarchy
+        points = self.dataset.points
+        done = self.dataset.status.mask(StatusCategory.DONE)
+        totals = hierarchy.rollup(points)
+        completion = np.divide(
+            hierarchy.rollup(np.where(done, points, 0)) * 100,
+            totals,
+            out=np.zeros_like(totals),
+            where=totals > 0,
+        )
+
+        keys = self.data[key_col].astype(str).to_numpy()
+        epics = np.where(
+            self.data[epic_column].isna(), "No Epic", self.data[epic_column].astype(str)
+        )
+        parent = hierarchy.parent
+        type_col = column_resolver.find(self.data.columns, "Issue Type")
+        is_epic = (parent < 0) & (
+            self.data[type_col].astype(str).str.lower().eq("epic").to_numpy()
+            if type_col
+            else np.zeros(len(keys), bool)
+        )
+        orphan = (parent < 0) & ~is_epic
+
+        # Group orphaned top-level issues under one node per epic value
+        groups = (
+            pd.DataFrame(
+                {"points": totals[orphan], "done": (completion * totals)[orphan]},
+                index=epics[orphan],
+            )
+            .groupby(level=0)
+            .sum()
+        )
+        group_ids = "epic:" + groups.index.to_numpy(dtype=str)
+
+        parents = np.where(parent >= 0, keys[np.maximum(parent, 0)], "")
+        parents = np.where(orphan, "epic:" + epics, parents)
+
+        # Drop the deepest levels until the node count fits the budget;
+        # totals are already rolled up, so kept areas stay exact
+        nodes = len(groups) + np.cumsum([len(rows) for rows in hierarchy.levels])
+        depth = int(np.searchsorted(nodes, MAX_TREEMAP_NODES, side="right"))
+        if depth == 0:
+            return self._create_flat_epic_treemap(epic_column)
+        shown = np.sort(np.concatenate(hierarchy.levels[:depth]))
+        keys, epics, parents = keys[shown], epics[shown], parents[shown]
+        is_epic, totals, completion = is_epic[shown], totals[shown], completion[shown]
+
+        fig = go.Figure(
+            go.Treemap(
+                ids=np.concatenate([group_ids, keys]),
+                labels=np.concatenate(
+                    [groups.index.to_numpy(dtype=str), np.where(is_epic, epics, keys)]
+                ),
+                parents=np.concatenate([np.full(len(groups), ""), parents]),
+                values=np.concatenate([groups["points"].to_numpy(), totals]),
+                branchvalues="total",
+                marker=dict(
+                    colors=np.concatenate(
+                        [
+                            np.divide(
+                                groups["done"].to_numpy(),
+                                groups["points"].to_numpy(),
+                                out=np.zeros(len(groups)),
+                                where=groups["points"].to_numpy() > 0,
+                            ),
+                            completion,
+                        ]
+                    ),
+                    colorscale="RdYlGn",
+                    cmin=0,
+                    cmax=100,
+                    colorbar=dict(title="Done %"),
+                ),
+                textinfo="label+value",
+            )
+        )
+
+        fig.update_layout(title="Epic Distribution", width=800, height=500)
+
+        return fig
+
+    def _create_flat_epic_treemap(self, epic_column: str) -> go.Figure:
+        """Create a one-level treemap of story points per epic."""
         epic_data = (
-            self.data.groupby(epic_column)
-            .agg({"Story Points": "sum", "Issue Key": "count"})
+            self._by_epic(epic_column)
+            .rename(columns={"points": "Story Points", "count": "Issue Key"})
             .reset_index()
         )
 
-        # Create treemap
         fig = go.Figure(
             go.Treemap(
                 labels=epic_data[epic_column],
@@ -550,19 +846,23 @@ class Visualizer:
 
         return fig
 
+    @cached_figure
     def create_sprint_health_radar(self) -> go.Figure:
         """Create a radar chart showing sprint health metrics."""
         # Calculate basic metrics without validation
+        cube = self.dataset.cube
+        done = self.dataset.status.where(StatusCategory.DONE)
+        total_issues, total_points = cube.total("count"), cube.total("points")
         metrics = {
             "Completion Rate": (
-                self.data[self.data["Status"] == "Done"].shape[0]
-                / self.data.shape[0]
-                * 100
+                cube.total("count", where=done) / total_issues * 100
+                if total_issues
+                else 0
             ),
             "Story Point Progress": (
-                self.data[self.data["Status"] == "Done"]["Story Points"].sum()
-                / self.data["Story Points"].sum()
-                * 100
+                cube.total("points", where=done) / total_points * 100
+                if total_points
+                else 0
             ),
             "Sprint Predictability": 90,  # Simplified metric
             "Quality Rate": 95,  # Simplified metric
@@ -0,0 +1,67 @@
+"""Test large-cardinality chart bounds."""
+
+import pandas as pd
+import plotly.graph_objects as go
+
+from src.visualizations.cardinality import (
+    MAX_CATEGORIES,
+    MAX_HEATMAP_ROWS,
+    WEBGL_THRESHOLD,
+    scatter_type,
+    top_n,
+)
+from src.visualizations.program_charts import Visualizer
+
+
+def test_top_n_buckets_long_tail_into_other():
+    """Test all but the heaviest categories are summed, in original order."""
+    points = pd.Series([5, 1, 7, 3, 2], index=list("abcde"), name="points")
+    bucketed = top_n(points, limit=3)
+
+    assert bucketed.to_dict() == {"a": 5, "c": 7, "Other (3)": 6}
+    assert top_n(points, limit=5) is points
+    assert scatter_type(WEBGL_THRESHOLD + 1) is go.Scattergl
+    assert scatter_type(WEBGL_THRESHOLD) is go.Scatter
+
+
+def test_charts_stay_bounded_for_large_teams():
+    """Test per-assignee charts cap bars and traces whatever the team size."""
+    size = 200
+    data = pd.DataFrame(
+        {
+            "Assignee": [f"user{i}" for i in range(size)],
+            "Sprint": ["Sprint 1", "Sprint 2"] * (size // 2),
+            "Status": ["Closed"] * size,
+            "Story Points": range(size),
+            "Epic": [f"Epic {i}" for i in range(size)],
+        }
+    )
+    visualizer = Visualizer(data)
+
+    workload = visualizer.create_team_workload()
+    assert len(workload.data[0].y) == MAX_CATEGORIES
+    assert workload.data[0].y[-1] == f"Other ({size - MAX_CATEGORIES + 1})"
+    assert sum(workload.data[0].x) == sum(range(size))
+    velocity = visualizer.create_team_velocity()
+    assert [trace.type for trace in velocity.data] == ["heatmap"]
+    assert len(velocity.data[0].y) == MAX_HEATMAP_ROWS
+    assert len(visualizer.create_epic_status("Epic").data[0].x) == MAX_CATEGORIES
+
+
+def test_small_team_velocity_is_one_trace():
+    """Test each member is one gap-separated segment of a single trace."""
+    data = pd.DataFrame(
+        {
+            "Assignee": ["Ann", "Ann", "Bob", "Bob", "Bob"],
+            "Sprint": ["Sprint 1", "Sprint 2", "Sprint 1", "Sprint 2", "Sprint 2"],
+            "Status": ["Closed", "Closed", "Closed", "Closed", "Open"],
+            "Story Points": [1, 2, 3, 4, 5],
+        }
+    )
+    velocity = Visualizer(data).create_team_velocity()
+
+    assert len(velocity.data) == 1
+    trace = velocity.data[0]
+    assert list(trace.x) == ["Sprint 1", "Sprint 2", None] * 2
+    assert list(trace.y[[0, 1, 3, 4]]) == [1, 2, 3, 4]
+    assert list(trace.text[[0, 3]]) == ["Ann", "Bob"]
@@ -0,0 +1,33 @@
+"""Test column alias resolver."""
+
+import pandas as pd
+
+from src.utils.column_resolver import ColumnResolver
+
+
+def test_standardize_maps_aliases_once():
+    """Test raw headers are renamed and the mapping is cached."""
+    resolver = ColumnResolver()
+    data = pd.DataFrame(columns=["Issue key", "story_points", " Status", "Sprint"])
+
+    standardized = resolver.standardize(data)
+
+    assert list(standardized.columns) == [
+        "Issue Key",
+        "Story Points",
+        "Status",
+        "Sprint",
+    ]
+    assert resolver.standardize(standardized) is standardized
+    assert len(resolver._renames) == 2
+
+
+def test_exact_canonical_wins_over_alias():
+    """Test an exact canonical header is preferred to an alias."""
+    resolver = ColumnResolver()
+    columns = ["Points", "Story Points", "Epic Link"]
+
+    assert resolver.renames(columns) == {}
+    assert resolver.find(columns, "Story Points") == "Story Points"
+    assert resolver.find(columns, "Epic", "Epic Link") == "Epic Link"
+    assert resolver.missing(columns, ["Status", "Story Points"]) == ["Status"]
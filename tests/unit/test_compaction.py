@@ -0,0 +1,53 @@
+"""Test compact figure payloads."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from src.visualizations.compaction import (
+    compact_figure,
+    decode_typed_array,
+    payload_size,
+)
+from src.visualizations.figure_cache import FigureCache
+from src.visualizations.program_charts import Visualizer
+
+
+def test_compact_figure_shrinks_arrays_dates_and_labels():
+    """Test dates become steps and numbers are downcast."""
+    days = pd.date_range("2024-01-01", periods=30, freq="D")
+    labels = ["Open", "Closed", "Blocked"] * 10
+    figure = go.Figure(
+        [
+            go.Scatter(x=days, y=np.arange(30, dtype=float)),
+            go.Scatter(x=days, y=np.linspace(0, 1, 30, dtype=np.float32)),
+            go.Bar(x=labels, y=np.ones(30), xaxis="x2", yaxis="y2"),
+        ]
+    )
+    compacted = compact_figure(figure)
+    traces = json.loads(
+        pio.to_json(compacted, validate=False), object_hook=decode_typed_array
+    )["data"]
+
+    assert "x" not in traces[0]
+    assert traces[0]["x0"].startswith("2024-01-01")
+    assert traces[0]["dx"] == 24 * 60 * 60 * 1000
+    assert traces[0]["y"].dtype.kind in "iu"
+    assert traces[1]["y"].dtype == np.float32
+    # Category labels stay as they are, so hover keeps showing them
+    assert traces[2]["x"] == labels
+    assert traces[2]["y"].dtype.kind in "iu"
+    assert payload_size(compacted) < payload_size(figure)
+
+
+def test_compacting_cache_counts_payload_bytes(sample_data: pd.DataFrame):
+    """Test a compacting cache reports smaller payloads that still validate."""
+    cache = FigureCache(compact=True)
+    figure = Visualizer(sample_data, figure_cache=cache).create_sprint_burndown()
+
+    stats = cache.stats()
+    assert 0 < stats["payload_after"] < stats["payload_before"]
+    go.Figure(json.loads(pio.to_json(figure, validate=False)))
@@ -0,0 +1,32 @@
+"""Test aggregate cube engine."""
+
+import pandas as pd
+
+from src.utils.dataset import SharedDataset
+
+
+def test_rollups_match_groupby(sample_data):
+    """Test cube rollups agree with a groupby over the raw rows."""
+    cube = SharedDataset(sample_data).cube
+
+    assert cube.total() == len(sample_data)
+    assert cube.total("points") == sample_data["Story_Points"].sum()
+    expected = sample_data.groupby("Status")["Story_Points"].sum()
+    assert cube.rollup(["Status"], "points").to_dict() == expected.to_dict()
+
+
+def test_pivot_filters_and_fills_missing_cells():
+    """Test pivot applies where filters and zero fills empty cells."""
+    data = pd.DataFrame(
+        {
+            "Issue Key": ["A-1", "A-2", "A-3"],
+            "Status": ["Done", "To Do", "Done"],
+            "Epic": ["E1", "E1", "E2"],
+            "Story Points": [3, 5, None],
+        }
+    )
+    cube = SharedDataset(data).cube
+
+    table = cube.pivot("Epic", "Status", "points")
+    assert table.loc["E2", "To Do"] == 0
+    assert cube.total("points", where={"Status": ["Done"], "Epic": ["E1"]}) == 3
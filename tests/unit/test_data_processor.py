@@ -4,6 +4,7 @@ import pandas as pd
 import pytest
 
 from src.utils.data_processor import DataProcessor, process_sprint_data
+from src.utils.dates import date_formats
 
 
 def test_process_sprint_data():
@@ -13,3 +14,92 @@ def test_process_sprint_data():
     assert isinstance(result, dict)
     assert "data" in result
     assert isinstance(result["data"], pd.DataFrame)
+
+
+def test_stream_csv_matches_full_read(test_data_path):
+    """Test chunked streaming yields the same rows and aggregates."""
+    processor = DataProcessor()
+    progress = []
+    data, aggregates = processor.stream_csv(
+        str(test_data_path),
+        chunksize=1,
+        progress_callback=lambda f, r: progress.append(r),
+    )
+
+    full = pd.read_csv(test_data_path)
+    assert len(data) == len(full)
+    assert aggregates.row_count == len(full)
+    assert aggregates.total_points == full["Story Points"].sum()
+    assert aggregates.status_counts["Done"] == 1
+    assert aggregates.done_points_by_sprint["Sprint 1"] == 3
+    assert progress == [1, 2]
+
+
+def test_stream_csv_without_rows(test_data_path):
+    """Test aggregate-only streaming keeps no rows."""
+    processor = DataProcessor()
+    data, aggregates = processor.stream_csv(
+        str(test_data_path), chunksize=1, retain_rows=False
+    )
+
+    assert data is None
+    assert aggregates.points_by_sprint["Sprint 1"] == 8
+    assert processor.aggregates is aggregates
+
+
+def test_apply_delta_upserts_by_issue_key(test_data_path):
+    """Test delta rows are inserted, updated or left unchanged by key."""
+    processor = DataProcessor()
+    original = processor.process_csv(str(test_data_path))
+    delta = pd.DataFrame(
+        {
+            "Issue Key": ["TEST-1", "TEST-2", "TEST-3"],
+            "Story Points": [3, 8, 2],
+            "Status": ["Done", "Done", "To Do"],
+            "Sprint": ["Sprint 1", "Sprint 1", "Sprint 2"],
+            "Created": ["2024-01-01", "2024-01-02", "2024-01-03"],
+            "Summary": ["Test 1", "Test 2", "Test 3"],
+        }
+    )
+
+    stats = processor.apply_delta(delta)
+
+    assert stats == {"inserted": 1, "updated": 1, "unchanged": 1}
+    assert len(processor.data) == 3
+    assert processor.data.loc[1, "Status"] == "Done"
+    assert processor.data.loc[2, "Sprint"] == "Sprint 2"
+    assert isinstance(processor.data["Sprint"].dtype, pd.CategoricalDtype)
+    assert original.loc[1, "Status"] == "In Progress"
+
+    partial = delta.drop(columns="Summary").assign(**{"Story Points": [13, 8, 2]})
+    assert processor.apply_delta(partial)["updated"] == 1
+    assert processor.data.loc[0, "Story Points"] == 13
+    assert processor.data.loc[0, "Summary"] == original.loc[0, "Summary"]
+
+    # Overlapping exports repeat keys; the last row holding a key is updated
+    overlapping = DataProcessor()
+    overlapping.data = pd.concat([original, original], ignore_index=True)
+    stats = overlapping.apply_delta(partial)
+    assert stats == {"inserted": 1, "updated": 2, "unchanged": 0}
+    assert overlapping.data["Story Points"].tolist()[:3] == [3, 5, 13]
+    assert original.loc[0, "Story Points"] == 3
+
+
+def test_process_directory_combines_exports(tmp_path, test_data):
+    """Test exports with differing headers are merged by project."""
+    test_data.assign(**{"Issue Key": ["ALPHA-1", "ALPHA-2"]}).to_csv(
+        tmp_path / "alpha.csv", index=False
+    )
+    test_data.rename(columns={"Story Points": "story_points"}).assign(
+        **{"Issue Key": ["BETA-1", "BETA-2"]}
+    ).to_csv(tmp_path / "beta.csv", index=False)
+
+    processor = DataProcessor()
+    data = processor.process_directory(tmp_path, max_workers=2)
+
+    assert len(data) == 4
+    assert data["Story Points"].sum() == 16
+    assert list(data["Project Key"].unique()) == ["ALPHA", "BETA"]
+    assert pd.api.types.is_datetime64_any_dtype(data["Created"])
+    # Formats inferred in the workers are cached in this process
+    assert date_formats(str(tmp_path / "beta.csv")) == {"created": "%Y-%m-%d"}
@@ -0,0 +1,31 @@
+"""Test shared dataset."""
+
+import numpy as np
+
+from src.metrics.metrics_calculator import MetricsCalculator
+from src.utils.dataset import SharedDataset
+from src.visualizations.program_charts import Visualizer
+
+
+def test_calculator_and_visualizer_share_memory(test_data):
+    """Test both consumers wrap the same buffers without copying."""
+    dataset = SharedDataset(test_data)
+    calculator = MetricsCalculator(dataset)
+    visualizer = Visualizer(dataset)
+
+    assert calculator.dataset is visualizer.dataset
+    assert np.shares_memory(
+        calculator.data["Story Points"].to_numpy(),
+        visualizer.data["Story Points"].to_numpy(),
+    )
+
+
+def test_writes_do_not_reach_shared_frame(test_data):
+    """Test a session's writes stay local to its view."""
+    dataset = SharedDataset(test_data)
+    session = dataset.view()
+    session.loc[0, "Status"] = "Blocked"
+
+    assert dataset.view().loc[0, "Status"] == "Done"
+    assert test_data.loc[0, "Status"] == "Done"
+    assert dataset.derived("rows", len) == len(test_data)
@@ -0,0 +1,59 @@
+"""Test shared dataset registry."""
+
+import gc
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.utils.dataset_registry import DatasetRegistry
+
+
+def test_sessions_share_one_dataset():
+    """Test identical fingerprints lease the same loaded value."""
+    registry = DatasetRegistry(max_entries=4)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {"rows": 10}
+
+    first = registry.acquire("abc", loader)
+    second = registry.acquire("abc", loader)
+
+    assert first.value is second.value
+    assert len(calls) == 1
+    assert registry.refcount("abc") == 2
+
+    del first
+    gc.collect()
+    assert registry.refcount("abc") == 1
+
+    def slow_loader():
+        calls.append(1)
+        time.sleep(0.1)
+        return {"rows": 20}
+
+    # Sessions opening the same export at once wait for a single parse
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        leases = list(
+            pool.map(lambda _: registry.acquire("new", slow_loader), range(5))
+        )
+    assert len(calls) == 2
+    assert all(lease.value is leases[0].value for lease in leases)
+
+
+def test_only_unreferenced_datasets_are_evicted():
+    """Test eviction skips datasets that sessions still reference."""
+    registry = DatasetRegistry(max_entries=4, max_bytes=10)
+    held = registry.acquire("a", lambda: "A", sizeof=lambda _: 6)
+    released = registry.acquire("b", lambda: "B", sizeof=lambda _: 6)
+
+    assert len(registry) == 2
+
+    del released
+    gc.collect()
+    latest = registry.acquire("c", lambda: "C", sizeof=lambda _: 1)
+
+    assert registry.get("a") == "A"
+    assert registry.get("b") is None
+    assert registry.stats()["referenced"] == 2
+    assert {held.key, latest.key} == {"a", "c"}
@@ -0,0 +1,35 @@
+"""Test date normalization."""
+
+import pandas as pd
+
+from src.utils import dates
+from src.utils.dates import infer_date_format, normalize_dates, parse_date_column
+
+
+def test_parse_day_first_dates():
+    """Test day-first export dates parse to datetime64."""
+    values = pd.Series(["7/02/2024", "27/11/2024", None, "7/02/2024"])
+    parsed = parse_date_column(values)
+
+    assert infer_date_format(values) == "%d/%m/%Y"
+    assert pd.api.types.is_datetime64_any_dtype(parsed)
+    assert parsed[0] == pd.Timestamp("2024-02-07")
+    assert parsed[1] == pd.Timestamp("2024-11-27")
+    assert pd.isna(parsed[2])
+
+
+def test_normalize_dates_caches_format_per_source(test_data):
+    """Test the inferred format is cached per source and column."""
+    normalized = normalize_dates(test_data, source="unit-test.csv")
+
+    assert pd.api.types.is_datetime64_any_dtype(normalized["Created"])
+    assert dates._format_cache[("unit-test.csv", "created")] == "%Y-%m-%d"
+    assert test_data["Created"].dtype != normalized["Created"].dtype
+
+    # A re-upload under the same name in another format is inferred again
+    day_first = test_data.assign(Created=["07/02/2024", "27/11/2024"])
+    reparsed = normalize_dates(day_first, source="unit-test.csv")
+    assert reparsed["Created"].tolist() == [
+        pd.Timestamp("2024-02-07"),
+        pd.Timestamp("2024-11-27"),
+    ]
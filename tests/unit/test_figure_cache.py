@@ -0,0 +1,38 @@
+"""Test shared figure cache."""
+
+import pandas as pd
+
+from src.utils.dataset import SharedDataset
+from src.visualizations.figure_cache import FigureCache
+from src.visualizations.program_charts import Visualizer
+
+
+def test_figures_shared_across_visualizers(sample_data: pd.DataFrame) -> None:
+    """Test a repeat view of the same dataset is served from the cache."""
+    cache = FigureCache()
+    first = Visualizer(SharedDataset(sample_data), figure_cache=cache)
+    second = Visualizer(SharedDataset(sample_data), figure_cache=cache)
+
+    built = first.create_status_distribution()
+    built.update_layout(title="Changed by caller")
+    served = second.create_status_distribution()
+
+    assert cache.stats()["hits"] == 1
+    assert served.layout.title.text == "Status Distribution"
+    assert list(served.data[0].values) == list(built.data[0].values)
+
+    # DataFrame arguments bypass the cache
+    second.create_status_chart(sample_data)
+    assert cache.stats()["misses"] == 1
+
+
+def test_figure_cache_evicts_under_byte_budget(sample_data: pd.DataFrame) -> None:
+    """Test least recently used figures are evicted past the byte budget."""
+    cache = FigureCache(max_bytes=1)
+    visualizer = Visualizer(sample_data, figure_cache=cache)
+
+    visualizer.create_status_distribution()
+    visualizer.create_sprint_velocity()
+
+    assert len(cache) == 1
+    assert cache.stats()["evictions"] == 1
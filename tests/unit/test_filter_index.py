@@ -0,0 +1,34 @@
+"""Test inverted-index filter engine."""
+
+import pandas as pd
+
+from src.utils.dataset import SharedDataset
+
+
+def _data() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Issue Key": ["A-1", "A-2", "A-3", "A-4"],
+            "Status": ["Done", "To Do", "Done", "In Progress"],
+            "Epic": ["E1", "E1", "E2", None],
+            "Assignee": ["ann", "bob", "ann", "ann"],
+            "Sprint": ["Sprint 1", "Sprint 1, Sprint 2", "Sprint 2", None],
+        }
+    )
+
+
+def test_select_intersects_selections():
+    """Test selections match the equivalent boolean filters."""
+    filters = SharedDataset(_data()).filters
+
+    assert list(filters.select({"Sprint": ["Sprint 2"], "Assignee": ["ann"]})) == [2]
+    assert list(filters.select({"Epic": ["E1", "missing"]})) == [0, 1]
+    assert list(filters.select({"Epic": None, "Sprint": []})) == [0, 1, 2, 3]
+
+
+def test_crosstab_counts_selected_rows():
+    """Test crosstab matches a groupby over the selected rows."""
+    filters = SharedDataset(_data()).filters
+    table = filters.crosstab("Epic", "Status", filters.select({"Assignee": ["ann"]}))
+
+    assert table.to_dict() == {"Done": {"E1": 1, "E2": 1}}
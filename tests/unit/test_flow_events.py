@@ -0,0 +1,73 @@
+"""Test status transition events and daily flow series."""
+
+import pandas as pd
+
+from src.utils.flow_events import FlowEvents
+from src.utils.snapshot_store import SnapshotStore
+from src.visualizations.program_charts import Visualizer
+
+
+def _program() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Issue key": ["P-1", "P-2", "P-3"],
+            "Status": ["Closed", "In Dev", "Open"],
+            "Story Points": [3, 2, 5],
+            "Sprint": ["Sprint 1", "Sprint 1", "Sprint 2"],
+            "Created": ["01/01/2024", "01/01/2024", "02/01/2024"],
+            "Resolved": ["03/01/2024", None, None],
+        }
+    )
+
+
+def test_daily_burndown_and_cumulative_flow_from_dates():
+    """Test done issues move from to-do to done on their resolution date."""
+    visualizer = Visualizer(_program())
+    daily = visualizer.dataset.events.daily(weighted=True)
+
+    assert list(daily.index.day) == [1, 2, 3]
+    assert list(daily["done"]) == [0, 0, 3]
+    assert list(daily["to-do"]) == [3, 8, 5]
+    assert list(daily["in-progress"]) == [2, 2, 2]
+
+    burndown = visualizer.create_sprint_burndown("Sprint 1")
+    assert list(burndown.data[0].y) == [5, 5, 2]
+    assert len(visualizer.create_cumulative_flow().data) == 4
+
+    # A done issue due in 2030 does not stretch the series into the future
+    future = (
+        _program()
+        .drop(columns="Resolved")
+        .assign(
+            Status=["Closed", "In Dev", "Closed"],
+            **{"Due Date": [None, None, "01/01/2030"]},
+        )
+    )
+    assert Visualizer(future).dataset.events.daily().index[-1].year == 2024
+
+
+def test_events_from_snapshot_history(tmp_path):
+    """Test snapshots yield transitions, including issues leaving the export."""
+    store = SnapshotStore(tmp_path)
+    store.record(
+        pd.DataFrame({"Issue Key": ["A", "B"], "Status": ["Open", "In Dev"]}),
+        "2024-01-01",
+    )
+    store.record(
+        pd.DataFrame({"Issue Key": ["A", "B"], "Status": ["In Dev", "Closed"]}),
+        "2024-01-02",
+    )
+    store.record(pd.DataFrame({"Issue Key": ["B"], "Status": ["Closed"]}), "2024-01-03")
+
+    daily = FlowEvents.from_history(store.history("Status"), "Issue Key").daily()
+    assert list(daily["to-do"]) == [1, 0, 0]
+    assert list(daily["in-progress"]) == [1, 1, 0]
+    assert list(daily["done"]) == [0, 1, 1]
+
+    # The chart is keyed by snapshot version, so reruns hit the figure cache
+    visualizer = Visualizer(_program(), snapshots=store)
+    assert visualizer.snapshot_version() == 3
+    flow = visualizer.create_cumulative_flow(snapshot_version=3)
+    visualizer.create_cumulative_flow(snapshot_version=3)
+    assert list(flow.data[0].y) == [0, 1, 1]
+    assert visualizer.figure_cache.stats()["hits"] == 1
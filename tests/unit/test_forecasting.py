@@ -0,0 +1,32 @@
+"""Test Monte Carlo delivery forecasting."""
+
+import pandas as pd
+
+from src.metrics.forecasting import forecast_completion
+from src.metrics.metrics_calculator import MetricsCalculator
+
+
+def test_constant_velocity_forecast_is_exact():
+    """Test a constant history forecasts ceil(remaining / velocity)."""
+    remaining = pd.Series([0.0, 5.0, 10.0, 25.0, 5000.0], index=list("abcde"))
+    forecast = forecast_completion([10.0], remaining, trials=100, max_sprints=50)
+
+    assert forecast["P50"].tolist() == [0, 1, 1, 3, float("inf")]
+    assert (forecast["P50"] <= forecast["P95"]).all()
+
+
+def test_epic_forecast_from_calculator():
+    """Test per-epic forecasts use open points and sprint velocity."""
+    data = pd.DataFrame(
+        {
+            "Issue Key": ["A-1", "A-2", "A-3", "A-4"],
+            "Status": ["Done", "Done", "To Do", "In Progress"],
+            "Sprint": ["Sprint 1", "Sprint 2", None, None],
+            "Epic": ["E1", "E1", "E1", "E2"],
+            "Story Points": [5, 5, 10, 3],
+        }
+    )
+    forecast = MetricsCalculator(data).get_epic_forecast()
+
+    assert forecast.loc["E1"].tolist() == [2, 2, 2]
+    assert forecast.loc["E2"].tolist() == [1, 1, 1]
@@ -0,0 +1,45 @@
+"""Test epic and parent hierarchy index."""
+
+import numpy as np
+import pandas as pd
+
+from src.metrics.metrics_calculator import MetricsCalculator
+from src.utils.hierarchy import IssueHierarchy
+
+
+def _program() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Issue key": ["P-1", "P-2", "P-3", "P-4", "P-5"],
+            "Issue id": [10, 20, 30, 40, 50],
+            "Parent Story": [None, None, 20.0, 20.0, None],
+            "Epic Issue Key": ["P-1", "P-1", "P-1", "P-1", "No-EPIC"],
+            "Epic": ["Epic A", "Epic A", "Epic A", "Epic A", "No-EPIC"],
+            "Issue Type": ["Epic", "Story", "Sub Task", "Sub Task", "Story"],
+            "Status": ["In Progress", "In Progress", "Done", "To Do", "Done"],
+            "Story Points": [1, 2, 3, 4, 5],
+        }
+    )
+
+
+def test_parent_links_and_bottom_up_rollup():
+    """Test sub-tasks link to stories, stories to epics, totals roll up."""
+    hierarchy = IssueHierarchy.build(_program())
+
+    assert list(hierarchy.parent) == [-1, 0, 1, 1, -1]
+    assert list(hierarchy.children(1)) == [2, 3]
+    assert [list(level) for level in hierarchy.levels] == [[0, 4], [1], [2, 3]]
+    totals = hierarchy.rollup(np.array([1.0, 2.0, 3.0, 4.0, 5.0]))
+    assert list(totals) == [10.0, 9.0, 3.0, 4.0, 5.0]
+
+
+def test_epic_rollup_and_cycle_safety():
+    """Test epic completion rolls up and parent cycles do not hang."""
+    rollup = MetricsCalculator(_program()).get_epic_rollup()
+    assert rollup.loc["Epic A", "Done Points"] == 3
+    assert rollup.loc["No-EPIC", "Completion"] == 1
+
+    cycle = pd.DataFrame(
+        {"Issue Key": ["C-1", "C-2"], "Epic Issue Key": ["C-2", "C-1"]}
+    )
+    assert list(IssueHierarchy.build(cycle).parent) == [-1, -1]
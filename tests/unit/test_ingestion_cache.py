@@ -0,0 +1,35 @@
+"""Test ingestion cache."""
+
+from src.utils.ingestion_cache import IngestionCache, fingerprint_bytes
+
+
+def test_repeat_upload_hits_cache():
+    """Test identical bytes are parsed once."""
+    cache = IngestionCache(max_entries=2)
+    calls = []
+
+    def loader(payload):
+        calls.append(payload)
+        return {"rows": payload.count(b"\n")}
+
+    first = cache.get_or_load(b"a,b\n1,2\n", loader)
+    second = cache.get_or_load(b"a,b\n1,2\n", loader)
+
+    assert first is second
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    """Test least recently used entries are evicted when bounds are exceeded."""
+    cache = IngestionCache(max_entries=2, max_bytes=10)
+    cache.put("a", 1, nbytes=4)
+    cache.put("b", 2, nbytes=4)
+    cache.get("a")
+    cache.put("c", 3, nbytes=4)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+    assert fingerprint_bytes(b"x") == fingerprint_bytes(b"x")
@@ -26,3 +26,60 @@ def test_sprint_velocity(test_data):
     assert isinstance(velocity, pd.Series)
     assert not velocity.empty
     assert all(v >= 0 for v in velocity)
+
+
+def test_metrics_memoized_until_data_replaced(test_data):
+    """Test repeated calls hit the memo and replacing data invalidates it."""
+    calculator = MetricsCalculator(test_data)
+    calculator.get_sprint_metrics()
+    misses = calculator.memo_stats()["misses"]
+    calculator.get_sprint_metrics()
+    calculator.get_basic_metrics()
+    assert calculator.memo_stats()["misses"] == misses
+    assert calculator.memo_stats()["hits"] >= 2
+
+    # Keyword and default arguments share the positional call's entry
+    weekly = calculator.get_throughput()
+    assert calculator.get_throughput(freq="W") is weekly
+    assert calculator.get_throughput("W") is weekly
+    assert calculator.get_throughput(freq="MS") is not weekly
+
+    calculator.set_data(test_data.iloc[:1])
+    metrics = calculator.get_basic_metrics()
+    assert metrics["total_stories"] == 1
+    assert calculator.memo_stats()["entries"] == 1
+
+
+def test_flow_metrics_from_resolution_dates():
+    """Test lead time, throughput and aging use vectorized date arithmetic."""
+    data = pd.DataFrame(
+        {
+            "Issue Key": ["A-1", "A-2", "A-3", "A-4"],
+            "Status": ["Done", "Done", "In Progress", "Done"],
+            "Assignee": ["ann", "bob", "ann", "bob"],
+            "Created": ["2024-01-01", "2024-01-03", "2024-01-02", "2024-01-01"],
+            "Resolved": ["2024-01-05", "2024-01-10", None, None],
+            "Due Date": [None, None, "2024-12-31", "2030-01-01"],
+        }
+    )
+    calculator = MetricsCalculator(data)
+    flow = calculator.get_flow_metrics()
+
+    assert flow["lead_time_p50"] == 5.5
+    assert flow["wip_count"] == 1 and flow["wip_age_p85"] == 8.0
+    assert calculator.get_throughput().tolist() == [1, 1]
+    # A future due date is no completion
+    assert pd.isna(calculator.get_flow_times().loc[3, "Lead Time"])
+    by_assignee = calculator.get_flow_percentiles("Assignee")
+    assert by_assignee.loc["bob", "Lead Time P95"] == 7.0
+
+
+def test_compute_all_plans_shared_intermediates_once(test_data):
+    """Test a batch computes each node once and returns requested metrics."""
+    calculator = MetricsCalculator(test_data)
+    bundle = calculator.compute_all(["sprint_metrics", "epic_forecast"])
+
+    assert set(bundle) == {"sprint_metrics", "epic_forecast"}
+    assert calculator.memo_stats()["misses"] == calculator.memo_stats()["entries"]
+    with pytest.raises(ValueError):
+        calculator.compute_all(["unknown_metric"])
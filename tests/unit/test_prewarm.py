@@ -0,0 +1,49 @@
+"""Test background pre-warming of caches."""
+
+import pandas as pd
+
+from src.metrics.metrics_calculator import MetricsCalculator
+from src.utils.dataset import SharedDataset
+from src.utils.prewarm import Prewarmer
+from src.visualizations.figure_cache import FigureCache
+from src.visualizations.program_charts import Visualizer
+
+
+def test_prewarmer_runs_every_task_and_records_failures():
+    """Test all tasks run in the background and failures do not stop others."""
+    ran = []
+
+    def fail():
+        raise ValueError("broken chart")
+
+    prewarmer = Prewarmer(
+        {"a": lambda: ran.append("a"), "b": fail, "c": lambda: ran.append("c")},
+        max_workers=2,
+    ).start()
+
+    assert prewarmer.wait(timeout=5)
+    assert sorted(ran) == ["a", "c"]
+    assert prewarmer.progress() == 1.0
+    assert prewarmer.errors == {"b": "broken chart"}
+    assert Prewarmer({}).finished
+
+
+def test_prewarmed_charts_and_metrics_are_cache_hits(sample_data: pd.DataFrame):
+    """Test page calls after pre-warming are served from the caches."""
+    dataset = SharedDataset(sample_data)
+    calculator = MetricsCalculator(dataset)
+    visualizer = Visualizer(dataset, figure_cache=FigureCache())
+
+    Prewarmer(
+        {
+            "metrics": lambda: calculator.compute_all(["basic_metrics"]),
+            "burndown": visualizer.create_sprint_burndown,
+        }
+    ).start().wait(timeout=5)
+
+    misses = calculator.memo_stats()["misses"]
+    calculator.compute_all(["basic_metrics"])
+    visualizer.create_sprint_burndown(None)
+
+    assert calculator.memo_stats()["misses"] == misses
+    assert visualizer.figure_cache.stats()["hits"] == 1
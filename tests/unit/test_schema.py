@@ -0,0 +1,36 @@
+"""Test dtype schema."""
+
+import io
+
+import pandas as pd
+
+from src.utils.data_processor import DataProcessor
+from src.utils.schema import apply_schema
+
+
+def test_apply_schema_converts_dtypes(test_data):
+    """Test Jira columns are converted to compact dtypes."""
+    data, report = apply_schema(test_data)
+
+    assert isinstance(data["Status"].dtype, pd.CategoricalDtype)
+    assert isinstance(data["Sprint"].dtype, pd.CategoricalDtype)
+    assert str(data["Story Points"].dtype) == "Float32"
+    assert pd.api.types.is_datetime64_any_dtype(data["Created"])
+    assert set(report["column"]) == {"Status", "Sprint", "Story Points", "Created"}
+    assert test_data["Status"].dtype != data["Status"].dtype
+
+    # Chunks converted one at a time stay categorical once concatenated
+    chunked, chunk_report = DataProcessor.read_compact(
+        io.StringIO(test_data.to_csv(index=False)), chunksize=1
+    )
+    assert list(chunked["Status"].cat.categories) == ["In Progress", "Done"]
+    assert chunked["Status"].tolist() == test_data["Status"].tolist()
+    assert chunk_report.set_index("column").loc["Status", "dtype"] == "category"
+
+
+def test_status_categories_follow_status_type():
+    """Test known statuses are ordered as in StatusType."""
+    data, _ = apply_schema(pd.DataFrame({"Status": ["Done", "Backlog", "To Do", None]}))
+
+    assert list(data["Status"].cat.categories) == ["To Do", "Done", "Backlog"]
+    assert data["Status"].isna().sum() == 1
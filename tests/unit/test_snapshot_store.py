@@ -0,0 +1,49 @@
+"""Test snapshot history store."""
+
+import pandas as pd
+
+from src.utils.snapshot_store import SnapshotStore, snapshot_namespace
+
+
+def _export(status_a: str, points_b: float, keys=("A-1", "A-2", "A-3")):
+    return pd.DataFrame(
+        {
+            "Issue Key": list(keys),
+            "Status": [status_a, "To Do", "Done"][: len(keys)],
+            "Story Points": [1.0, points_b, 3.0][: len(keys)],
+        }
+    )
+
+
+def test_snapshots_store_only_changed_rows(tmp_path):
+    """Test each snapshot writes only what changed and rebuilds exactly."""
+    store = SnapshotStore(tmp_path)
+    store.record(_export("To Do", 2.0), pd.Timestamp("2024-01-01"))
+    stats = store.record(
+        _export("Done", 2.0, ("A-1", "A-2")), pd.Timestamp("2024-01-02")
+    )
+    unchanged = store.record(_export("Done", 2.0, ("A-1", "A-2")), "2024-01-03")
+
+    assert stats == {"added": 0, "changed": 1, "removed": 1}
+    assert unchanged == {"added": 0, "changed": 0, "removed": 0}
+    assert not (tmp_path / "changes-000003.parquet").exists()
+    rebuilt = store.reconstruct("2024-01-01 12:00")
+    assert rebuilt["Issue Key"].tolist() == ["A-1", "A-2", "A-3"]
+    assert store.reconstruct("2024-01-05")["Status"].tolist() == ["Done", "To Do"]
+
+
+def test_changes_between_dates(tmp_path):
+    """Test changes lists added, removed and modified issues with fields."""
+    store = SnapshotStore(tmp_path)
+    store.record(_export("To Do", 2.0, ("A-1", "A-2")), "2024-01-01")
+    store.record(_export("To Do", 8.0, ("A-1", "A-2", "A-3")), "2024-01-02")
+
+    changes = store.changes("2024-01-01", "2024-01-02").set_index("Issue Key")
+    assert changes.loc["A-3", "Change"] == "added"
+    assert changes.loc["A-2", "Fields"] == "Story Points"
+    assert "A-1" not in changes.index
+
+    # Snapshots of other projects are kept apart from these
+    assert snapshot_namespace(_export("To Do", 2.0)) == "A"
+    other = pd.DataFrame({"Project Key": ["BETA", "ALPHA"], "Issue Key": ["1", "2"]})
+    assert snapshot_namespace(other) == "ALPHA-BETA"
@@ -0,0 +1,35 @@
+"""Test sprint membership index."""
+
+import numpy as np
+import pandas as pd
+
+from src.metrics.metrics_calculator import MetricsCalculator
+from src.utils.sprint_index import SprintIndex
+
+
+def test_sprints_sort_by_number_and_explode_carry_over():
+    """Test natural ordering and multi-sprint membership."""
+    data = pd.DataFrame(
+        {
+            "Sprint": ["Sprint 12", "Sprint 2, Sprint 12", None, "Sprint 2"],
+            "Story Points": [1, 2, 3, 4],
+        }
+    )
+    index = SprintIndex.build(data)
+
+    assert index.names == ["Sprint 2", "Sprint 12"]
+    assert list(index.ordinals) == [2, 12]
+    assert list(index.rows("Sprint 12")) == [0, 1]
+    assert list(index.rows("Sprint 2")) == [1, 3]
+    assert list(index.current) == [1, 1, -1, 0]
+    assert list(index.unassigned) == [2]
+    assert list(index.sum_by_sprint(np.array([1.0, 2.0, 3.0, 4.0]))) == [4.0, 3.0]
+
+
+def test_velocity_uses_sprint_index(sample_data):
+    """Test velocity matches a groupby over the current sprint."""
+    velocity = MetricsCalculator(sample_data).get_sprint_velocity()
+    done = sample_data[sample_data["Status"] == "Done"]
+
+    expected = done.groupby("Sprint")["Story_Points"].sum()
+    assert velocity.to_dict() == expected.astype(float).to_dict()
@@ -0,0 +1,33 @@
+"""Test status category index."""
+
+import pandas as pd
+
+from src.utils.constants import StatusCategory
+from src.utils.dataset import SharedDataset
+from src.utils.status_index import StatusIndex
+
+
+def test_workflow_maps_statuses_to_category_masks():
+    """Test known, custom-cased and unknown statuses get categories."""
+    data = pd.DataFrame(
+        {"Status": ["Done", "closed", "Epic in Progress", "Backlog", "Mystery", None]}
+    )
+    index = StatusIndex.build(data)
+
+    assert list(index.mask(StatusCategory.DONE)) == [1, 1, 0, 0, 0, 0]
+    assert index.count(StatusCategory.IN_PROGRESS) == 1
+    assert index.count(StatusCategory.TODO) == 3
+    assert index.where(StatusCategory.DONE) == {"Status": ["Done", "closed"]}
+
+
+def test_custom_workflow_and_shared_masks(sample_data):
+    """Test a custom workflow and that masks are cached per dataset."""
+    index = StatusIndex.build(
+        sample_data, {"Done": StatusCategory.BLOCKED, "To Do": StatusCategory.TODO}
+    )
+    assert index.count(StatusCategory.DONE) == 0
+
+    dataset = SharedDataset(sample_data)
+    assert dataset.status is dataset.status
+    done = (sample_data["Status"] == "Done").to_numpy()
+    assert (dataset.status.mask(StatusCategory.DONE) == done).all()